@@ -0,0 +1,72 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from .runner import compare, load_results, run_benchmark, save_results
+from .suite import iter_benchmarks
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+
+    """Runs the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    argv : Optional[List[str]]
+        Command line arguments, read from sys.argv if None.
+
+    Returns
+    -------
+    int
+        Exit status, 1 if any benchmark regressed against the baseline.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m pyswallow.benchmarks',
+        description='Measures the throughput and memory use of PySwallow.'
+    )
+    parser.add_argument('-o', '--output', default='benchmarks.json',
+                        help='path of the JSON file to write results to')
+    parser.add_argument('-b', '--baseline',
+                        help='JSON results to compare against')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='fractional slowdown regarded as a regression')
+    parser.add_argument('-m', '--memory-threshold', type=float, default=None,
+                        help='fractional growth in peak memory regarded as a '
+                             'regression')
+    parser.add_argument('-k', '--filter', default='',
+                        help='only run benchmarks whose name contains this')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of timed runs of each benchmark')
+    parser.add_argument('-q', '--quick', action='store_true',
+                        help='run one small configuration of each benchmark')
+
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, setup, params in iter_benchmarks(args.filter, args.quick):
+        result = run_benchmark(name, setup, params, repeat=args.repeat)
+        results.append(result)
+
+        print(f'{result.key:<70} {result.seconds:10.4f}s '
+              f'{result.evaluations_per_second:14.1f}/s '
+              f'{result.peak_memory / 2 ** 20:9.2f}MiB')
+
+    save_results(results, args.output)
+
+    if args.baseline is None:
+        return 0
+
+    regressions = compare(results, load_results(args.baseline),
+                          args.threshold, args.memory_threshold)
+
+    for regression in regressions:
+        print(f'REGRESSION {regression.key} {regression.metric}: '
+              f'{regression.baseline:.4g} -> {regression.current:.4g} '
+              f'({regression.ratio:.2f}x)')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
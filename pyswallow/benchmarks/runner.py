@@ -0,0 +1,189 @@
+import json
+import platform
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+Workload = Callable[[], int]
+
+
+class BenchmarkResult(NamedTuple):
+
+    """Timing and memory usage of one benchmark configuration."""
+
+    name: str
+    params: Dict[str, float]
+    seconds: float
+    evaluations_per_second: float
+    peak_memory: int
+
+    @property
+    def key(self) -> str:
+        params = ','.join(f'{k}={v}' for k, v in sorted(self.params.items()))
+        return f'{self.name}[{params}]'
+
+
+class Regression(NamedTuple):
+
+    """Benchmark which has slowed down, or grown, relative to a baseline."""
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def run_benchmark(name: str,
+                  setup: Callable[..., Workload],
+                  params: Dict[str, float],
+                  repeat: int = 3,
+                  seed: int = 0) -> BenchmarkResult:
+
+    """Times a workload, keeping the fastest of several runs.
+
+    Peak memory is measured with tracemalloc in a separate run, so that
+    tracing does not distort the timings.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark.
+    setup : Callable[..., Workload]
+        Called with params to build the workload. The workload runs the
+        code being measured and returns the number of evaluations, or
+        operations, it performed.
+    params : Dict[str, float]
+        Configuration of the benchmark.
+    repeat : int
+        Number of timed runs.
+    seed : int
+        Seed for the global random number generator, set before each run
+        so that every run performs the same work.
+
+    Returns
+    -------
+    BenchmarkResult
+        Timing and memory usage of the benchmark.
+    """
+
+    seconds = float('inf')
+    n_evaluations = 0
+
+    for _ in range(repeat):
+        np.random.seed(seed)
+        workload = setup(**params)
+
+        t_start = time.perf_counter()
+        n_evaluations = workload()
+        seconds = min(seconds, time.perf_counter() - t_start)
+
+    np.random.seed(seed)
+    workload = setup(**params)
+
+    tracemalloc.start()
+    try:
+        workload()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(name, dict(params), seconds,
+                           n_evaluations / seconds if seconds else 0.0,
+                           peak_memory)
+
+
+def save_results(results: List[BenchmarkResult], path: str) -> None:
+
+    """Writes results, along with the environment, to a JSON file.
+
+    Parameters
+    ----------
+    results : List[BenchmarkResult]
+        Results to write.
+    path : str
+        Path of the JSON file.
+    """
+
+    report = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'results': [result._asdict() for result in results]
+    }
+
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+
+    """Reads results written by save_results().
+
+    Parameters
+    ----------
+    path : str
+        Path of the JSON file.
+
+    Returns
+    -------
+    List[BenchmarkResult]
+        Results held in the file.
+    """
+
+    with open(path, 'r') as f:
+        report = json.load(f)
+
+    return [BenchmarkResult(**result) for result in report['results']]
+
+
+def compare(results: List[BenchmarkResult],
+            baseline: List[BenchmarkResult],
+            threshold: float = 0.1,
+            memory_threshold: Optional[float] = None) -> List[Regression]:
+
+    """Finds benchmarks which have regressed relative to a baseline.
+
+    Parameters
+    ----------
+    results : List[BenchmarkResult]
+        Current results.
+    baseline : List[BenchmarkResult]
+        Results to compare against, benchmarks missing from either are
+        ignored.
+    threshold : float
+        Fractional increase in time regarded as a regression.
+    memory_threshold : Optional[float]
+        Fractional increase in peak memory regarded as a regression, memory
+        is not compared if None.
+
+    Returns
+    -------
+    List[Regression]
+        Benchmarks which exceeded the thresholds.
+    """
+
+    reference = {result.key: result for result in baseline}
+    regressions = []
+
+    for result in results:
+        base = reference.get(result.key)
+
+        if base is None:
+            continue
+
+        if result.seconds > base.seconds * (1.0 + threshold):
+            regressions.append(Regression(result.key, 'seconds',
+                                          base.seconds, result.seconds))
+
+        if (memory_threshold is not None
+                and result.peak_memory > base.peak_memory * (1.0 + memory_threshold)):
+            regressions.append(Regression(result.key, 'peak_memory',
+                                          base.peak_memory, result.peak_memory))
+
+    return regressions
@@ -0,0 +1,215 @@
+import itertools
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from .runner import Workload
+from ..handlers.archive import Archive
+from ..handlers.boundary_handler import NearestBH, PeriodicBH, RandomBH, ReflectiveBH
+from ..handlers.velocity_handler import ClampedVH
+from ..opt.mopso import MOSwarm
+from ..opt.sopso import Swarm
+from ..swallows.mo_swallow import MOSwallow
+
+
+class CostlySphere:
+
+    def __init__(self, cost: float = 0.0) -> None:
+
+        """Costly Sphere Class.
+
+        Sphere function which busy-waits to emulate an objective taking cost
+        seconds, picklable so that it can be sent to worker processes.
+
+        Parameters
+        ----------
+        cost : float
+            Number of seconds each evaluation takes.
+        """
+
+        self.cost = cost
+
+    def __call__(self, position: np.ndarray) -> float:
+        if self.cost:
+            t_end = time.perf_counter() + self.cost
+            while time.perf_counter() < t_end:
+                pass
+
+        return float(np.sum(np.square(position)))
+
+
+class CostlySphereSwallow(CostlySphere):
+
+    """CostlySphere which evaluates a swallow, as required by MPSwarm."""
+
+    def __call__(self, swallow):
+        swallow.fitness = super().__call__(swallow.position)
+        return swallow
+
+
+def _bounds(n_dimensions: int) -> dict:
+    return {f'x{i}': [-5.0, 5.0] for i in range(n_dimensions)}
+
+
+def swarm_iteration(n_swallows: int,
+                    n_dimensions: int,
+                    cost: float,
+                    n_iterations: int = 10) -> Workload:
+
+    swarm = Swarm(_bounds(n_dimensions), n_swallows, n_iterations)
+    fn = CostlySphere(cost)
+
+    def workload() -> int:
+        swarm.optimise(fn)
+        return swarm.n_evaluations
+
+    return workload
+
+
+def moswarm_iteration(n_swallows: int,
+                      n_dimensions: int,
+                      cost: float,
+                      n_iterations: int = 10) -> Workload:
+
+    swarm = MOSwarm(_bounds(n_dimensions), n_swallows, n_iterations)
+    fns = [CostlySphere(cost), lambda x: float(np.sum(np.square(x - 2.0)))]
+
+    def workload() -> int:
+        swarm.optimise(fns)
+        return swarm.n_evaluations
+
+    return workload
+
+
+def mpswarm_iteration(n_swallows: int,
+                      n_dimensions: int,
+                      cost: float,
+                      cores: int = 2,
+                      n_iterations: int = 10) -> Workload:
+
+    from ..mp.mp_swarm import MPSwarm
+
+    swarm = MPSwarm(_bounds(n_dimensions), n_swallows, n_iterations, cores)
+    fn = CostlySphereSwallow(cost)
+
+    def workload() -> int:
+        try:
+            swarm.optimise(fn)
+        finally:
+            swarm.pool.close()
+            swarm.pool.join()
+
+        return swarm.n_evaluations
+
+    return workload
+
+
+def archive_maintenance(archive_size: int, n_objectives: int = 2) -> Workload:
+
+    bounds = _bounds(2)
+
+    members = []
+    for _ in range(archive_size):
+        swallow = MOSwallow(bounds, n_objectives)
+        swallow.fitness = list(np.random.uniform(size=n_objectives))
+        members.append(swallow)
+
+    def workload() -> int:
+        archive = Archive(n_objectives)
+        archive.population = list(members)
+
+        archive.pareto_front()
+        archive.assign_sparsity()
+
+        return archive_size
+
+    return workload
+
+
+def handlers(n_dimensions: int,
+             n_calls: int = 10_000,
+             batch_size: int = 1) -> Workload:
+
+    lb = np.full(n_dimensions, -1.0)
+    ub = np.full(n_dimensions, 1.0)
+
+    instances = [NearestBH(lb, ub), ReflectiveBH(lb, ub), PeriodicBH(lb, ub),
+                 RandomBH(lb, ub), ClampedVH(lb, ub)]
+
+    # the vectors are split into (batch_size, d) batches, as passed by
+    # update_population(), or passed one at a time when batch_size is 1
+    n_batches = max(n_calls // batch_size, 1)
+    values = np.random.uniform(-2.0, 2.0, size=(n_batches, batch_size, n_dimensions))
+    if batch_size == 1:
+        values = values[:, 0]
+
+    def workload() -> int:
+        for handler in instances:
+            for value in values:
+                handler(value.copy())
+
+        return len(instances) * n_batches * batch_size
+
+    return workload
+
+
+def _sweep(**params: List[float]) -> List[Dict[str, float]]:
+    return [dict(zip(params, values))
+            for values in itertools.product(*params.values())]
+
+
+BENCHMARKS: Dict[str, Tuple[Callable[..., Workload], List[Dict[str, float]]]] = {
+    'swarm_iteration': (swarm_iteration, _sweep(
+        n_swallows=[10, 100], n_dimensions=[2, 30], cost=[0.0, 1e-4]
+    )),
+    'moswarm_iteration': (moswarm_iteration, _sweep(
+        n_swallows=[10, 100], n_dimensions=[2, 30], cost=[0.0]
+    )),
+    'mpswarm_iteration': (mpswarm_iteration, _sweep(
+        n_swallows=[20], n_dimensions=[2], cost=[0.0, 1e-3]
+    )),
+    'archive_maintenance': (archive_maintenance, _sweep(
+        archive_size=[100, 1000]
+    )),
+    'handlers': (handlers, _sweep(
+        n_dimensions=[10, 1000], batch_size=[1, 100]
+    )),
+}
+
+QUICK: Dict[str, List[Dict[str, float]]] = {
+    'swarm_iteration': [dict(n_swallows=10, n_dimensions=2, cost=0.0)],
+    'moswarm_iteration': [dict(n_swallows=10, n_dimensions=2, cost=0.0)],
+    'archive_maintenance': [dict(archive_size=100)],
+    'handlers': [dict(n_dimensions=10, n_calls=1000)],
+}
+
+
+def iter_benchmarks(pattern: str = '',
+                    quick: bool = False) -> Iterator[Tuple[str, Callable[..., Workload], Dict[str, float]]]:
+
+    """Lists the benchmark configurations to run.
+
+    Parameters
+    ----------
+    pattern : str
+        Only benchmarks whose name contains pattern are listed.
+    quick : bool
+        If True, a single small configuration of each benchmark is listed,
+        and multiprocessing benchmarks are skipped.
+
+    Yields
+    ------
+    Tuple[str, Callable[..., Workload], Dict[str, float]]
+        Name, setup function and parameters of each configuration.
+    """
+
+    for name, (setup, sweep) in BENCHMARKS.items():
+        if pattern not in name:
+            continue
+
+        if quick:
+            sweep = QUICK.get(name, [])
+
+        for params in sweep:
+            yield name, setup, params
@@ -1,11 +1,18 @@
 import abc
-from typing import Any, NoReturn
+from types import SimpleNamespace
+from typing import Any, NoReturn, Optional, Sequence
+
+import numpy as np
 
 from ..swallows.base_swallow import BaseSwallow
 
 
 class BaseConstraint(abc.ABC):
 
+    # set to True by constraints overriding constrain_batch() with a
+    # vectorised check, which the ConstraintManager then prefers
+    batched = False
+
     @abc.abstractmethod
     def constrain(self, *args: Any) -> NoReturn:
 
@@ -24,6 +31,13 @@ class BaseConstraint(abc.ABC):
 
         raise NotImplementedError('BaseConstraint::constrained()')
 
+    def _constrain_each(self, swallows: Sequence[Any]) -> np.ndarray:
+
+        """Checks constrain() for each swallow in turn."""
+
+        return np.fromiter((self.constrain(s) for s in swallows),
+                           dtype=bool, count=len(swallows))
+
 
 class PositionConstraint(BaseConstraint):
 
@@ -45,6 +59,35 @@ class PositionConstraint(BaseConstraint):
 
         raise NotImplementedError('PositionConstraint::constrain()')
 
+    def constrain_batch(self,
+                        positions: np.ndarray,
+                        swallows: Optional[Sequence[BaseSwallow]] = None) -> np.ndarray:
+
+        """Determines which positions of a population satisfy constraints.
+
+        Vectorised counterpart to constrain(), used by the ConstraintManager
+        in preference to it when batched is True. By default constrain() is
+        checked for each swallow in turn.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of the population, shape (n_swallows, n_dimensions).
+        swallows : Optional[Sequence[BaseSwallow]]
+            Swallows holding the positions. If None, constrain() receives
+            each position wrapped in an object exposing only .position.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, True where the position satisfies the constraint.
+        """
+
+        if swallows is None:
+            swallows = [SimpleNamespace(position=p) for p in positions]
+
+        return self._constrain_each(swallows)
+
 
 class FitnessConstraint(BaseConstraint):
 
@@ -65,3 +108,33 @@ class FitnessConstraint(BaseConstraint):
         """
 
         raise NotImplementedError('FitnessConstraint::constrain()')
+
+    def constrain_batch(self,
+                        fitness: np.ndarray,
+                        swallows: Optional[Sequence[BaseSwallow]] = None) -> np.ndarray:
+
+        """Determines which fitness values of a population satisfy constraints.
+
+        Vectorised counterpart to constrain(), used by the ConstraintManager
+        in preference to it when batched is True. By default constrain() is
+        checked for each swallow in turn.
+
+        Parameters
+        ----------
+        fitness : np.ndarray
+            Fitness of the population, shape (n_swallows,) for a single
+            objective or (n_swallows, n_objectives) otherwise.
+        swallows : Optional[Sequence[BaseSwallow]]
+            Swallows holding the fitness. If None, constrain() receives each
+            fitness wrapped in an object exposing only .fitness.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, True where the fitness satisfies the constraint.
+        """
+
+        if swallows is None:
+            swallows = [SimpleNamespace(fitness=f) for f in fitness]
+
+        return self._constrain_each(swallows)
@@ -1,8 +1,90 @@
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
 from .base_constraints import BaseConstraint, PositionConstraint, FitnessConstraint
 from ..opt.base_swarm import BaseSwarm
 from ..swallows.base_swallow import BaseSwallow
 
 
+class ConstraintStatistics:
+
+    def __init__(self, name: str, cost_hint: Optional[float] = None) -> None:
+
+        """Constraint Statistics Class.
+
+        Records the runtime cost and rejection rate of a constraint.
+
+        Parameters
+        ----------
+        name : str
+            Name of the constraint.
+        cost_hint : Optional[float]
+            Expected cost in seconds of checking one swallow, used until the
+            constraint has been measured.
+        """
+
+        self.name = name
+        self.cost_hint = cost_hint
+
+        self.n_checked = 0
+        self.n_rejected = 0
+        self.t_elapsed = 0.0
+
+    @property
+    def mean_cost(self) -> float:
+
+        """Mean cost in seconds of checking one swallow."""
+
+        if self.n_checked == 0:
+            return self.cost_hint or 0.0
+
+        return self.t_elapsed / self.n_checked
+
+    @property
+    def rejection_rate(self) -> float:
+
+        """Fraction of checked swallows rejected, with Laplace smoothing."""
+
+        return (self.n_rejected + 1) / (self.n_checked + 2)
+
+    @property
+    def rank(self) -> float:
+
+        """Expected cost per rejection, lower values are checked first."""
+
+        return self.mean_cost / self.rejection_rate
+
+    def record(self, n_checked: int, n_rejected: int, t_elapsed: float) -> None:
+
+        """Records the outcome of checking the constraint.
+
+        Parameters
+        ----------
+        n_checked : int
+            Number of swallows checked.
+        n_rejected : int
+            Number of swallows which violated the constraint.
+        t_elapsed : float
+            Time in seconds taken to check the swallows.
+        """
+
+        self.n_checked += n_checked
+        self.n_rejected += n_rejected
+        self.t_elapsed += t_elapsed
+
+    def as_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'cost_hint': self.cost_hint,
+            'n_checked': self.n_checked,
+            'n_rejected': self.n_rejected,
+            'mean_cost': self.mean_cost,
+            'rejection_rate': self.rejection_rate
+        }
+
+
 class ConstraintManager:
 
     def __init__(self, swarm: BaseSwarm) -> None:
@@ -17,6 +99,26 @@ class ConstraintManager:
 
         self.swarm = swarm
         self.constraints = []
+        self.statistics = []
+
+        self.adaptive_order = True
+
+        self._position = []
+        self._fitness = []
+
+    @property
+    def position_constraints(self) -> List[BaseConstraint]:
+
+        """Position constraints, in the order in which they are checked."""
+
+        return [constraint for constraint, _ in self._position]
+
+    @property
+    def fitness_constraints(self) -> List[BaseConstraint]:
+
+        """Fitness constraints, in the order in which they are checked."""
+
+        return [constraint for constraint, _ in self._fitness]
 
     def violates_position(self, swallow: BaseSwallow) -> bool:
 
@@ -33,15 +135,7 @@ class ConstraintManager:
             True if position constraints are violated, False otherwise.
         """
 
-        within_constraints = True
-        for constraint in self.constraints:
-            if isinstance(constraint, PositionConstraint):
-                within_constraints = constraint.constrain(swallow)
-
-            if not within_constraints:
-                return True
-
-        return False
+        return self._violates(self._position, swallow)
 
     def violates_fitness(self, swallow: BaseSwallow) -> bool:
 
@@ -58,17 +152,95 @@ class ConstraintManager:
             True if fitness constraints are violated, False otherwise.
         """
 
-        within_constraints = True
-        for constraint in self.constraints:
-            if isinstance(constraint, FitnessConstraint):
-                within_constraints = constraint.constrain(swallow)
+        return self._violates(self._fitness, swallow)
 
-            if not within_constraints:
-                return True
+    def position_mask(self, population: List[BaseSwallow]) -> np.ndarray:
 
-        return False
+        """Determines which swallows satisfy the position constraints.
+
+        Parameters
+        ----------
+        population : List[BaseSwallow]
+            Swallows for which to check the constraints.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, True where the position constraints are satisfied.
+        """
+
+        mask = np.ones(len(population), dtype=bool)
+
+        if self._position:
+            positions = self._stack(self._position,
+                                    [s.position for s in population])
+            self._apply(self._position, population, positions, mask)
+
+        return mask
 
-    def register_constraint(self, constraint: BaseConstraint) -> None:
+    def fitness_mask(self,
+                     population: List[BaseSwallow],
+                     mask: Optional[np.ndarray] = None) -> np.ndarray:
+
+        """Determines which swallows satisfy the fitness constraints.
+
+        Parameters
+        ----------
+        population : List[BaseSwallow]
+            Swallows for which to check the constraints.
+        mask : Optional[np.ndarray]
+            Swallows to consider, those outside of the mask are reported as
+            violating the constraints without being checked.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, True where the fitness constraints are satisfied.
+        """
+
+        if mask is None:
+            mask = np.ones(len(population), dtype=bool)
+        else:
+            mask = mask.copy()
+
+        if self._fitness:
+            fitness = self._stack(self._fitness,
+                                  [s.fitness for s in population])
+            self._apply(self._fitness, population, fitness, mask)
+
+        return mask
+
+    def feasible_mask(self,
+                      population: List[BaseSwallow],
+                      position_mask: Optional[np.ndarray] = None) -> np.ndarray:
+
+        """Determines which swallows satisfy all of the constraints.
+
+        Intended to be computed once per iteration, after the fitness of the
+        population has been evaluated, and reused wherever feasibility is
+        needed during that iteration.
+
+        Parameters
+        ----------
+        population : List[BaseSwallow]
+            Swallows for which to check the constraints.
+        position_mask : Optional[np.ndarray]
+            Result of position_mask() if already computed this iteration.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, True where all of the constraints are satisfied.
+        """
+
+        if position_mask is None:
+            position_mask = self.position_mask(population)
+
+        return self.fitness_mask(population, position_mask)
+
+    def register_constraint(self,
+                            constraint: BaseConstraint,
+                            cost_hint: Optional[float] = None) -> None:
 
         """Adds a constraint to be tested.
 
@@ -76,9 +248,132 @@ class ConstraintManager:
         ----------
         constraint : BaseConstraint
             The constraint to check.
+        cost_hint : Optional[float]
+            Expected cost in seconds of checking one swallow, used to order
+            the constraint until its cost has been measured.
         """
 
         if not isinstance(constraint, BaseConstraint):
             raise TypeError('constraint must inherit from BaseConstraint')
 
+        stats = ConstraintStatistics(type(constraint).__name__, cost_hint)
+
         self.constraints.append(constraint)
+        self.statistics.append(stats)
+
+        if isinstance(constraint, PositionConstraint):
+            self._position.append((constraint, stats))
+        elif isinstance(constraint, FitnessConstraint):
+            self._fitness.append((constraint, stats))
+
+    def summary(self) -> List[dict]:
+
+        """Reports the timing and rejection statistics of each constraint.
+
+        Returns
+        -------
+        List[dict]
+            Statistics of each constraint, in order of registration.
+        """
+
+        return [stats.as_dict() for stats in self.statistics]
+
+    def reorder(self) -> None:
+
+        """Orders constraints so the cheapest and most rejecting run first."""
+
+        self._position.sort(key=self._rank)
+        self._fitness.sort(key=self._rank)
+
+    @staticmethod
+    def _rank(pair: Tuple[BaseConstraint, ConstraintStatistics]) -> float:
+        return pair[1].rank
+
+    @staticmethod
+    def _violates(constraints: List[Tuple[BaseConstraint, ConstraintStatistics]],
+                  swallow: BaseSwallow) -> bool:
+
+        """Checks constraints in turn, stopping at the first violation.
+
+        Parameters
+        ----------
+        constraints : List[Tuple[BaseConstraint, ConstraintStatistics]]
+            Constraints to check, paired with their statistics.
+        swallow : BaseSwallow
+            The swallow for which to check the constraints.
+
+        Returns
+        -------
+        bool
+            True if any of the constraints are violated, False otherwise.
+        """
+
+        for constraint, stats in constraints:
+            t_start = time.perf_counter()
+            within_constraints = constraint.constrain(swallow)
+            stats.record(1, int(not within_constraints),
+                         time.perf_counter() - t_start)
+
+            if not within_constraints:
+                return True
+
+        return False
+
+    def _stack(self,
+               constraints: List[Tuple[BaseConstraint, ConstraintStatistics]],
+               values: list) -> Optional[np.ndarray]:
+
+        """Stacks values into a matrix if any constraint is batched."""
+
+        if any(c.batched for c, _ in constraints):
+            return np.asarray(values, dtype=float)
+
+        return None
+
+    def _apply(self,
+               constraints: List[Tuple[BaseConstraint, ConstraintStatistics]],
+               population: List[BaseSwallow],
+               values: Optional[np.ndarray],
+               mask: np.ndarray) -> None:
+
+        """Applies constraints in turn to the swallows still within the mask.
+
+        Parameters
+        ----------
+        constraints : List[Tuple[BaseConstraint, ConstraintStatistics]]
+            Constraints to apply, paired with their statistics.
+        population : List[BaseSwallow]
+            Swallows for which to check the constraints.
+        values : Optional[np.ndarray]
+            Positions or fitness of the population, passed to batched
+            constraints.
+        mask : np.ndarray
+            Boolean mask, updated in place.
+        """
+
+        if self.adaptive_order:
+            constraints.sort(key=self._rank)
+
+        for constraint, stats in constraints:
+            idx = np.flatnonzero(mask)
+
+            if idx.size == 0:
+                break
+
+            t_start = time.perf_counter()
+
+            if constraint.batched:
+                within_constraints = np.asarray(
+                    constraint.constrain_batch(values[idx]), dtype=bool
+                )
+            else:
+                within_constraints = np.fromiter(
+                    (constraint.constrain(population[i]) for i in idx),
+                    dtype=bool, count=idx.size
+                )
+
+            stats.record(idx.size,
+                         idx.size - int(np.count_nonzero(within_constraints)),
+                         time.perf_counter() - t_start)
+
+            mask[idx] = within_constraints
@@ -1,7 +1,9 @@
 import copy
+from typing import Dict, List
 
 import numpy as np
 
+from .nd_tree import NDTree
 from ..swallows.base_swallow import BaseSwallow
 
 
@@ -20,6 +22,31 @@ class Archive:
         self.population = []
         self.n_objectives = n_objectives
 
+    def state_dict(self) -> Dict[str, np.ndarray]:
+
+        """Captures state of the archive beyond its members.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays holding the state, empty if the archive has none.
+        """
+
+        return {}
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+
+        """Restores state captured by state_dict(), once the members have
+        been restored.
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        """
+
+        pass
+
     def add_swallow(self, swallow: BaseSwallow) -> None:
 
         """Responsible for adding a swallow to the archive.
@@ -38,16 +65,14 @@ class Archive:
 
         pf = []
 
-        for idx, swallow in enumerate(self.population):
+        for swallow in self.population:
 
-            pf.append(swallow)
+            if any(opp_swallow.dominate(swallow) for opp_swallow in pf):
+                continue
 
-            for opp_idx, opp_swallow in enumerate(pf[:-1]):
-                if opp_swallow.dominate(swallow):
-                    del pf[-1]
-                    break
-                elif swallow.dominate(opp_swallow):
-                    del pf[opp_idx]
+            pf = [opp_swallow for opp_swallow in pf
+                  if not swallow.dominate(opp_swallow)]
+            pf.append(swallow)
 
         self.population = pf
 
@@ -55,23 +80,43 @@ class Archive:
 
         """Assigns a sparsity to each member of the archive."""
 
-        _population = copy.deepcopy(self.population)
+        self.population = self._crowding_distance(
+            copy.deepcopy(self.population)
+        )
+
+    def _crowding_distance(self, population: List[BaseSwallow]) -> List[BaseSwallow]:
+
+        """Assigns the crowding distance of each swallow as its sparsity.
+
+        Parameters
+        ----------
+        population : List[BaseSwallow]
+            Swallows for which to assign the sparsity.
+
+        Returns
+        -------
+        List[BaseSwallow]
+            Swallows, sorted by their final objective.
+        """
+
+        if not population:
+            return population
 
-        for swallow in _population:
+        for swallow in population:
             swallow.sparsity = 0
 
         for obj in range(self.n_objectives):
-            _population = sorted(_population, key=lambda x: x.fitness[obj])
-            _population[0].sparsity = float('inf')
-            _population[-1].sparsity = float('inf')
+            population = sorted(population, key=lambda x: x.fitness[obj])
+            population[0].sparsity = float('inf')
+            population[-1].sparsity = float('inf')
 
-            for i in range(1, len(_population) - 1):
-                _sparse = (_population[i + 1].fitness[obj]
-                           - _population[i - 1].fitness[obj])
+            for i in range(1, len(population) - 1):
+                _sparse = (population[i + 1].fitness[obj]
+                           - population[i - 1].fitness[obj])
 
-                _population[i].sparsity += _sparse
+                population[i].sparsity += _sparse
 
-        self.population = _population
+        return population
 
     def sparsity_limit(self, n_limit: int) -> None:
 
@@ -114,3 +159,133 @@ class Archive:
                                          key=lambda x: x.sparsity,
                                          reverse=True)[self.n_objectives]
                 return copy.deepcopy(sparsist_leader)
+
+
+class IndexedArchive(Archive):
+
+    def __init__(self, n_objectives: int, max_leaf: int = 32) -> None:
+
+        """Indexed Archive Class.
+
+        Archive which is kept non-dominated as swallows are added. Dominance
+        queries are answered by an NDTree over the fitness of the members
+        rather than by comparing against every member, which keeps very
+        large archives practical.
+
+        Parameters
+        ----------
+        n_objectives : int
+            Number of objectives being optimised for.
+        max_leaf : int
+            Maximum number of members held by a leaf of the index.
+        """
+
+        self.index = NDTree(n_objectives, max_leaf=max_leaf)
+        self.members: Dict[int, BaseSwallow] = {}
+        self._population = None
+
+        super().__init__(n_objectives)
+
+    @property
+    def population(self) -> List[BaseSwallow]:
+
+        """Members of the archive, in order of insertion."""
+
+        if self._population is None:
+            self._population = list(self.members.values())
+
+        return self._population
+
+    @population.setter
+    def population(self, population: List[BaseSwallow]) -> None:
+        self.index = NDTree(self.index.n_objectives,
+                            max_leaf=self.index.max_leaf)
+        self.members = {}
+        self._population = None
+
+        for swallow in population:
+            self._insert(swallow)
+
+    def add_swallow(self, swallow: BaseSwallow) -> None:
+
+        """Adds a copy of the swallow if it is not dominated by the archive.
+
+        Members dominated by the swallow are removed. Swallows which are
+        weakly dominated, including exact duplicates, are rejected.
+
+        Parameters
+        ----------
+        swallow : BaseSwallow
+            Swallow to be added to the archive.
+        """
+
+        fitness = np.asarray(swallow.fitness, dtype=float)
+
+        if self.index.is_dominated(fitness, weak=True):
+            return
+
+        for member in self.index.dominated_by(fitness):
+            self._discard(member)
+
+        self._insert(copy.deepcopy(swallow))
+
+    def pareto_front(self) -> None:
+
+        """Members are kept non-dominated on insertion, nothing to do."""
+
+        pass
+
+    def assign_sparsity(self) -> None:
+
+        """Assigns a sparsity to each member of the archive."""
+
+        self._crowding_distance(self.population)
+
+    def sparsity_limit(self, n_limit: int) -> None:
+
+        """Caps the archive size, keeping the sparsest N swallows.
+
+        Parameters
+        ----------
+        n_limit : int
+            Archive size limit.
+        """
+
+        if len(self.members) > n_limit:
+            ranked = sorted(self.population,
+                            key=lambda x: x.sparsity,
+                            reverse=True)
+
+            for member in ranked[n_limit:]:
+                self._discard(member)
+
+    def choose_leader(self, method: int = 0) -> BaseSwallow:
+
+        """Chooses a leader for use in velocity calculations.
+
+        Parameters
+        ----------
+        method : int
+            Leader selection method to use.
+
+        Returns
+        -------
+        BaseSwallow
+            Copy of the archive member to use as the leader.
+        """
+
+        if method == 1:
+            return super().choose_leader(method)
+
+        population = self.population
+        return copy.deepcopy(population[np.random.randint(len(population))])
+
+    def _insert(self, member: BaseSwallow) -> None:
+        self.index.insert(np.asarray(member.fitness, dtype=float), member)
+        self.members[id(member)] = member
+        self._population = None
+
+    def _discard(self, member: BaseSwallow) -> None:
+        self.index.remove(member)
+        del self.members[id(member)]
+        self._population = None
@@ -1,10 +1,13 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 
 
 class BaseHandler:
 
+    def __init__(self) -> None:
+        self._buffers = {}
+
     @staticmethod
     def _out_of_bounds(vector: np.ndarray, lb: np.ndarray, ub: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
 
@@ -32,3 +35,98 @@ class BaseHandler:
         gtb = np.nonzero(vector > ub)[0]
 
         return ltb, gtb
+
+    def _scratch(self, name: str, shape: Tuple[int, ...], dtype: type = float) -> np.ndarray:
+
+        """Returns a preallocated buffer, reallocated only if the shape or
+        dtype changes.
+
+        Parameters
+        ----------
+        name : str
+            Name of the buffer.
+        shape : Tuple[int, ...]
+            Shape of the buffer.
+        dtype : type
+            Data type of the buffer.
+
+        Returns
+        -------
+        np.ndarray
+            Uninitialised buffer.
+        """
+
+        buffer = self._buffers.get(name)
+
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+
+        return buffer
+
+    def _bounds_masks(self, vector: np.ndarray, lb: np.ndarray, ub: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+        """Determines, with boolean masks, where a vector, or a matrix of one
+        vector per row, is out of the imposed bounds.
+
+        The masks are scratch buffers, overwritten by the next call.
+
+        Parameters
+        ----------
+        vector : np.ndarray
+            Vector, shape (d,), or matrix, shape (n, d), to check.
+        lb : np.ndarray
+            Lower bound.
+        ub : np.ndarray
+            Upper bound.
+
+        Returns
+        -------
+        below : np.ndarray
+            True where vector < lb.
+        above : np.ndarray
+            True where vector > ub.
+        outside : np.ndarray
+            True where either holds.
+        """
+
+        below = np.less(vector, lb, out=self._scratch('below', vector.shape, bool))
+        above = np.greater(vector, ub, out=self._scratch('above', vector.shape, bool))
+        outside = np.logical_or(below, above,
+                                out=self._scratch('outside', vector.shape, bool))
+
+        return below, above, outside
+
+    @staticmethod
+    def _output(vector: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+
+        """Array into which to write the result, copying vector into out
+        unless they are the same array.
+
+        Parameters
+        ----------
+        vector : np.ndarray
+            Input to the handler.
+        out : Optional[np.ndarray]
+            Array in which to place the result, vector itself if None.
+
+        Returns
+        -------
+        np.ndarray
+            Array to modify in place.
+        """
+
+        if out is None:
+            return vector
+
+        if out is not vector:
+            np.copyto(out, vector)
+
+        return out
+
+    def __getstate__(self) -> dict:
+        return {k: v for k, v in self.__dict__.items() if k != '_buffers'}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._buffers = {}
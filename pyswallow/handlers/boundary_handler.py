@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 
 from .base_handler import BaseHandler
@@ -17,14 +19,16 @@ class StandardBH(BaseBoundaryHandler):
     def __init__(self) -> None:
         super().__init__()
 
-    def __call__(self, position: np.ndarray) -> np.ndarray:
+    def __call__(self, position: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
 
         """Returns the position unchanged.
 
         Parameters
         ----------
         position : np.ndarray
-            Position to return.
+            Position to return, shape (d,), or positions, shape (n, d).
+        out : Optional[np.ndarray]
+            Array in which to place the result.
 
         Returns
         -------
@@ -32,7 +36,7 @@ class StandardBH(BaseBoundaryHandler):
             Original position unchanged.
         """
 
-        return position
+        return self._output(position, out)
 
 
 class NearestBH(BaseBoundaryHandler):
@@ -53,14 +57,16 @@ class NearestBH(BaseBoundaryHandler):
         self.lb = lb
         self.ub = ub
 
-    def __call__(self, position: np.ndarray) -> np.ndarray:
+    def __call__(self, position: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
 
         """Clips the position according to the imposed bounds.
 
         Parameters
         ----------
         position : np.ndarray
-            Position to clip.
+            Position to clip, shape (d,), or positions, shape (n, d).
+        out : Optional[np.ndarray]
+            Array in which to place the result, a new array if None.
 
         Returns
         -------
@@ -68,7 +74,7 @@ class NearestBH(BaseBoundaryHandler):
             Clipped position.
         """
 
-        return np.clip(position, self.lb, self.ub)
+        return np.clip(position, self.lb, self.ub, out=out)
 
 
 class ReflectiveBH(BaseBoundaryHandler):
@@ -89,14 +95,21 @@ class ReflectiveBH(BaseBoundaryHandler):
         self.lb = lb
         self.ub = ub
 
-    def __call__(self, position: np.ndarray) -> np.ndarray:
+    def __call__(self, position: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
 
         """Reflects position back within the imposed bounds.
 
+        Reflection is computed in closed form: the offset from the lower
+        bound is folded modulo twice the width of the bounds, so overshoots
+        of any size are handled in a single pass.
+
         Parameters
         ----------
         position : np.ndarray
-            Position to reflect within bounds.
+            Position to reflect within bounds, shape (d,), or positions,
+            shape (n, d).
+        out : Optional[np.ndarray]
+            Array in which to place the result, position itself if None.
 
         Returns
         -------
@@ -104,19 +117,84 @@ class ReflectiveBH(BaseBoundaryHandler):
             Position after being reflected within the bounds.
         """
 
-        ltb, gtb = self._out_of_bounds(position, self.lb, self.ub)
+        out = self._output(position, out)
+        _, _, outside = self._bounds_masks(out, self.lb, self.ub)
+
+        if not outside.any():
+            return out
+
+        width = self.ub - self.lb
+        period = np.where(width > 0, 2 * width, 1.0)
+
+        offset = np.subtract(out, self.lb, out=self._scratch('offset', out.shape))
+        np.mod(offset, period, out=offset)
+
+        mirror = np.subtract(period, offset, out=self._scratch('mirror', out.shape))
+        np.multiply(mirror, width > 0, out=mirror)
 
-        while (ltb.shape[0] > 0) or (gtb.shape[0] > 0):
+        np.minimum(offset, mirror, out=offset)
+        np.add(offset, self.lb, out=offset)
 
-            if ltb.shape[0] > 0:
-                position[ltb] = 2 * self.lb[ltb] - position[ltb]
+        np.copyto(out, offset, where=outside)
 
-            if gtb.shape[0] > 0:
-                position[gtb] = 2 * self.ub[gtb] - position[gtb]
+        return out
 
-            ltb, gtb = self._out_of_bounds(position, self.lb, self.ub)
 
-        return position
+class PeriodicBH(BaseBoundaryHandler):
+
+    def __init__(self, lb: np.ndarray, ub: np.ndarray) -> None:
+
+        """Periodic Boundary Handler.
+
+        Treats the search space as a torus, so that leaving through one
+        bound re-enters through the other.
+
+        Parameters
+        ----------
+        lb : np.ndarray
+            Lower bound.
+        ub : np.ndarray
+            Upper bound.
+        """
+
+        super().__init__()
+        self.lb = lb
+        self.ub = ub
+
+    def __call__(self, position: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+
+        """Wraps position around the imposed bounds.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position to wrap within bounds, shape (d,), or positions, shape
+            (n, d).
+        out : Optional[np.ndarray]
+            Array in which to place the result, position itself if None.
+
+        Returns
+        -------
+        np.ndarray
+            Position after being wrapped within the bounds.
+        """
+
+        out = self._output(position, out)
+        _, _, outside = self._bounds_masks(out, self.lb, self.ub)
+
+        if not outside.any():
+            return out
+
+        width = self.ub - self.lb
+
+        offset = np.subtract(out, self.lb, out=self._scratch('offset', out.shape))
+        np.mod(offset, np.where(width > 0, width, 1.0), out=offset)
+        np.multiply(offset, width > 0, out=offset)
+        np.add(offset, self.lb, out=offset)
+
+        np.copyto(out, offset, where=outside)
+
+        return out
 
 
 class RandomBH(BaseBoundaryHandler):
@@ -137,14 +215,17 @@ class RandomBH(BaseBoundaryHandler):
         self.lb = lb
         self.ub = ub
 
-    def __call__(self, position: np.ndarray) -> np.ndarray:
+    def __call__(self, position: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
 
         """Returns random position within range for exceeded boundaries.
 
         Parameters
         ----------
         position : np.ndarray
-            Position to alter according to bounds.
+            Position to alter according to bounds, shape (d,), or positions,
+            shape (n, d).
+        out : Optional[np.ndarray]
+            Array in which to place the result, position itself if None.
 
         Returns
         -------
@@ -152,9 +233,16 @@ class RandomBH(BaseBoundaryHandler):
             Altered position.
         """
 
-        ltb, gtb = self._out_of_bounds(position, self.lb, self.ub)
+        out = self._output(position, out)
+        below, above, outside = self._bounds_masks(out, self.lb, self.ub)
+
+        if not outside.any():
+            return out
+
+        lb = np.broadcast_to(self.lb, out.shape)
+        ub = np.broadcast_to(self.ub, out.shape)
 
-        position[ltb] = np.random.uniform(self.lb[ltb], self.ub[ltb])
-        position[gtb] = np.random.uniform(self.lb[gtb], self.ub[gtb])
+        out[below] = np.random.uniform(lb[below], ub[below])
+        out[above] = np.random.uniform(lb[above], ub[above])
 
-        return position
+        return out
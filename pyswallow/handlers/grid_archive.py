@@ -0,0 +1,330 @@
+import copy
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .archive import Archive
+from .nd_tree import NDTree
+from ..swallows.base_swallow import BaseSwallow
+
+
+class GridArchive(Archive):
+
+    def __init__(self,
+                 n_objectives: int,
+                 n_divisions: int = 10,
+                 inflation: float = 0.1,
+                 index: bool = False) -> None:
+
+        """Grid Archive Class.
+
+        Adaptive hypercube grid archive, as used by the original MOPSO of
+        Coello et al. Members are kept mutually non-dominated on insertion
+        and are bucketed into the cells of a grid over objective space. The
+        grid is only rebuilt when a new member falls outside of its bounds.
+
+        Parameters
+        ----------
+        n_objectives : int
+            Number of objectives being optimised for.
+        n_divisions : int
+            Number of grid divisions along each objective.
+        inflation : float
+            Fraction of the objective range by which to pad the grid bounds.
+        index : bool
+            If True, dominance queries are answered by an NDTree rather than
+            by comparing against every member.
+        """
+
+        self.n_divisions = n_divisions
+        self.inflation = inflation
+        self.index = NDTree(n_objectives) if index else None
+
+        self.grid: Dict[Tuple[int, ...], List[BaseSwallow]] = {}
+        self.lower: Optional[np.ndarray] = None
+        self.upper: Optional[np.ndarray] = None
+        self.width: Optional[np.ndarray] = None
+
+        self._size = 0
+        self._roulette = None
+        self._population = None
+
+        super().__init__(n_objectives)
+
+    @property
+    def population(self) -> List[BaseSwallow]:
+
+        """Members of the archive, gathered cell by cell.
+
+        The list is cached until the archive next changes, as it is read
+        for every swallow when choosing leaders.
+        """
+
+        if self._population is None:
+            self._population = [member for cell in self.grid.values()
+                                for member in cell]
+
+        return self._population
+
+    @population.setter
+    def population(self, population: List[BaseSwallow]) -> None:
+        population = list(population)
+
+        if self.index is not None:
+            self.index = NDTree(self.index.n_objectives)
+            for member in population:
+                self.index.insert(member.fitness, member)
+
+        self._rebuild(population)
+
+    def add_swallow(self, swallow: BaseSwallow) -> None:
+
+        """Adds a copy of the swallow if it is not dominated by the archive.
+
+        Members dominated by the swallow are removed. Swallows which are
+        weakly dominated, including exact duplicates, are rejected.
+
+        Parameters
+        ----------
+        swallow : BaseSwallow
+            Swallow to be added to the archive.
+        """
+
+        fitness = np.asarray(swallow.fitness, dtype=float)
+
+        if self.index is not None:
+            if self.index.is_dominated(fitness, weak=True):
+                return
+
+            for member in self.index.dominated_by(fitness):
+                self._discard(member)
+
+        elif self._size:
+            members = self.population
+            front = np.asarray([m.fitness for m in members], dtype=float)
+
+            if np.all(front <= fitness, axis=1).any():
+                return
+
+            dominated = (np.all(fitness <= front, axis=1)
+                         & np.any(fitness < front, axis=1))
+
+            for idx in np.flatnonzero(dominated):
+                self._discard(members[idx])
+
+        member = copy.deepcopy(swallow)
+
+        if self.index is not None:
+            self.index.insert(fitness, member)
+
+        if self.lower is None or not self._within_grid(fitness):
+            self._rebuild(self.population + [member])
+        else:
+            self.grid.setdefault(self._locate(fitness), []).append(member)
+            self._size += 1
+            self._roulette = None
+            self._population = None
+
+    def pareto_front(self) -> None:
+
+        """Members are kept non-dominated on insertion, nothing to do."""
+
+        pass
+
+    def assign_sparsity(self) -> None:
+
+        """Assigns sparsity as the inverse of each member's cell occupancy."""
+
+        for cell in self.grid.values():
+            sparsity = 1.0 / len(cell)
+            for member in cell:
+                member.sparsity = sparsity
+
+    def sparsity_limit(self, n_limit: int) -> None:
+
+        """Caps the archive size by pruning members of the densest cells.
+
+        Parameters
+        ----------
+        n_limit : int
+            Archive size limit.
+        """
+
+        while self._size > n_limit:
+            key = max(self.grid, key=lambda k: len(self.grid[k]))
+            cell = self.grid[key]
+            self._discard(cell[np.random.randint(len(cell))], key)
+
+    def choose_leader(self, method: int = 0) -> BaseSwallow:
+
+        """Chooses a leader for use in velocity calculations.
+
+        Parameters
+        ----------
+        method : int
+            Leader selection method to use: 0 for roulette selection of a
+            cell weighted by the inverse of its occupancy, 1 for the least
+            crowded cell.
+
+        Returns
+        -------
+        BaseSwallow
+            Copy of the archive member to use as the leader.
+        """
+
+        if self._roulette is None:
+            keys = list(self.grid)
+            weights = np.cumsum([1.0 / len(self.grid[k]) for k in keys])
+            self._roulette = keys, weights
+
+        keys, weights = self._roulette
+
+        if method == 1:
+            key = min(keys, key=lambda k: len(self.grid[k]))
+        else:
+            idx = np.searchsorted(weights, np.random.uniform(0.0, weights[-1]),
+                                  side='right')
+            key = keys[min(idx, len(keys) - 1)]
+
+        cell = self.grid[key]
+        return copy.deepcopy(cell[np.random.randint(len(cell))])
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+
+        """Captures the bounds of the grid, which adapt as members are
+        added and cannot be recomputed from the members alone.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Lower and upper bounds of the grid, empty if it is not built.
+        """
+
+        if self.lower is None:
+            return {}
+
+        return {
+            'archive_lower': self.lower.copy(),
+            'archive_upper': self.upper.copy()
+        }
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+
+        """Restores the bounds of the grid and reassigns every member.
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        """
+
+        if 'archive_lower' not in state:
+            return
+
+        members = self.population
+
+        self.grid = {}
+        self._roulette = None
+        self._population = None
+
+        self.lower = np.array(state['archive_lower'], dtype=float)
+        self.upper = np.array(state['archive_upper'], dtype=float)
+        self._place(members)
+
+    def _locate(self, fitness: np.ndarray) -> Tuple[int, ...]:
+
+        """Returns the coordinates of the grid cell containing fitness.
+
+        Parameters
+        ----------
+        fitness : np.ndarray
+            Fitness vector to locate.
+
+        Returns
+        -------
+        Tuple[int, ...]
+            Integer cell coordinates.
+        """
+
+        idx = ((fitness - self.lower) // self.width).astype(int)
+        return tuple(np.clip(idx, 0, self.n_divisions - 1).tolist())
+
+    def _within_grid(self, fitness: np.ndarray) -> bool:
+        return bool(np.all(fitness >= self.lower)
+                    and np.all(fitness <= self.upper))
+
+    def _discard(self, member: BaseSwallow,
+                 key: Optional[Tuple[int, ...]] = None) -> None:
+
+        """Removes a member from the cell in which it is stored.
+
+        Parameters
+        ----------
+        member : BaseSwallow
+            Archive member to remove.
+        key : Optional[Tuple[int, ...]]
+            Coordinates of the member's cell, located if not provided.
+        """
+
+        if key is None:
+            key = self._locate(np.asarray(member.fitness, dtype=float))
+
+        cell = self.grid[key]
+
+        cell.remove(member)
+        if not cell:
+            del self.grid[key]
+
+        if self.index is not None:
+            self.index.remove(member)
+
+        self._size -= 1
+        self._roulette = None
+        self._population = None
+
+    def _rebuild(self, members: List[BaseSwallow]) -> None:
+
+        """Recomputes the grid bounds and reassigns every member.
+
+        Parameters
+        ----------
+        members : List[BaseSwallow]
+            Members to place in the rebuilt grid.
+        """
+
+        self.grid = {}
+        self._size = len(members)
+        self._roulette = None
+        self._population = None
+
+        if not members:
+            self.lower = self.upper = self.width = None
+            return
+
+        front = np.asarray([m.fitness for m in members], dtype=float)
+        f_min = front.min(axis=0)
+        f_max = front.max(axis=0)
+
+        span = f_max - f_min
+        pad = self.inflation * np.where(span > 0.0, span,
+                                        np.maximum(np.abs(f_min), 1.0))
+
+        self.lower = f_min - pad
+        self.upper = f_max + pad
+        self._place(members)
+
+    def _place(self, members: List[BaseSwallow]) -> None:
+
+        """Assigns members to the cells of the grid within its bounds.
+
+        Parameters
+        ----------
+        members : List[BaseSwallow]
+            Members to place, in order.
+        """
+
+        self.width = (self.upper - self.lower) / self.n_divisions
+
+        for member in members:
+            fitness = np.asarray(member.fitness, dtype=float)
+            self.grid.setdefault(self._locate(fitness), []).append(member)
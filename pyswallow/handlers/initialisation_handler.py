@@ -0,0 +1,440 @@
+import warnings
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .base_handler import BaseHandler
+
+# Joe & Kuo (2008) direction numbers, new-joe-kuo-6.21201, for dimensions
+# 2 to 21: the degree s and coefficients a of the primitive polynomial,
+# followed by the initial direction numbers m_1, ..., m_s.
+_SOBOL_DIRECTIONS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+
+_SOBOL_BITS = 30
+
+
+def _split_bounds(bounds: dict) -> Tuple[np.ndarray, np.ndarray]:
+
+    """Lower and upper bounds from a dict of bounds."""
+
+    if not isinstance(bounds, dict):
+        raise TypeError('bounds must be dict.')
+
+    _bounds = np.asarray(list(bounds.values()), dtype=float)
+    return _bounds[:, 0], _bounds[:, 1]
+
+
+def primes(n: int) -> np.ndarray:
+
+    """Returns the first n prime numbers.
+
+    Parameters
+    ----------
+    n : int
+        Number of primes.
+
+    Returns
+    -------
+    np.ndarray
+        First n primes, in increasing order.
+    """
+
+    # the n-th prime is below n (ln n + ln ln n) for n >= 6
+    limit = max(15, int(n * (np.log(n) + np.log(np.log(n)))) + 1) if n > 1 else 3
+
+    sieve = np.ones(limit, dtype=bool)
+    sieve[:2] = False
+
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = False
+
+    return np.flatnonzero(sieve)[:n]
+
+
+def sobol_directions(n_dimensions: int) -> np.ndarray:
+
+    """Computes the Sobol direction numbers.
+
+    Parameters
+    ----------
+    n_dimensions : int
+        Number of dimensions, at most 21.
+
+    Returns
+    -------
+    np.ndarray
+        Direction numbers, shape (n_dimensions, 30), as 30-bit integers.
+    """
+
+    if n_dimensions > len(_SOBOL_DIRECTIONS) + 1:
+        raise ValueError(
+            f'Sobol sequences are supported for up to '
+            f'{len(_SOBOL_DIRECTIONS) + 1} dimensions.'
+        )
+
+    bits = _SOBOL_BITS
+    directions = np.empty((n_dimensions, bits), dtype=np.int64)
+
+    # the first dimension is the van der Corput sequence in base 2
+    directions[0] = 1 << np.arange(bits - 1, -1, -1)
+
+    for j, (s, a, m_init) in enumerate(_SOBOL_DIRECTIONS[:n_dimensions - 1], 1):
+        m = list(m_init)
+
+        for k in range(s, bits):
+            m_k = m[k - s] ^ (m[k - s] << s)
+            for i in range(1, s):
+                if (a >> (s - 1 - i)) & 1:
+                    m_k ^= m[k - i] << i
+            m.append(m_k)
+
+        directions[j] = [m[k] << (bits - 1 - k) for k in range(bits)]
+
+    return directions
+
+
+class BaseInitialisationHandler(BaseHandler):
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    def sample(self, n_swallows: int, n_dimensions: int) -> np.ndarray:
+        raise NotImplementedError('BaseInitialisationHandler::sample()')
+
+    def __call__(self, bounds: dict, n_swallows: int) -> Tuple[np.ndarray, np.ndarray]:
+
+        """Generates the positions and velocities of a population.
+
+        Positions are sampled in the unit hypercube and scaled to the
+        bounds, while velocities are drawn uniformly within the bounds.
+
+        Parameters
+        ----------
+        bounds : dict
+            Bounds of the search space.
+        n_swallows : int
+            Number of swallows in the population.
+
+        Returns
+        -------
+        position : np.ndarray
+            Position of each swallow, shape (n_swallows, d).
+        velocity : np.ndarray
+            Velocity of each swallow, shape (n_swallows, d).
+        """
+
+        lb, ub = _split_bounds(bounds)
+
+        position = lb + (ub - lb) * self.sample(n_swallows, len(lb))
+        velocity = np.random.uniform(lb, ub, size=(n_swallows, len(lb)))
+
+        return position, velocity
+
+
+class StandardIH(BaseInitialisationHandler):
+
+    def __init__(self) -> None:
+
+        """Standard Initialisation Handler.
+
+        Draws every position and velocity independently and uniformly.
+        """
+
+        super().__init__()
+
+    def sample(self, n_swallows: int, n_dimensions: int) -> np.ndarray:
+
+        """Samples points uniformly in the unit hypercube.
+
+        Parameters
+        ----------
+        n_swallows : int
+            Number of points.
+        n_dimensions : int
+            Number of dimensions.
+
+        Returns
+        -------
+        np.ndarray
+            Points, shape (n_swallows, n_dimensions).
+        """
+
+        return np.random.uniform(size=(n_swallows, n_dimensions))
+
+    def __call__(self, bounds: dict, n_swallows: int) -> Tuple[np.ndarray, np.ndarray]:
+
+        """Generates the positions and velocities of a population.
+
+        The random numbers are drawn in the same order as when each swallow
+        initialises itself, position then velocity.
+
+        Parameters
+        ----------
+        bounds : dict
+            Bounds of the search space.
+        n_swallows : int
+            Number of swallows in the population.
+
+        Returns
+        -------
+        position : np.ndarray
+            Position of each swallow, shape (n_swallows, d).
+        velocity : np.ndarray
+            Velocity of each swallow, shape (n_swallows, d).
+        """
+
+        lb, ub = _split_bounds(bounds)
+        draws = np.random.uniform(lb, ub, size=(n_swallows, 2, len(lb)))
+
+        return draws[:, 0], draws[:, 1]
+
+
+class LatinHypercubeIH(BaseInitialisationHandler):
+
+    def __init__(self, centred: bool = False) -> None:
+
+        """Latin Hypercube Initialisation Handler.
+
+        Each dimension is divided into n_swallows equal strata, and each
+        stratum holds exactly one swallow.
+
+        Parameters
+        ----------
+        centred : bool
+            If True, points are placed at the centre of their strata rather
+            than uniformly within them.
+        """
+
+        super().__init__()
+        self.centred = centred
+
+    def sample(self, n_swallows: int, n_dimensions: int) -> np.ndarray:
+
+        """Samples a Latin hypercube in the unit hypercube.
+
+        Parameters
+        ----------
+        n_swallows : int
+            Number of points.
+        n_dimensions : int
+            Number of dimensions.
+
+        Returns
+        -------
+        np.ndarray
+            Points, shape (n_swallows, n_dimensions).
+        """
+
+        strata = np.argsort(np.random.uniform(size=(n_swallows, n_dimensions)),
+                            axis=0)
+
+        if self.centred:
+            offset = 0.5
+        else:
+            offset = np.random.uniform(size=(n_swallows, n_dimensions))
+
+        return (strata + offset) / n_swallows
+
+
+class HaltonIH(BaseInitialisationHandler):
+
+    def __init__(self, scramble: bool = True) -> None:
+
+        """Halton Initialisation Handler.
+
+        Uses the Halton sequence, the radical inverse of the index of each
+        point in the first d prime bases.
+
+        Parameters
+        ----------
+        scramble : bool
+            If True, the digits in each base are randomly permuted, which
+            breaks up the correlations between dimensions with large bases.
+        """
+
+        super().__init__()
+        self.scramble = scramble
+
+    def sample(self, n_swallows: int, n_dimensions: int) -> np.ndarray:
+
+        """Samples the first n_swallows points of the Halton sequence.
+
+        Parameters
+        ----------
+        n_swallows : int
+            Number of points.
+        n_dimensions : int
+            Number of dimensions.
+
+        Returns
+        -------
+        np.ndarray
+            Points, shape (n_swallows, n_dimensions).
+        """
+
+        index = np.arange(n_swallows)
+        points = np.zeros((n_swallows, n_dimensions))
+
+        for j, base in enumerate(primes(n_dimensions)):
+            # digits beyond double precision cannot affect the result
+            n_digits = int(np.ceil(53 * np.log(2) / np.log(base)))
+            if not self.scramble:
+                n_digits = min(n_digits, int(np.ceil(np.log(n_swallows + 1)
+                                                     / np.log(base))) + 1)
+
+            remainder = index.copy()
+            scale = 1.0
+
+            for _ in range(n_digits):
+                scale /= base
+                digits = remainder % base
+                remainder //= base
+
+                if self.scramble:
+                    digits = np.random.permutation(base)[digits]
+
+                points[:, j] += digits * scale
+
+        return points
+
+
+class SobolIH(BaseInitialisationHandler):
+
+    def __init__(self, scramble: bool = True) -> None:
+
+        """Sobol Initialisation Handler.
+
+        Uses the Sobol sequence with the direction numbers of Joe & Kuo,
+        supporting up to 21 dimensions, beyond which a Halton sequence is
+        used instead, with a warning. The balance properties of the
+        sequence hold for populations whose size is a power of two.
+
+        Parameters
+        ----------
+        scramble : bool
+            If True, the sequence is randomised with a linear matrix
+            scramble followed by a random digital shift.
+        """
+
+        super().__init__()
+        self.scramble = scramble
+
+    def sample(self, n_swallows: int, n_dimensions: int) -> np.ndarray:
+
+        """Samples the first n_swallows points of the Sobol sequence.
+
+        Parameters
+        ----------
+        n_swallows : int
+            Number of points.
+        n_dimensions : int
+            Number of dimensions.
+
+        Returns
+        -------
+        np.ndarray
+            Points, shape (n_swallows, n_dimensions).
+        """
+
+        if n_dimensions > len(_SOBOL_DIRECTIONS) + 1:
+            warnings.warn(
+                f'Sobol sequences are supported for up to '
+                f'{len(_SOBOL_DIRECTIONS) + 1} dimensions, '
+                f'using a Halton sequence instead.', stacklevel=2
+            )
+            return HaltonIH(self.scramble).sample(n_swallows, n_dimensions)
+
+        bits = _SOBOL_BITS
+        directions = sobol_directions(n_dimensions)
+
+        shift = np.zeros(n_dimensions, dtype=np.int64)
+
+        if self.scramble:
+            weights = 1 << np.arange(bits - 1, -1, -1)
+
+            # bit r of each direction number, the most significant first
+            direction_bits = (directions[:, :, np.newaxis] >> (bits - 1 - np.arange(bits))) & 1
+
+            lower = np.tril(np.random.randint(0, 2, size=(n_dimensions, bits, bits)), -1)
+            lower[:, np.arange(bits), np.arange(bits)] = 1
+
+            scrambled = np.einsum('drc,dkc->dkr', lower, direction_bits) & 1
+            directions = scrambled @ weights
+
+            shift = np.random.randint(0, 2, size=(n_dimensions, bits)) @ weights
+
+        # points are generated in Gray code order
+        gray = np.arange(n_swallows, dtype=np.int64)
+        gray ^= gray >> 1
+
+        points = np.zeros((n_swallows, n_dimensions), dtype=np.int64)
+        points ^= shift
+
+        for k in range(bits):
+            set_bit = ((gray >> k) & 1).astype(bool)
+            points[set_bit] ^= directions[:, k]
+
+        return points / float(1 << bits)
+
+
+class OppositionIH(BaseInitialisationHandler):
+
+    def __init__(self, ih: Optional[BaseInitialisationHandler] = None) -> None:
+
+        """Opposition Initialisation Handler.
+
+        Samples half of the population with another initialisation handler,
+        and completes it with the opposite of each point, lb + ub - x, so
+        that every region of the search space is paired with its mirror.
+
+        Parameters
+        ----------
+        ih : Optional[BaseInitialisationHandler]
+            Handler from which to sample, StandardIH if None.
+        """
+
+        super().__init__()
+        self.ih = StandardIH() if ih is None else ih
+
+    def sample(self, n_swallows: int, n_dimensions: int) -> np.ndarray:
+
+        """Samples points and their opposites in the unit hypercube.
+
+        Parameters
+        ----------
+        n_swallows : int
+            Number of points.
+        n_dimensions : int
+            Number of dimensions.
+
+        Returns
+        -------
+        np.ndarray
+            Points, shape (n_swallows, n_dimensions), the second half being
+            the opposites of the first.
+        """
+
+        points = self.ih.sample((n_swallows + 1) // 2, n_dimensions)
+        return np.concatenate([points, 1.0 - points])[:n_swallows]
@@ -0,0 +1,267 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+
+class _Node:
+
+    __slots__ = ('parent', 'children', 'points', 'items', 'ideal', 'nadir')
+
+    def __init__(self, parent: Optional['_Node'] = None) -> None:
+        self.parent = parent
+        self.children = []
+        self.points = None
+        self.items = []
+        self.ideal = None
+        self.nadir = None
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.points is not None
+
+    def expand(self, point: np.ndarray) -> None:
+
+        """Grows the node's bounding box to include point."""
+
+        if self.ideal is None:
+            self.ideal = point.copy()
+            self.nadir = point.copy()
+        else:
+            np.minimum(self.ideal, point, out=self.ideal)
+            np.maximum(self.nadir, point, out=self.nadir)
+
+    def distance(self, point: np.ndarray) -> float:
+
+        """Squared distance from point to the midpoint of the node."""
+
+        offset = point - 0.5 * (self.ideal + self.nadir)
+        return offset.dot(offset)
+
+    def refresh(self) -> None:
+
+        """Recomputes the node's bounding box from its contents."""
+
+        if self.is_leaf:
+            self.ideal = self.points.min(axis=0)
+            self.nadir = self.points.max(axis=0)
+        else:
+            self.ideal = np.min([c.ideal for c in self.children], axis=0)
+            self.nadir = np.max([c.nadir for c in self.children], axis=0)
+
+
+class NDTree:
+
+    def __init__(self,
+                 n_objectives: int,
+                 max_leaf: int = 32,
+                 n_children: Optional[int] = None) -> None:
+
+        """ND-Tree Class.
+
+        Spatial index over fitness vectors, following the ND-Tree of
+        Jaszkiewicz & Lust. Every node stores the ideal and nadir points of
+        its subtree, which allows whole subtrees to be skipped, or accepted
+        outright, when answering dominance queries.
+
+        Parameters
+        ----------
+        n_objectives : int
+            Number of objectives being optimised for.
+        max_leaf : int
+            Maximum number of points held by a leaf before it is split.
+        n_children : Optional[int]
+            Number of children created when a leaf is split, defaults to
+            one more than the number of objectives.
+        """
+
+        self.n_objectives = n_objectives
+        self.max_leaf = max_leaf
+        self.n_children = n_children
+
+        self.root = None
+        self._leaves: Dict[int, _Node] = {}
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def __iter__(self) -> Iterator[Any]:
+        for leaf in self._iter_leaves():
+            yield from leaf.items
+
+    def insert(self, fitness: np.ndarray, item: Any) -> None:
+
+        """Adds an item to the index.
+
+        Parameters
+        ----------
+        fitness : np.ndarray
+            Fitness vector of the item.
+        item : Any
+            Item to store, removal is by identity.
+        """
+
+        point = np.asarray(fitness, dtype=float)
+
+        if self.root is None:
+            self.root = _Node()
+            self.root.points = np.empty((0, point.shape[0]))
+
+        node = self.root
+        node.expand(point)
+
+        while not node.is_leaf:
+            node = min(node.children, key=lambda c: c.distance(point))
+            node.expand(point)
+
+        node.points = np.vstack((node.points, point))
+        node.items.append(item)
+        self._leaves[id(item)] = node
+
+        if len(node.items) > self.max_leaf:
+            self._split(node)
+
+    def remove(self, item: Any) -> None:
+
+        """Removes an item from the index.
+
+        Parameters
+        ----------
+        item : Any
+            Item to remove.
+        """
+
+        node = self._leaves.pop(id(item))
+        idx = next(i for i, x in enumerate(node.items) if x is item)
+
+        del node.items[idx]
+        node.points = np.delete(node.points, idx, axis=0)
+
+        while node is not None:
+            if node.is_leaf and node.items or node.children:
+                node.refresh()
+            elif node.parent is not None:
+                node.parent.children.remove(node)
+            else:
+                self.root = None
+
+            node = node.parent
+
+    def is_dominated(self, fitness: np.ndarray, weak: bool = False) -> bool:
+
+        """Determines whether any indexed point dominates fitness.
+
+        Parameters
+        ----------
+        fitness : np.ndarray
+            Fitness vector to test.
+        weak : bool
+            If True, points equal to fitness also count as dominating it.
+
+        Returns
+        -------
+        bool
+            True if fitness is dominated, False otherwise.
+        """
+
+        point = np.asarray(fitness, dtype=float)
+        stack = [self.root] if self.root is not None else []
+
+        while stack:
+            node = stack.pop()
+
+            if (node.ideal > point).any():
+                continue
+
+            if ((node.nadir <= point).all()
+                    and (weak or (node.nadir < point).any())):
+                return True
+
+            if node.is_leaf:
+                dominates = (node.points <= point).all(axis=1)
+                if not weak:
+                    dominates &= (node.points < point).any(axis=1)
+                if dominates.any():
+                    return True
+            else:
+                stack.extend(node.children)
+
+        return False
+
+    def dominated_by(self, fitness: np.ndarray) -> List[Any]:
+
+        """Finds the indexed items which are dominated by fitness.
+
+        Parameters
+        ----------
+        fitness : np.ndarray
+            Fitness vector to test.
+
+        Returns
+        -------
+        List[Any]
+            Items whose fitness is dominated by fitness.
+        """
+
+        point = np.asarray(fitness, dtype=float)
+        stack = [self.root] if self.root is not None else []
+        dominated = []
+
+        while stack:
+            node = stack.pop()
+
+            if (point > node.nadir).any():
+                continue
+
+            if (point <= node.ideal).all() and (point < node.ideal).any():
+                dominated.extend(self._iter_items(node))
+            elif node.is_leaf:
+                mask = ((point <= node.points).all(axis=1)
+                        & (point < node.points).any(axis=1))
+                dominated.extend(node.items[i] for i in np.flatnonzero(mask))
+            else:
+                stack.extend(node.children)
+
+        return dominated
+
+    def _split(self, leaf: _Node) -> None:
+
+        """Divides an overfull leaf along its most spread objective.
+
+        Parameters
+        ----------
+        leaf : _Node
+            Leaf to split.
+        """
+
+        n_children = self.n_children or leaf.points.shape[1] + 1
+
+        axis = int(np.argmax(leaf.nadir - leaf.ideal))
+        order = np.argsort(leaf.points[:, axis], kind='stable')
+
+        for chunk in np.array_split(order, min(n_children, len(order))):
+            child = _Node(parent=leaf)
+            child.points = leaf.points[chunk]
+            child.items = [leaf.items[i] for i in chunk]
+            child.refresh()
+            leaf.children.append(child)
+
+            for item in child.items:
+                self._leaves[id(item)] = child
+
+        leaf.points = None
+        leaf.items = []
+
+    def _iter_leaves(self, node: Optional[_Node] = None) -> Iterator[_Node]:
+        node = node or self.root
+        stack = [node] if node is not None else []
+
+        while stack:
+            node = stack.pop()
+            if node.is_leaf:
+                yield node
+            else:
+                stack.extend(node.children)
+
+    def _iter_items(self, node: _Node) -> Iterator[Any]:
+        for leaf in self._iter_leaves(node):
+            yield from leaf.items
@@ -0,0 +1,305 @@
+from typing import Dict, Tuple, Union
+
+import numpy as np
+
+from .base_handler import BaseHandler
+
+Coefficient = Union[float, np.ndarray]
+
+
+class BaseParameterHandler(BaseHandler):
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    def __call__(self, swarm, position: np.ndarray) -> Tuple[Coefficient, Coefficient, Coefficient]:
+        raise NotImplementedError('BaseParameterHandler::__call__()')
+
+    def reset(self) -> None:
+
+        """Discards any adaptive state, ahead of a new optimisation."""
+
+        pass
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+
+        """Captures the adaptive state of the handler.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays holding the state, empty if the handler has none.
+        """
+
+        return {}
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+
+        """Restores state captured by state_dict().
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        """
+
+        pass
+
+
+class StandardPH(BaseParameterHandler):
+
+    def __init__(self) -> None:
+
+        """Standard Parameter Handler."""
+
+        super().__init__()
+
+    def __call__(self, swarm, position: np.ndarray) -> Tuple[float, float, float]:
+
+        """Returns the coefficients of the swarm unchanged.
+
+        Parameters
+        ----------
+        swarm : Swarm
+            Swarm being updated.
+        position : np.ndarray
+            Positions of the population, shape (n, d).
+
+        Returns
+        -------
+        Tuple[float, float, float]
+            Inertia, cognitive and social weights of the swarm.
+        """
+
+        return swarm.w, swarm.c1, swarm.c2
+
+
+class SuccessPH(BaseParameterHandler):
+
+    def __init__(self,
+                 w_min: float = 0.5,
+                 w_max: float = 0.9,
+                 c_min: float = 1.5,
+                 c_max: float = 2.0,
+                 smoothing: float = 0.5) -> None:
+
+        """Success Parameter Handler.
+
+        Keeps a success score in [0, 1] for each swallow, an exponential
+        moving average of whether its pbest_fitness improved in each
+        iteration. Successful swallows slow down to refine the region around
+        their own pbest, while unsuccessful swallows keep their momentum and
+        are drawn towards the gbest_swallow:
+
+            w_i  = w_max - (w_max - w_min) * s_i
+            c1_i = c_min + (c_max - c_min) * s_i
+            c2_i = c_max - (c_max - c_min) * s_i
+
+        Parameters
+        ----------
+        w_min : float
+            Inertia weight of a swallow which always improves.
+        w_max : float
+            Inertia weight of a swallow which never improves.
+        c_min : float
+            Lower limit of the cognitive and social weights.
+        c_max : float
+            Upper limit of the cognitive and social weights.
+        smoothing : float
+            Weight given to the latest iteration in the moving average.
+        """
+
+        super().__init__()
+
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError('smoothing must be in (0, 1].')
+
+        self.w_min = w_min
+        self.w_max = w_max
+        self.c_min = c_min
+        self.c_max = c_max
+        self.smoothing = smoothing
+
+        self.success = None
+        self.pbest_fitness = None
+        self.n_restarts = None
+
+    def reset(self) -> None:
+
+        """Discards the success scores."""
+
+        self.success = None
+        self.pbest_fitness = None
+        self.n_restarts = None
+
+    def __call__(self, swarm, position: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+        """Updates the success scores and determines the coefficients.
+
+        Scores are reset to 0.5 after every restart of the swarm, and
+        whenever the size of the population changes.
+
+        Parameters
+        ----------
+        swarm : Swarm
+            Swarm being updated.
+        position : np.ndarray
+            Positions of the population, shape (n, d).
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Inertia, cognitive and social weight of each swallow, shape (n,).
+        """
+
+        n_swallows = len(swarm.population)
+        pbest_fitness = np.fromiter(
+            (swallow.pbest_fitness for swallow in swarm.population),
+            dtype=float, count=n_swallows
+        )
+
+        if (self.success is None or len(self.success) != n_swallows
+                or swarm.n_restarts != self.n_restarts):
+            self.success = np.full(n_swallows, 0.5)
+            self.n_restarts = swarm.n_restarts
+        else:
+            improved = pbest_fitness < self.pbest_fitness
+            self.success *= 1.0 - self.smoothing
+            self.success += self.smoothing * improved
+
+        self.pbest_fitness = pbest_fitness
+
+        c_range = self.c_max - self.c_min
+
+        w = self.w_max - (self.w_max - self.w_min) * self.success
+        c1 = self.c_min + c_range * self.success
+        c2 = self.c_max - c_range * self.success
+
+        return w, c1, c2
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+
+        """Captures the success scores, the last pbest_fitness of each
+        swallow and the number of restarts they were scored since.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays holding the state, empty before the first iteration.
+        """
+
+        if self.success is None:
+            return {}
+
+        return {
+            'ph_success': self.success.copy(),
+            'ph_pbest_fitness': self.pbest_fitness.copy(),
+            'ph_n_restarts': np.asarray(self.n_restarts)
+        }
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+
+        """Restores state captured by state_dict().
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        """
+
+        self.reset()
+
+        if 'ph_success' in state:
+            self.success = np.array(state['ph_success'], dtype=float)
+            self.pbest_fitness = np.array(state['ph_pbest_fitness'], dtype=float)
+            self.n_restarts = int(state['ph_n_restarts'])
+
+
+class DistancePH(BaseParameterHandler):
+
+    def __init__(self,
+                 w_min: float = 0.4,
+                 w_max: float = 0.9,
+                 c_min: float = 1.5,
+                 c_max: float = 2.5) -> None:
+
+        """Distance Parameter Handler.
+
+        Ranks each swallow by its distance from the gbest_swallow, relative
+        to the nearest and furthest swallows, giving r_i in [0, 1]. Swallows
+        close to the gbest_swallow keep their momentum, exploring around it,
+        while distant swallows slow down and refine the region around their
+        own pbest:
+
+            w_i  = w_max - (w_max - w_min) * r_i
+            c1_i = c_min + (c_max - c_min) * r_i
+            c2_i = c_max - (c_max - c_min) * r_i
+
+        The handler is stateless, the distances being recomputed in every
+        iteration.
+
+        Parameters
+        ----------
+        w_min : float
+            Inertia weight of the furthest swallow.
+        w_max : float
+            Inertia weight of the nearest swallow.
+        c_min : float
+            Lower limit of the cognitive and social weights.
+        c_max : float
+            Upper limit of the cognitive and social weights.
+        """
+
+        super().__init__()
+
+        self.w_min = w_min
+        self.w_max = w_max
+        self.c_min = c_min
+        self.c_max = c_max
+
+    def __call__(self, swarm, position: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+        """Determines the coefficients from the distance to gbest_swallow.
+
+        Parameters
+        ----------
+        swarm : Swarm
+            Swarm being updated.
+        position : np.ndarray
+            Positions of the population, shape (n, d).
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Inertia, cognitive and social weight of each swallow, shape (n,).
+        """
+
+        if swarm.gbest_swallow is None:
+            # no swallow has been feasible yet, so there is nothing to rank by
+            rank = np.zeros(len(position))
+        else:
+            rank = self._rank(swarm, position)
+
+        c_range = self.c_max - self.c_min
+
+        w = self.w_max - (self.w_max - self.w_min) * rank
+        c1 = self.c_min + c_range * rank
+        c2 = self.c_max - c_range * rank
+
+        return w, c1, c2
+
+    def _rank(self, swarm, position: np.ndarray) -> np.ndarray:
+
+        """Relative distance of each swallow from the gbest_swallow."""
+
+        scale = np.where(swarm.ub > swarm.lb, swarm.ub - swarm.lb, 1.0)
+
+        offset = self._scratch('offset', position.shape)
+        np.subtract(position, swarm.gbest_swallow.position, out=offset)
+        offset /= scale
+
+        distance = np.linalg.norm(offset, axis=1)
+
+        spread = distance.max() - distance.min()
+        return ((distance - distance.min()) / spread if spread > 0.0
+                else np.zeros_like(distance))
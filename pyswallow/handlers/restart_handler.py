@@ -0,0 +1,144 @@
+from typing import List, Optional
+
+import numpy as np
+
+from .base_handler import BaseHandler
+from ..swallows.base_swallow import BaseSwallow
+
+
+def swarm_diversity(population: List[BaseSwallow],
+                    lb: np.ndarray,
+                    ub: np.ndarray,
+                    measure: str = 'centroid') -> float:
+
+    """Measures how spread out the population is.
+
+    Positions are normalised by the bounds, and the result divided by the
+    length of the diagonal of the search space, so that the diversity of
+    any problem lies in [0, 1].
+
+    Parameters
+    ----------
+    population : List[BaseSwallow]
+        Swallows whose positions to measure.
+    lb : np.ndarray
+        Lower bound.
+    ub : np.ndarray
+        Upper bound.
+    measure : str
+        'centroid' for the mean distance to the centroid, 'diameter' for
+        the diagonal of the bounding box of the population.
+
+    Returns
+    -------
+    float
+        Diversity of the population.
+    """
+
+    positions = np.array([swallow.position for swallow in population])
+    positions = (positions - lb) / np.where(ub > lb, ub - lb, 1.0)
+
+    if measure == 'centroid':
+        spread = np.linalg.norm(positions - positions.mean(axis=0), axis=1).mean()
+    elif measure == 'diameter':
+        spread = np.linalg.norm(positions.max(axis=0) - positions.min(axis=0))
+    else:
+        raise ValueError("measure must be 'centroid' or 'diameter'.")
+
+    return float(spread / np.sqrt(positions.shape[1]))
+
+
+class StandardRH(BaseHandler):
+
+    def __init__(self) -> None:
+
+        """Standard Restart Handler."""
+
+        super().__init__()
+
+    def __call__(self, swarm) -> Optional[int]:
+
+        """Never restarts the swarm.
+
+        Parameters
+        ----------
+        swarm : Swarm
+            Swarm to check.
+
+        Returns
+        -------
+        Optional[int]
+            None.
+        """
+
+        return None
+
+
+class DiversityRH(BaseHandler):
+
+    def __init__(self,
+                 threshold: float = 1e-3,
+                 measure: str = 'centroid',
+                 growth: float = 1.0,
+                 max_swallows: Optional[int] = None) -> None:
+
+        """Diversity Restart Handler.
+
+        Restarts the swarm once its diversity falls below a threshold,
+        optionally growing the population with each restart, as in IPOP.
+        The gbest_swallow is kept across restarts.
+
+        Parameters
+        ----------
+        threshold : float
+            Diversity, as measured by swarm_diversity(), below which to
+            restart.
+        measure : str
+            'centroid' or 'diameter', see swarm_diversity().
+        growth : float
+            Factor by which the population grows with each restart,
+            relative to the current population.
+        max_swallows : Optional[int]
+            Largest population to grow to.
+        """
+
+        super().__init__()
+
+        if measure not in ('centroid', 'diameter'):
+            raise ValueError("measure must be 'centroid' or 'diameter'.")
+
+        self.threshold = threshold
+        self.measure = measure
+        self.growth = growth
+        self.max_swallows = max_swallows
+
+        self.diversity = None
+
+    def __call__(self, swarm) -> Optional[int]:
+
+        """Determines whether to restart the swarm.
+
+        Parameters
+        ----------
+        swarm : Swarm
+            Swarm to check.
+
+        Returns
+        -------
+        Optional[int]
+            Number of swallows with which to restart, None to continue.
+        """
+
+        self.diversity = swarm_diversity(swarm.population, swarm.lb, swarm.ub,
+                                         self.measure)
+
+        if self.diversity >= self.threshold:
+            return None
+
+        # grow from the current population, so that growth compounds
+        n_swallows = int(round(len(swarm.population) * self.growth))
+
+        if self.max_swallows is not None:
+            n_swallows = min(n_swallows, self.max_swallows)
+
+        return max(n_swallows, 1)
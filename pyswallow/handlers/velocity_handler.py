@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 
 from .base_handler import BaseHandler
@@ -11,14 +13,16 @@ class StandardVH(BaseHandler):
 
         super().__init__()
 
-    def __call__(self, velocity: np.ndarray) -> np.ndarray:
+    def __call__(self, velocity: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
 
         """Returns the velocity completely unaltered.
 
         Parameters
         ----------
         velocity : np.ndarray
-            Velocity to pass back.
+            Velocity to pass back, shape (d,), or velocities, shape (n, d).
+        out : Optional[np.ndarray]
+            Array in which to place the result.
 
         Returns
         -------
@@ -26,7 +30,7 @@ class StandardVH(BaseHandler):
             Unaltered velocity.
         """
 
-        return velocity
+        return self._output(velocity, out)
 
 
 class ClampedVH(BaseHandler):
@@ -47,14 +51,16 @@ class ClampedVH(BaseHandler):
         self.lb = lb
         self.ub = ub
 
-    def __call__(self, velocity: np.ndarray) -> np.ndarray:
+    def __call__(self, velocity: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
 
         """Clips the velocity according to the imposed bounds.
 
         Parameters
         ----------
         velocity : np.ndarrary
-            Velocity to clip.
+            Velocity to clip, shape (d,), or velocities, shape (n, d).
+        out : Optional[np.ndarray]
+            Array in which to place the result, a new array if None.
 
         Returns
         -------
@@ -62,7 +68,7 @@ class ClampedVH(BaseHandler):
             Clipped velocity.
         """
 
-        return np.clip(velocity, self.lb, self.ub)
+        return np.clip(velocity, self.lb, self.ub, out=out)
 
 
 class InvertVH(BaseHandler):
@@ -84,16 +90,21 @@ class InvertVH(BaseHandler):
         self.lb = lb
         self.ub = ub
 
-    def __call__(self, velocity: np.ndarray, z: float = 0.5) -> np.ndarray:
+    def __call__(self,
+                 velocity: np.ndarray,
+                 z: float = 0.5,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
 
         """Inverts velocity according to scaling factor, z, and bounds.
 
         Parameters
         ----------
         velocity : np.ndarray
-            Velocity to invert.
+            Velocity to invert, shape (d,), or velocities, shape (n, d).
         z : float
             Inversion scaling factor.
+        out : Optional[np.ndarray]
+            Array in which to place the result, velocity itself if None.
 
         Returns
         -------
@@ -101,12 +112,12 @@ class InvertVH(BaseHandler):
             Inverted velocity vector.
         """
 
-        ltb, gtb = self._out_of_bounds(velocity, self.lb, self.ub)
+        out = self._output(velocity, out)
+        _, _, outside = self._bounds_masks(out, self.lb, self.ub)
 
-        velocity[ltb] = (-z) * velocity[ltb]
-        velocity[gtb] = (-z) * velocity[gtb]
+        np.multiply(out, -z, out=out, where=outside)
 
-        return velocity
+        return out
 
 
 class ZeroVH(BaseHandler):
@@ -127,14 +138,16 @@ class ZeroVH(BaseHandler):
         self.lb = lb
         self.ub = ub
 
-    def __call__(self, velocity: np.ndarray) -> np.ndarray:
+    def __call__(self, velocity: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
 
         """Zeros the velocty for any dimension exceeding the bounds.
 
         Parameters
         ----------
         velocity : np.ndarray
-            Velocity to zero.
+            Velocity to zero, shape (d,), or velocities, shape (n, d).
+        out : Optional[np.ndarray]
+            Array in which to place the result, velocity itself if None.
 
         Returns
         -------
@@ -142,7 +155,9 @@ class ZeroVH(BaseHandler):
             Velocity with values zeroed if outside bounds.
         """
 
-        ltb, gtb = self._out_of_bounds(velocity, self.lb, self.ub)
+        out = self._output(velocity, out)
+        _, _, outside = self._bounds_masks(out, self.lb, self.ub)
+
+        np.copyto(out, 0.0, where=outside)
 
-        velocity[np.concatenate((ltb, gtb))] = 0.0
-        return velocity
+        return out
@@ -1,10 +1,42 @@
+import copy
 import multiprocessing as mp
-from typing import Callable
+import time
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 
 from ..opt.sopso import Swarm
 from ..swallows.so_swallow import Swallow
+from ..utils.profiler import TimedCall
+
+
+class _DecodedCall:
+
+    def __init__(self, fn: Callable[[Swallow], Swallow]) -> None:
+
+        """Decoded Call Class.
+
+        Picklable wrapper which presents the objective, inside a worker
+        process, with a swallow whose position is its decoded candidate,
+        restoring the continuous position afterwards.
+
+        Parameters
+        ----------
+        fn : Callable[[Swallow], Swallow]
+            Function to optimise for.
+        """
+
+        self.fn = fn
+
+    def __call__(self, args: Tuple[Swallow, np.ndarray]) -> Swallow:
+        swallow, candidate = args
+        position = swallow.position
+
+        swallow.position = candidate
+        swallow = self.fn(swallow)
+        swallow.position = position
+
+        return swallow
 
 
 class MPSwarm(Swarm):
@@ -46,70 +78,117 @@ class MPSwarm(Swarm):
         self.cores = cores
         self.pool = mp.Pool(processes=self.cores)
 
-    def step_optimise(self, fn: Callable[[Swallow], Swallow]) -> None:
+    def evaluate_population(self, swallows: List[Swallow], fn: Callable[[Swallow], Swallow]) -> None:
+
+        """Assesses the fitness of swallows across the worker pool, counting
+        each evaluated swallow in n_evaluations.
 
-        """Runs one iteration of the optimisation process.
+        When the search space has integer or categorical parameters, only
+        the swallows which decode to distinct candidates are sent to the
+        pool, the others sharing their fitness. Each shared fitness is
+        counted in n_cache_hits.
+
+        Each evaluated swallow takes on the attributes of the copy returned
+        by its worker, so that it remains the same object in the population.
 
         Parameters
         ----------
+        swallows : List[Swallow]
+            Swallows to evaluate.
         fn : Callable[[Swallow], Swallow]
             Function to optimise for.
         """
 
-        self.w = self.iwh(self.iteration)
-
-        for swallow in self.population:
-            swallow.swallow_iteration = self.iteration
+        if not swallows:
+            return
 
-        self.population = self.pool.map(fn, self.population)
+        if self.space.is_continuous:
+            candidates = None
+            first = inverse = np.arange(len(swallows))
+        else:
+            candidates, first, inverse = self.space.unique(
+                np.array([swallow.position for swallow in swallows])
+            )
 
-        for swallow in self.population:
+        evaluate = [swallows[idx] for idx in first]
+        evaluated = self.map_population(fn, evaluate, candidates)
 
-            if self.constraints_manager.violates_position(swallow):
-                continue
+        for swallow, result in zip(evaluate, evaluated):
+            vars(swallow).update(vars(result))
 
-            if self.constraints_manager.violates_fitness(swallow):
-                continue
+        if len(evaluate) < len(swallows):
+            for swallow, idx in zip(swallows, inverse):
+                if swallow is not evaluate[idx]:
+                    swallow.fitness = copy.copy(evaluate[idx].fitness)
 
-            self.gbest_update(swallow)
-            self.pbest_update(swallow)
+            self.n_cache_hits += len(swallows) - len(evaluate)
 
-        for swallow in self.population:
-            self.update_velocity(swallow)
-            swallow.move(self.bh)
+        self.n_evaluations += len(evaluate)
 
-        self.history.write_history()
+    def map_population(self,
+                       fn: Callable[[Swallow], Swallow],
+                       swallows: List[Swallow],
+                       candidates: Optional[np.ndarray] = None) -> List[Swallow]:
 
-        mean_fitness = np.mean([s.fitness for s in self.population])
-        self.rep.log(
-            f'iteration={self.iteration:05}\t'
-            f'mean_fitness={mean_fitness:.3f}\t'
-            f'gbest_fitness={self.gbest_swallow.fitness:.3f}\t'
-            f'gbest_position={self.gbest_swallow.position}'
-        )
+        """Evaluates swallows across the worker pool.
 
-    def optimise(self, fn: Callable[[Swallow], Swallow]) -> None:
+        When candidates are given, the objective receives each swallow with
+        its decoded candidate as its position, as the objective of a Swarm
+        does, and the continuous position is restored on its return.
 
-        """Runs the entire optimisation process.
+        When profiling, each evaluation is timed within its worker and the
+        time the workers spent idle while the population was evaluated is
+        recorded as worker_idle.
 
         Parameters
         ----------
         fn : Callable[[Swallow], Swallow]
             Function to optimise for.
+        swallows : List[Swallow]
+            Swallows to evaluate.
+        candidates : Optional[np.ndarray]
+            Decoded candidate of each swallow, None to evaluate the swallows
+            at their continuous positions.
+
+        Returns
+        -------
+        List[Swallow]
+            Evaluated swallows.
         """
 
-        self.reset_environment()
-        self.initialise_swarm()
+        if candidates is not None:
+            fn = _DecodedCall(fn)
+            swallows = list(zip(swallows, candidates))
+
+        if not self.profiler.enabled:
+            return self.pool.map(fn, swallows)
+
+        start = time.perf_counter_ns()
+        results = self.pool.map(TimedCall(fn), swallows)
+        end = time.perf_counter_ns()
+
+        busy = 0
+        for _, t_start, t_end, pid in results:
+            self.profiler.record('objective', t_start, t_end, tid=pid)
+            busy += t_end - t_start
+
+        idle = max(self.cores * (end - start) - busy, 0)
+        self.profiler.record('worker_idle', start, start + idle)
 
-        while not self.termination_manager.termination_check():
-            self.step_optimise(fn)
+        return [swallow for swallow, *_ in results]
 
-            if self.checkpointer(self.iteration):
-                self.save_swarm()
+    def optimise(self, fn: Callable[[Swallow], Swallow]) -> None:
+
+        """Runs the entire optimisation process.
 
-            self.iteration += 1
+        Parameters
+        ----------
+        fn : Callable[[Swallow], Swallow]
+            Function to optimise for.
+        """
 
-        self.rep.log('Optimisation complete...')
+        for _ in self.iter_optimise(fn):
+            pass
 
     def __getstate__(self) -> dict:
         return {k: self.__dict__[k] for k in self.__dict__.keys() - {'pool'}}
@@ -1,11 +1,19 @@
+import copy
+import itertools
 import pickle
+import warnings
 from abc import ABC, abstractmethod
-from typing import Any, Callable, NoReturn, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NoReturn, Optional
 
 import numpy as np
 
 from ..swallows.base_swallow import BaseSwallow
-from ..utils.checkpoint import Checkpointer
+from ..utils.checkpoint import Checkpointer, load_checkpoint
+from ..utils.parameters import ParameterSpace
+from ..utils.profiler import NullProfiler
+
+if TYPE_CHECKING:
+    from ..constraints.constraint_manager import ConstraintManager
 
 
 class BaseSwarm(ABC):
@@ -22,7 +30,9 @@ class BaseSwarm(ABC):
         Parameters
         ----------
         bounds : dict
-            Bounds to impose on the search space.
+            Bounds to impose on the search space, either a [lower, upper]
+            pair or a Continuous, Integer or Categorical spec for each
+            parameter.
         n_swallows : int
             Number of swallows for use in the population.
         w : float
@@ -38,8 +48,9 @@ class BaseSwarm(ABC):
         if not isinstance(bounds, dict):
             raise TypeError('bounds must be dict.')
 
-        self.bounds = bounds
-        _bounds = np.asarray(list(bounds.values()))
+        self.space = ParameterSpace(bounds)
+        self.bounds = self.space.bounds
+        _bounds = np.asarray(list(self.bounds.values()))
         self.lb = _bounds[:, 0]
         self.ub = _bounds[:, 1]
 
@@ -52,10 +63,36 @@ class BaseSwarm(ABC):
         self.iteration = None
         self.n_iterations = None
 
+        self.screen_constraints = False
+        self.screen_penalty = None
+
+        self.n_evaluations = 0
+        self.n_screened = 0
+        self.n_rejected = 0
+        self.n_cache_hits = 0
+        self.n_restarts = 0
+
         self.checkpointer = Checkpointer()
+        self.profiler = NullProfiler()
+        self.metrics = None
 
         self.population = []
 
+    @property
+    def constraints_manager(self) -> 'ConstraintManager':
+
+        """Deprecated alias of constraint_manager."""
+
+        warnings.warn('constraints_manager is deprecated, use constraint_manager.',
+                      DeprecationWarning, stacklevel=2)
+        return self.constraint_manager
+
+    @constraints_manager.setter
+    def constraints_manager(self, manager: 'ConstraintManager') -> None:
+        warnings.warn('constraints_manager is deprecated, use constraint_manager.',
+                      DeprecationWarning, stacklevel=2)
+        self.constraint_manager = manager
+
     @abstractmethod
     def reset_environment(self) -> NoReturn:
         raise NotImplementedError('BaseSwarm::reset_environment()')
@@ -81,6 +118,272 @@ class BaseSwarm(ABC):
     def optimise(self, fn: Callable[[Any], Any]) -> NoReturn:
         raise NotImplementedError('BaseSwarm::optimise()')
 
+    def resume(self, path: str, fn: Any) -> None:
+
+        """Continues an optimisation from a checkpoint.
+
+        The state saved at the end of an iteration is restored and the
+        optimisation continues from the following iteration, without
+        re-evaluating the population. Given the same configuration, the
+        continuation is identical to an uninterrupted run.
+
+        Only the global NumPy random state is restored, from which every
+        built-in handler draws. Custom handlers, objectives or constraints
+        which hold their own generator or seed are not restored, and must
+        be reseeded by the caller for the continuation to be identical.
+
+        Parameters
+        ----------
+        path : str
+            Path of a checkpoint written by the Checkpointer.
+        fn : Any
+            Function, or functions, to optimise for, as for optimise().
+        """
+
+        self.reset_environment()
+        self.load_state_dict(load_checkpoint(path))
+
+        self.iteration += 1
+
+        for _ in self._iterate(fn):
+            pass
+
+    @abstractmethod
+    def _iterate(self, fn: Any) -> NoReturn:
+        raise NotImplementedError('BaseSwarm::_iterate()')
+
+    def reset_counters(self) -> None:
+
+        """Zeroes the running counts of evaluations, cache hits,
+        screened and rejected candidates, and restarts."""
+
+        self.n_evaluations = 0
+        self.n_screened = 0
+        self.n_rejected = 0
+        self.n_cache_hits = 0
+        self.n_restarts = 0
+
+    def initialise_population(self, n_swallows: int) -> None:
+
+        """Initialises a population which may differ in size from
+        n_swallows, such as when restarting or restoring a grown population.
+
+        Parameters
+        ----------
+        n_swallows : int
+            Number of swallows in the population.
+        """
+
+        n_configured, self.n_swallows = self.n_swallows, n_swallows
+
+        try:
+            self.initialise_swarm()
+        finally:
+            self.n_swallows = n_configured
+
+    def evaluate_population(self, swallows: List[BaseSwallow], fn: Any) -> None:
+
+        """Assesses the fitness of swallows, counting each evaluated swallow
+        in n_evaluations. A swallow counts once however many objectives it
+        is evaluated against.
+
+        When the search space has integer or categorical parameters, the
+        positions are decoded before evaluation, and swallows decoding to
+        the same candidate share a single evaluation. Each shared fitness is
+        counted in n_cache_hits.
+
+        Parameters
+        ----------
+        swallows : List[BaseSwallow]
+            Swallows to evaluate.
+        fn : Any
+            Function, or functions, to optimise for, as for optimise().
+        """
+
+        profiler = self.profiler
+
+        if self.space.is_continuous:
+            candidates = [None] * len(swallows)
+            evaluate = swallows
+        elif swallows:
+            candidates, first, inverse = self.space.unique(
+                np.array([swallow.position for swallow in swallows])
+            )
+            evaluate = [swallows[idx] for idx in first]
+        else:
+            return
+
+        if profiler.enabled:
+            for swallow, candidate in zip(evaluate, candidates):
+                with profiler.phase('objective'):
+                    self.evaluate_fitness(swallow, fn, candidate)
+                self.n_evaluations += 1
+        else:
+            for swallow, candidate in zip(evaluate, candidates):
+                self.evaluate_fitness(swallow, fn, candidate)
+                self.n_evaluations += 1
+
+        if len(evaluate) < len(swallows):
+            for swallow, idx in zip(swallows, inverse):
+                if swallow is not evaluate[idx]:
+                    swallow.fitness = copy.copy(evaluate[idx].fitness)
+
+            self.n_cache_hits += len(swallows) - len(evaluate)
+
+    def screen_population(self) -> Optional[np.ndarray]:
+
+        """Checks position constraints ahead of evaluating the population.
+
+        Only applies when screen_constraints is True. Swallows violating the
+        position constraints are not evaluated, instead being assigned the
+        screened fitness, and are counted in n_screened.
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            Boolean mask of the swallows to evaluate, None if not screening.
+        """
+
+        if not self.screen_constraints:
+            return None
+
+        mask = self.constraint_manager.position_mask(self.population)
+
+        for swallow in itertools.compress(self.population, ~mask):
+            swallow.fitness = self.screened_fitness()
+
+        self.n_screened += int(np.count_nonzero(~mask))
+
+        return mask
+
+    def screened_fitness(self) -> Any:
+
+        """Fitness assigned to swallows which were screened out.
+
+        Returns
+        -------
+        Any
+            screen_penalty if set, otherwise NaN to mark it not evaluated.
+        """
+
+        return np.nan if self.screen_penalty is None else self.screen_penalty
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+
+        """Captures the state required to continue the optimisation.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays holding the population, the iteration, the evaluation
+            counters and the state of the global random number generator.
+        """
+
+        _, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+
+        state = {
+            'iteration': np.asarray(self.iteration),
+            'n_evaluations': np.asarray(self.n_evaluations),
+            'n_screened': np.asarray(self.n_screened),
+            'n_rejected': np.asarray(self.n_rejected),
+            'n_cache_hits': np.asarray(self.n_cache_hits),
+            'n_restarts': np.asarray(self.n_restarts),
+            'rng_keys': keys,
+            'rng_pos': np.asarray(pos),
+            'rng_has_gauss': np.asarray(has_gauss),
+            'rng_cached_gaussian': np.asarray(cached_gaussian)
+        }
+
+        state.update(self._swallow_state(self.population))
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+
+        """Restores state captured by state_dict().
+
+        The population is initialised first if its size does not match the
+        state. The random number generator is restored last, so that any
+        random draws made while restoring do not affect the continuation.
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        """
+
+        if len(self.population) != len(state['position']):
+            self.initialise_population(len(state['position']))
+
+        self._load_swallows(self.population, state)
+
+        self.iteration = int(state['iteration'])
+        self.n_evaluations = int(state['n_evaluations'])
+        self.n_screened = int(state['n_screened'])
+        self.n_rejected = int(state.get('n_rejected', 0))
+        self.n_cache_hits = int(state.get('n_cache_hits', 0))
+        self.n_restarts = int(state.get('n_restarts', 0))
+
+        np.random.set_state((
+            'MT19937',
+            state['rng_keys'],
+            int(state['rng_pos']),
+            int(state['rng_has_gauss']),
+            float(state['rng_cached_gaussian'])
+        ))
+
+    @staticmethod
+    def _swallow_state(swallows: List[BaseSwallow],
+                       prefix: str = '') -> Dict[str, np.ndarray]:
+
+        """Stacks the attributes of swallows into arrays.
+
+        Parameters
+        ----------
+        swallows : List[BaseSwallow]
+            Swallows for which to capture the state.
+        prefix : str
+            Prefix for the name of each array.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Array of each attribute, with one row per swallow.
+        """
+
+        attributes = ('position', 'velocity', 'pbest_position',
+                      'fitness', 'pbest_fitness')
+
+        return {
+            f'{prefix}{name}': np.asarray(
+                [getattr(s, name) for s in swallows], dtype=float
+            )
+            for name in attributes
+        }
+
+    @staticmethod
+    def _load_swallows(swallows: List[BaseSwallow],
+                       state: Dict[str, np.ndarray],
+                       prefix: str = '') -> None:
+
+        """Restores the attributes of swallows from arrays.
+
+        Parameters
+        ----------
+        swallows : List[BaseSwallow]
+            Swallows to restore, one per row of the arrays.
+        state : Dict[str, np.ndarray]
+            Arrays produced by _swallow_state().
+        prefix : str
+            Prefix for the name of each array.
+        """
+
+        for idx, swallow in enumerate(swallows):
+            swallow.position = state[f'{prefix}position'][idx].copy()
+            swallow.velocity = state[f'{prefix}velocity'][idx].copy()
+            swallow.pbest_position = state[f'{prefix}pbest_position'][idx].copy()
+            swallow.fitness = state[f'{prefix}fitness'][idx].tolist()
+            swallow.pbest_fitness = state[f'{prefix}pbest_fitness'][idx].tolist()
+
     def save_swarm(self, save_path: Optional[str] = None) -> None:
 
         """Serializes Swarm.
@@ -1,5 +1,7 @@
+import itertools
 import logging
-from typing import Callable, List
+import warnings
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
 
 import numpy as np
 
@@ -7,12 +9,22 @@ from ..constraints.constraint_manager import ConstraintManager
 from ..handlers.archive import Archive
 from ..handlers.boundary_handler import StandardBH
 from ..handlers.inertia_handler import StandardIWH
+from ..handlers.initialisation_handler import StandardIH
 from ..handlers.velocity_handler import StandardVH
 from ..opt.base_swarm import BaseSwarm
 from ..swallows.mo_swallow import MOSwallow
 from ..utils.history import MOHistory
 from ..utils.reporter import Reporter
-from ..utils.termination_manager import IterationTerminationManager
+from ..utils.termination_manager import BaseTerminationManager, IterationTerminationManager
+
+
+class MOSnapshot(NamedTuple):
+
+    """State of an MOSwarm at the end of an iteration."""
+
+    iteration: int
+    archive: List[MOSwallow]
+    n_evaluations: int
 
 
 class MOSwarm(BaseSwarm):
@@ -53,18 +65,23 @@ class MOSwarm(BaseSwarm):
 
         self.n_objs = None
         self.archive = None
+        self.archive_cls = Archive
+        self.archive_limit = n_swallows
 
         self.iteration = 0
         self.n_iterations = n_iterations
 
         self.bh = StandardBH()
         self.vh = StandardVH()
+        self.ih = StandardIH()
         self.iwh = StandardIWH(self.w)
 
         self.history = MOHistory(self)
 
+        self._buffers = None
+
         self.constraint_manager = ConstraintManager(self)
-        self.termiation_manager = IterationTerminationManager(self)
+        self.termination_manager = IterationTerminationManager(self)
 
         self.rep.log(
             f'MOSwarm::__init__('
@@ -74,13 +91,29 @@ class MOSwarm(BaseSwarm):
             f')', lvl=logging.DEBUG
         )
 
+    @property
+    def termiation_manager(self) -> BaseTerminationManager:
+
+        """Deprecated alias of termination_manager."""
+
+        warnings.warn('termiation_manager is deprecated, use termination_manager.',
+                      DeprecationWarning, stacklevel=2)
+        return self.termination_manager
+
+    @termiation_manager.setter
+    def termiation_manager(self, manager: BaseTerminationManager) -> None:
+        warnings.warn('termiation_manager is deprecated, use termination_manager.',
+                      DeprecationWarning, stacklevel=2)
+        self.termination_manager = manager
+
     def reset_environment(self) -> None:
 
         """Responsible for resetting the optimisation environment."""
 
         self.iteration = 0
         self.population = []
-        self.archive = Archive(self.n_objs)
+        self.archive = self.archive_cls(self.n_objs)
+        self.reset_counters()
         self.rep.log('MOSwarm::reset_environment()', lvl=logging.DEBUG)
 
     def initialise_swarm(self) -> None:
@@ -89,8 +122,11 @@ class MOSwarm(BaseSwarm):
 
         self.population = []
 
+        positions, velocities = self.ih(self.bounds, self.n_swallows)
+
         for i in range(self.n_swallows):
-            _swallow = MOSwallow(self.bounds, self.n_objs)
+            _swallow = MOSwallow(self.bounds, self.n_objs,
+                                 positions[i], velocities[i])
             _swallow.swallow_id = i
             self.population.append(_swallow)
 
@@ -98,13 +134,68 @@ class MOSwarm(BaseSwarm):
 
     def initialise_archive(self) -> None:
 
-        """Instantiates an Archive instance."""
+        """Instantiates an archive of type archive_cls."""
 
-        self.archive = Archive(self.n_objs)
+        self.archive = self.archive_cls(self.n_objs)
         self.rep.log('MOSwarm::initialise_archive()', lvl=logging.DEBUG)
 
+    def state_dict(self) -> Dict[str, np.ndarray]:
+
+        """Captures the state required to continue the optimisation.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays holding the population, the archive, the history, the
+            state of the termination manager, the iteration, the evaluation
+            counters and the state of the random number generator.
+        """
+
+        state = super().state_dict()
+        state.update(self.history.state_dict())
+        state.update(self.termination_manager.state_dict())
+
+        members = self.archive.population if self.archive is not None else []
+        state.update(self._swallow_state(members, 'archive_'))
+        state['archive_sparsity'] = np.asarray([m.sparsity for m in members],
+                                               dtype=float)
+
+        if self.archive is not None:
+            state.update(self.archive.state_dict())
+
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+
+        """Restores state captured by state_dict().
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        """
+
+        self.n_objs = state['fitness'].shape[1]
+
+        members = [MOSwallow(self.bounds, self.n_objs)
+                   for _ in range(len(state['archive_position']))]
+        self._load_swallows(members, state, 'archive_')
+
+        for member, sparsity in zip(members, state['archive_sparsity']):
+            member.sparsity = float(sparsity)
+
+        self.initialise_archive()
+        self.archive.population = members
+        self.archive.load_state_dict(state)
+
+        self.history.load_state_dict(state)
+        self.termination_manager.load_state_dict(state)
+        super().load_state_dict(state)
+
     @staticmethod
-    def evaluate_fitness(swallow: MOSwallow, fns: List[Callable[[np.ndarray], np.ndarray]]) -> None:
+    def evaluate_fitness(swallow: MOSwallow,
+                         fns: List[Callable[[np.ndarray], np.ndarray]],
+                         position: Optional[np.ndarray] = None) -> None:
 
         """Assesses the fitness of the swallow.
 
@@ -114,10 +205,28 @@ class MOSwarm(BaseSwarm):
             Swallow for which to assess the fitness.
         fns : List[Callable[[Any], Any]]
             Functions to use in order to assess the fitness.
+        position : Optional[np.ndarray]
+            Decoded position at which to evaluate, swallow.position if None.
         """
 
+        if position is None:
+            position = swallow.position
+
         for idx, function in enumerate(fns):
-            swallow.fitness[idx] = function(swallow.position)
+            swallow.fitness[idx] = function(position)
+
+    def screened_fitness(self) -> List[float]:
+
+        """Fitness assigned to swallows which were screened out.
+
+        Returns
+        -------
+        List[float]
+            screen_penalty for each objective if set, otherwise NaN to mark
+            it not evaluated.
+        """
+
+        return [super().screened_fitness()] * self.n_objs
 
     def update_velocity(self, swallow: MOSwallow) -> None:
 
@@ -129,7 +238,11 @@ class MOSwarm(BaseSwarm):
             Swallow for which to update the velocity.
         """
 
-        _leader = self.archive.choose_leader()
+        # every swallow may have been infeasible so far, leaving no leaders
+        if self.archive.population:
+            _leader = self.archive.choose_leader()
+        else:
+            _leader = swallow
 
         def inertial():
             return self.w * swallow.velocity
@@ -151,6 +264,64 @@ class MOSwarm(BaseSwarm):
             lvl=logging.DEBUG
         )
 
+    def update_population(self) -> None:
+
+        """Updates the velocity of, and moves, every swallow at once.
+
+        Equivalent to calling update_velocity() and move() for each swallow,
+        but the population is gathered into preallocated (n, d) matrices so
+        that the velocity update is vectorised and each handler is called
+        once, in place.
+
+        A leader is still chosen from the archive for each swallow, and the
+        leader and the cognitive and social random numbers are drawn in the
+        same order as by update_velocity(), so the result is identical when
+        the boundary and velocity handlers are deterministic.
+        """
+
+        population = self.population
+        n_swallows = len(population)
+
+        if self._buffers is None or self._buffers[0].shape[0] != n_swallows:
+            shape = (n_swallows, len(self.lb))
+            self._buffers = tuple(np.empty(shape) for _ in range(5))
+
+        position, velocity, pbest_position, leader_position, scratch = self._buffers
+
+        r = np.empty((n_swallows, 2))
+
+        for idx, swallow in enumerate(population):
+            position[idx] = swallow.position
+            velocity[idx] = swallow.velocity
+            pbest_position[idx] = swallow.pbest_position
+
+            # every swallow may have been infeasible so far, leaving no leaders
+            if self.archive.population:
+                leader_position[idx] = self.archive.choose_leader().pbest_position
+            else:
+                leader_position[idx] = swallow.pbest_position
+
+            r[idx] = np.random.uniform(size=2)
+
+        velocity *= self.w
+
+        np.subtract(pbest_position, position, out=scratch)
+        scratch *= self.c1 * r[:, :1]
+        velocity += scratch
+
+        np.subtract(leader_position, position, out=scratch)
+        scratch *= self.c2 * r[:, 1:]
+        velocity += scratch
+
+        velocity = self.vh(velocity, out=velocity)
+
+        position += velocity
+        position = self.bh(position, out=position)
+
+        for idx, swallow in enumerate(population):
+            swallow.velocity[...] = velocity[idx]
+            swallow.position[...] = position[idx]
+
     @staticmethod
     def update_pbest(swallow: MOSwallow) -> None:
 
@@ -163,8 +334,8 @@ class MOSwarm(BaseSwarm):
         """
 
         if swallow.self_dominate():
-            swallow.pbest_position = swallow.position
-            swallow.pbest_fitness = swallow.fitness
+            swallow.pbest_position = swallow.position.copy()
+            swallow.pbest_fitness = list(swallow.fitness)
 
     def step_optimise(self, fns: List[Callable[[np.ndarray], np.ndarray]]) -> None:
 
@@ -176,46 +347,69 @@ class MOSwarm(BaseSwarm):
             List of functions to optimise for.
         """
 
-        self.w = self.iwh(self.iteration)
+        profiler = self.profiler
 
-        for swallow in self.population:
-            swallow.swallow_iteration = self.iteration
+        with profiler.phase('step'):
+            self.w = self.iwh(self.iteration)
 
-        for swallow in self.population:
-            self.evaluate_fitness(swallow, fns)
+            for swallow in self.population:
+                swallow.swallow_iteration = self.iteration
 
-            if self.constraint_manager.violates_position(swallow):
-                continue
+            with profiler.phase('screen'):
+                screened = self.screen_population()
+                evaluate = (self.population if screened is None else
+                            list(itertools.compress(self.population, screened)))
 
-            if self.constraint_manager.violates_fitness(swallow):
-                continue
+            with profiler.phase('evaluate'):
+                self.evaluate_population(evaluate, fns)
 
-            self.update_pbest(swallow)
+            with profiler.phase('constraints'):
+                feasible = self.constraint_manager.feasible_mask(
+                    self.population, screened
+                )
+                # screened swallows are already counted in n_screened
+                rejected = ~feasible if screened is None else screened & ~feasible
+                self.n_rejected += int(np.count_nonzero(rejected))
 
-        for swallow in self.population:
+            with profiler.phase('best'):
+                for swallow in itertools.compress(self.population, feasible):
+                    self.update_pbest(swallow)
 
-            if self.constraint_manager.violates_position(swallow):
-                continue
+            with profiler.phase('archive'):
+                for swallow in itertools.compress(self.population, feasible):
+                    self.archive.add_swallow(swallow)
 
-            if self.constraint_manager.violates_fitness(swallow):
-                continue
+                self.archive.pareto_front()
+                self.archive.assign_sparsity()
 
-            self.archive.add_swallow(swallow)
+                if self.archive_limit is not None:
+                    self.archive.sparsity_limit(n_limit=self.archive_limit)
 
-        self.archive.pareto_front()
-        self.archive.assign_sparsity()
-        self.archive.sparsity_limit(n_limit=self.n_swallows)
+            with profiler.phase('velocity'):
+                self.update_population()
 
-        for swallow in self.population:
-            self.update_velocity(swallow)
-            swallow.move(self.bh)
+            with profiler.phase('history'):
+                self.history.write_history()
 
-        self.history.write_history()
+            with profiler.phase('log'):
+                self.rep.log(
+                    f'iteration={self.iteration:05}\t'
+                    f'archive_length={len(self.archive.population):03}'
+                )
 
-        self.rep.log(
-            f'iteration={self.iteration:05}\t'
-            f'archive_length={len(self.archive.population):03}'
-        )
+    def snapshot(self) -> MOSnapshot:
+
+        """Summarises the current state of the optimisation.
+
+        Returns
+        -------
+        MOSnapshot
+            Snapshot referencing, rather than copying, the archive members.
+        """
+
+        return MOSnapshot(self.iteration,
+                          self.archive.population,
+                          self.n_evaluations)
 
     def optimise(self, fns: List[Callable[[np.ndarray], np.ndarray]]) -> None:
 
@@ -227,18 +421,63 @@ class MOSwarm(BaseSwarm):
             List of functions to optimise for.
         """
 
+        for _ in self.iter_optimise(fns):
+            pass
+
+    def iter_optimise(self, fns: List[Callable[[np.ndarray], np.ndarray]]) -> Iterator[MOSnapshot]:
+
+        """Runs the optimisation process, yielding after each iteration.
+
+        The optimisation can be stopped early by breaking out of the loop.
+
+        Parameters
+        ----------
+        fns : List[Callable[[np.ndarray], np.ndarray]]
+            List of functions to optimise for.
+
+        Yields
+        ------
+        MOSnapshot
+            Snapshot of the optimisation at the end of each iteration.
+        """
+
         self.reset_environment()
         self.n_objs = len(fns)
 
         self.initialise_swarm()
         self.initialise_archive()
 
-        while not self.termiation_manager.termination_check():
-            self.step_optimise(fns)
+        yield from self._iterate(fns)
+
+    def _iterate(self, fns: List[Callable[[np.ndarray], np.ndarray]]) -> Iterator[MOSnapshot]:
+
+        """Iterates from the current iteration until termination.
+
+        Parameters
+        ----------
+        fns : List[Callable[[np.ndarray], np.ndarray]]
+            List of functions to optimise for.
+
+        Yields
+        ------
+        MOSnapshot
+            Snapshot of the optimisation at the end of each iteration.
+        """
+
+        try:
+            while not self.termination_manager.termination_check():
+                self.step_optimise(fns)
+
+                if self.checkpointer(self.iteration):
+                    self.checkpointer.save(self)
 
-            if self.checkpointer(self.iteration):
-                self.save_swarm()
+                if self.metrics is not None:
+                    self.metrics.update()
 
-            self.iteration += 1
+                yield self.snapshot()
 
-        self.rep.log('Optimisation complete...')
+                self.iteration += 1
+        finally:
+            self.checkpointer.wait()
+            self.history.close()
+            self.rep.log('Optimisation complete...')
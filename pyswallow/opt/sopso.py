@@ -1,6 +1,7 @@
 import copy
+import itertools
 import logging
-from typing import Callable
+from typing import Callable, Dict, Iterator, NamedTuple, Optional, Tuple
 
 import numpy as np
 
@@ -8,6 +9,9 @@ from ..opt.base_swarm import BaseSwarm
 from ..constraints.constraint_manager import ConstraintManager
 from ..handlers.boundary_handler import StandardBH
 from ..handlers.inertia_handler import StandardIWH
+from ..handlers.initialisation_handler import StandardIH
+from ..handlers.parameter_handler import StandardPH
+from ..handlers.restart_handler import StandardRH
 from ..handlers.velocity_handler import StandardVH
 from ..swallows.so_swallow import Swallow
 from ..utils.history import SOHistory
@@ -15,6 +19,16 @@ from ..utils.reporter import Reporter
 from ..utils.termination_manager import IterationTerminationManager
 
 
+class SOSnapshot(NamedTuple):
+
+    """State of a Swarm at the end of an iteration."""
+
+    iteration: int
+    best_fitness: float
+    best_position: Optional[np.ndarray]
+    n_evaluations: int
+
+
 class Swarm(BaseSwarm):
 
     def __init__(self,
@@ -58,11 +72,16 @@ class Swarm(BaseSwarm):
 
         self.bh = StandardBH()
         self.vh = StandardVH()
+        self.ih = StandardIH()
         self.iwh = StandardIWH(self.w)
+        self.ph = StandardPH()
+        self.rh = StandardRH()
 
         self.history = SOHistory(self)
 
-        self.constraints_manager = ConstraintManager(self)
+        self._buffers = None
+
+        self.constraint_manager = ConstraintManager(self)
         self.termination_manager = IterationTerminationManager(self)
 
         self.rep.log(
@@ -79,6 +98,8 @@ class Swarm(BaseSwarm):
         self.iteration = 0
         self.gbest_swallow = None
         self.population = []
+        self.reset_counters()
+        self.ph.reset()
         self.rep.log('Swarm::reset_environment()', lvl=logging.DEBUG)
 
     def initialise_swarm(self) -> None:
@@ -87,15 +108,79 @@ class Swarm(BaseSwarm):
 
         self.population = []
 
+        positions, velocities = self.ih(self.bounds, self.n_swallows)
+
         for i in range(self.n_swallows):
-            _swallow = Swallow(self.bounds)
+            _swallow = Swallow(self.bounds, positions[i], velocities[i])
             _swallow.swallow_id = i
             self.population.append(_swallow)
 
         self.rep.log('Swarm::initialise_swarm()', lvl=logging.DEBUG)
 
+    def restart(self, n_swallows: int) -> None:
+
+        """Reinitialises the population, keeping the gbest_swallow.
+
+        Parameters
+        ----------
+        n_swallows : int
+            Number of swallows in the new population.
+        """
+
+        self.initialise_population(n_swallows)
+        self.rep.log(
+            f'Swarm::restart(n_swallows={n_swallows})\t'
+            f'n_restarts={self.n_restarts}'
+        )
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+
+        """Captures the state required to continue the optimisation.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays holding the population, gbest_swallow, the history, the
+            state of the parameter handler and termination manager, the
+            iteration, the evaluation counters and the state of the random
+            number generator.
+        """
+
+        state = super().state_dict()
+        state.update(self.history.state_dict())
+        state.update(self.termination_manager.state_dict())
+        state.update(self.ph.state_dict())
+
+        if self.gbest_swallow is not None:
+            state.update(self._swallow_state([self.gbest_swallow], 'gbest_'))
+
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+
+        """Restores state captured by state_dict().
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        """
+
+        self.gbest_swallow = None
+
+        if 'gbest_position' in state:
+            self.gbest_swallow = Swallow(self.bounds)
+            self._load_swallows([self.gbest_swallow], state, 'gbest_')
+
+        self.history.load_state_dict(state)
+        self.ph.load_state_dict(state)
+        self.termination_manager.load_state_dict(state)
+        super().load_state_dict(state)
+
     @staticmethod
-    def evaluate_fitness(swallow: Swallow, fn: Callable[[np.ndarray], np.ndarray]) -> None:
+    def evaluate_fitness(swallow: Swallow,
+                         fn: Callable[[np.ndarray], np.ndarray],
+                         position: Optional[np.ndarray] = None) -> None:
 
         """Assesses the fitness of the swallow.
 
@@ -105,9 +190,11 @@ class Swarm(BaseSwarm):
             Swallow for which to assess the fitness.
         fn : Callable[[np.ndarray], np.ndarray]
             Function to use in order to assess the fitness.
+        position : Optional[np.ndarray]
+            Decoded position at which to evaluate, swallow.position if None.
         """
 
-        swallow.fitness = fn(swallow.position)
+        swallow.fitness = fn(swallow.position if position is None else position)
 
     def update_velocity(self, swallow: Swallow) -> None:
 
@@ -126,9 +213,15 @@ class Swarm(BaseSwarm):
             return (self.c1 * np.random.uniform()
                     * (swallow.pbest_position - swallow.position))
 
+        # every swallow may have been infeasible so far, leaving no gbest
+        if self.gbest_swallow is not None:
+            _leader = self.gbest_swallow.position
+        else:
+            _leader = swallow.pbest_position
+
         def social() -> np.ndarray:
             return (self.c2 * np.random.uniform()
-                    * (self.gbest_swallow.position - swallow.position))
+                    * (_leader - swallow.position))
 
         swallow.velocity = inertial() + cognitive() + social()
         swallow.velocity = self.vh(swallow.velocity)
@@ -139,6 +232,69 @@ class Swarm(BaseSwarm):
             lvl=logging.DEBUG
         )
 
+    def update_population(self) -> None:
+
+        """Updates the velocity of, and moves, every swallow at once.
+
+        Equivalent to calling update_velocity() and move() for each swallow,
+        but the population is gathered into preallocated (n, d) matrices so
+        that the velocity update is vectorised and each handler is called
+        once, in place.
+
+        The cognitive and social random numbers are drawn in the same order
+        as by update_velocity(), so the result is identical when the
+        boundary and velocity handlers are deterministic. Handlers which
+        draw random numbers, such as RandomBH, draw them once for the whole
+        population rather than between swallows, so the results then agree
+        only in distribution.
+
+        The coefficients are provided by the parameter handler, ph, either
+        as scalars or as one value per swallow.
+        """
+
+        population = self.population
+        n_swallows = len(population)
+
+        if self._buffers is None or self._buffers[0].shape[0] != n_swallows:
+            shape = (n_swallows, len(self.lb))
+            self._buffers = tuple(np.empty(shape) for _ in range(4))
+
+        position, velocity, pbest_position, scratch = self._buffers
+
+        for idx, swallow in enumerate(population):
+            position[idx] = swallow.position
+            velocity[idx] = swallow.velocity
+            pbest_position[idx] = swallow.pbest_position
+
+        w, c1, c2 = (np.reshape(c, (-1, 1)) if np.ndim(c) else c
+                     for c in self.ph(self, position))
+
+        r = np.random.uniform(size=(n_swallows, 2))
+
+        np.multiply(velocity, w, out=velocity)
+
+        np.subtract(pbest_position, position, out=scratch)
+        scratch *= c1 * r[:, :1]
+        velocity += scratch
+
+        # every swallow may have been infeasible so far, leaving no gbest,
+        # in which case each swallow is guided by its own pbest
+        if self.gbest_swallow is not None:
+            np.subtract(self.gbest_swallow.position, position, out=scratch)
+        else:
+            np.subtract(pbest_position, position, out=scratch)
+        scratch *= c2 * r[:, 1:]
+        velocity += scratch
+
+        velocity = self.vh(velocity, out=velocity)
+
+        position += velocity
+        position = self.bh(position, out=position)
+
+        for idx, swallow in enumerate(population):
+            swallow.velocity[...] = velocity[idx]
+            swallow.position[...] = position[idx]
+
     @staticmethod
     def pbest_update(swallow: Swallow) -> None:
 
@@ -152,7 +308,7 @@ class Swarm(BaseSwarm):
 
         if swallow.fitness < swallow.pbest_fitness:
             swallow.pbest_fitness = swallow.fitness
-            swallow.pbest_position = swallow.position
+            swallow.pbest_position = swallow.position.copy()
 
     def gbest_update(self, swallow: Swallow) -> None:
 
@@ -184,37 +340,106 @@ class Swarm(BaseSwarm):
             Funnction to optimise for.
         """
 
-        self.w = self.iwh(self.iteration)
+        profiler = self.profiler
+
+        with profiler.phase('step'):
+            self.w = self.iwh(self.iteration)
+
+            for swallow in self.population:
+                swallow.swallow_iteration = self.iteration
+
+            with profiler.phase('screen'):
+                screened = self.screen_population()
+                evaluate = (self.population if screened is None else
+                            list(itertools.compress(self.population, screened)))
+
+            with profiler.phase('evaluate'):
+                self.evaluate_population(evaluate, fn)
+
+            with profiler.phase('constraints'):
+                feasible = self.constraint_manager.feasible_mask(
+                    self.population, screened
+                )
+                # screened swallows are already counted in n_screened
+                rejected = ~feasible if screened is None else screened & ~feasible
+                self.n_rejected += int(np.count_nonzero(rejected))
+
+            with profiler.phase('best'):
+                for swallow in itertools.compress(self.population, feasible):
+                    self.gbest_update(swallow)
+                    self.pbest_update(swallow)
+
+            with profiler.phase('velocity'):
+                self.update_population()
 
-        for swallow in self.population:
-            swallow.swallow_iteration = self.iteration
+            # only the restart itself is timed, so that the phase is
+            # recorded once for each restart rather than every iteration
+            n_restart = self.rh(self)
+            if n_restart is not None:
+                self.n_restarts += 1
 
-        for swallow in self.population:
-            self.evaluate_fitness(swallow, fn)
+            with profiler.phase('history'):
+                self.history.write_history()
 
-            if self.constraints_manager.violates_position(swallow):
-                continue
+            with profiler.phase('log'):
+                self.log_iteration()
 
-            if self.constraints_manager.violates_fitness(swallow):
-                continue
+            if n_restart is not None:
+                with profiler.phase('restart'):
+                    self.restart(n_restart)
 
-            self.gbest_update(swallow)
-            self.pbest_update(swallow)
+    def log_iteration(self) -> None:
 
-        for swallow in self.population:
-            self.update_velocity(swallow)
-            swallow.move(self.bh)
+        """Logs the progress of the current iteration."""
 
-        self.history.write_history()
+        mean_fitness = self.history.last('mean_fitness')
+        best_fitness, best_position = self.best()
 
-        mean_fitness = np.mean([s.fitness for s in self.population])
         self.rep.log(
             f'iteration={self.iteration:05}\t'
             f'mean_fitness={mean_fitness:.3f}\t'
-            f'gbest_fitness={self.gbest_swallow.fitness:.3f}\t'
-            f'gbest_position={self.gbest_swallow.position}'
+            f'gbest_fitness={best_fitness:.3f}\t'
+            f'gbest_position={best_position}'
         )
 
+    def best(self) -> Tuple[float, Optional[np.ndarray]]:
+
+        """Fitness and position of the gbest_swallow.
+
+        Returns
+        -------
+        fitness : float
+            Fitness of the gbest_swallow, NaN if no swallow has been
+            feasible yet.
+        position : Optional[np.ndarray]
+            Position of the gbest_swallow, None if no swallow has been
+            feasible yet.
+        """
+
+        if self.gbest_swallow is None:
+            return float('nan'), None
+
+        return self.gbest_swallow.fitness, self.gbest_swallow.position
+
+    def snapshot(self) -> SOSnapshot:
+
+        """Summarises the current state of the optimisation.
+
+        Returns
+        -------
+        SOSnapshot
+            Snapshot referencing, rather than copying, the state. The best
+            fitness is NaN, and the best position None, until a swallow
+            has been feasible.
+        """
+
+        best_fitness, best_position = self.best()
+
+        return SOSnapshot(self.iteration,
+                          best_fitness,
+                          best_position,
+                          self.n_evaluations)
+
     def optimise(self, fn: Callable[[np.ndarray], np.ndarray]) -> None:
 
         """Runs the entire optimisation process.
@@ -225,15 +450,60 @@ class Swarm(BaseSwarm):
             Function to optimise for.
         """
 
+        for _ in self.iter_optimise(fn):
+            pass
+
+    def iter_optimise(self, fn: Callable[[np.ndarray], np.ndarray]) -> Iterator[SOSnapshot]:
+
+        """Runs the optimisation process, yielding after each iteration.
+
+        The optimisation can be stopped early by breaking out of the loop.
+
+        Parameters
+        ----------
+        fn : Callable[[np.ndarray], np.ndarray]
+            Function to optimise for.
+
+        Yields
+        ------
+        SOSnapshot
+            Snapshot of the optimisation at the end of each iteration.
+        """
+
         self.reset_environment()
         self.initialise_swarm()
 
-        while not self.termination_manager.termination_check():
-            self.step_optimise(fn)
+        yield from self._iterate(fn)
+
+    def _iterate(self, fn: Callable[[np.ndarray], np.ndarray]) -> Iterator[SOSnapshot]:
+
+        """Iterates from the current iteration until termination.
+
+        Parameters
+        ----------
+        fn : Callable[[np.ndarray], np.ndarray]
+            Function to optimise for.
+
+        Yields
+        ------
+        SOSnapshot
+            Snapshot of the optimisation at the end of each iteration.
+        """
+
+        try:
+            while not self.termination_manager.termination_check():
+                self.step_optimise(fn)
+
+                if self.checkpointer(self.iteration):
+                    self.checkpointer.save(self)
 
-            if self.checkpointer(self.iteration):
-                self.save_swarm()
+                if self.metrics is not None:
+                    self.metrics.update()
 
-            self.iteration += 1
+                yield self.snapshot()
 
-        self.rep.log('Optimisation complete...')
+                self.iteration += 1
+        finally:
+            self.checkpointer.wait()
+            self.history.close()
+            self.rep.log('Optimisation complete...')
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import NoReturn
+from typing import NoReturn, Optional
 
 import numpy as np
 
@@ -8,7 +8,10 @@ from ..handlers.base_handler import BaseHandler
 
 class BaseSwallow(ABC):
 
-    def __init__(self, bounds: dict) -> None:
+    def __init__(self,
+                 bounds: dict,
+                 position: Optional[np.ndarray] = None,
+                 velocity: Optional[np.ndarray] = None) -> None:
 
         """BaseSwallow Class.
 
@@ -16,6 +19,10 @@ class BaseSwallow(ABC):
         ----------
         bounds : dict
             Bounds to impose on the search space.
+        position : Optional[np.ndarray]
+            Initial position, drawn uniformly within the bounds if None.
+        velocity : Optional[np.ndarray]
+            Initial velocity, drawn uniformly within the bounds if None.
         """
 
         if not isinstance(bounds, dict):
@@ -27,11 +34,18 @@ class BaseSwallow(ABC):
         self.lb = _bounds[:, 0]
         self.ub = _bounds[:, 1]
 
-        self.position = np.random.uniform(self.lb, self.ub)
-        self.velocity = np.random.uniform(self.lb, self.ub)
+        if position is None:
+            self.position = np.random.uniform(self.lb, self.ub)
+        else:
+            self.position = np.array(position, dtype=float)
+
+        if velocity is None:
+            self.velocity = np.random.uniform(self.lb, self.ub)
+        else:
+            self.velocity = np.array(velocity, dtype=float)
         self.fitness = None
 
-        self.pbest_position = self.position
+        self.pbest_position = self.position.copy()
         self.pbest_fitness = float('inf')
 
         self.swallow_id = None
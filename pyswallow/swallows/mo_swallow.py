@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+from typing import Optional
+
+import numpy as np
+
 from .base_swallow import BaseSwallow
 from ..handlers.boundary_handler import BaseBoundaryHandler
 
 
 class MOSwallow(BaseSwallow):
 
-    def __init__(self, bounds: dict, n_obj: int) -> None:
+    def __init__(self,
+                 bounds: dict,
+                 n_obj: int,
+                 position: Optional[np.ndarray] = None,
+                 velocity: Optional[np.ndarray] = None) -> None:
 
         """MOSwallow Class.
 
@@ -16,9 +24,13 @@ class MOSwallow(BaseSwallow):
             Provides the upper and lower bounds of the search space.
         n_obj : int
             Number of objectives.
+        position : Optional[np.ndarray]
+            Initial position, drawn uniformly within the bounds if None.
+        velocity : Optional[np.ndarray]
+            Initial velocity, drawn uniformly within the bounds if None.
         """
 
-        super().__init__(bounds)
+        super().__init__(bounds, position, velocity)
         self.n_obj = n_obj
 
         self.fitness = [None] * n_obj
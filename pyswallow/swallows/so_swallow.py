@@ -1,10 +1,17 @@
+from typing import Optional
+
+import numpy as np
+
 from .base_swallow import BaseSwallow
 from ..handlers.boundary_handler import BaseBoundaryHandler
 
 
 class Swallow(BaseSwallow):
 
-    def __init__(self, bounds: dict) -> None:
+    def __init__(self,
+                 bounds: dict,
+                 position: Optional[np.ndarray] = None,
+                 velocity: Optional[np.ndarray] = None) -> None:
 
         """Swallow Class.
 
@@ -12,9 +19,13 @@ class Swallow(BaseSwallow):
         ----------
         bounds : dict
             Provides the upper and lower bounds of the search space.
+        position : Optional[np.ndarray]
+            Initial position, drawn uniformly within the bounds if None.
+        velocity : Optional[np.ndarray]
+            Initial velocity, drawn uniformly within the bounds if None.
         """
 
-        super().__init__(bounds)
+        super().__init__(bounds, position, velocity)
 
     def move(self, bh: BaseBoundaryHandler) -> None:
 
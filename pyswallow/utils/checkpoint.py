@@ -1,4 +1,28 @@
-from typing import Optional, Union
+import os
+import shutil
+import threading
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+
+def load_checkpoint(path: str) -> Dict[str, np.ndarray]:
+
+    """Reads a checkpoint written by a Checkpointer.
+
+    Parameters
+    ----------
+    path : str
+        Path of the checkpoint.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        State suitable for the swarm's load_state_dict().
+    """
+
+    with np.load(path) as data:
+        return {k: data[k] for k in data.files}
 
 
 class Checkpointer:
@@ -6,10 +30,18 @@ class Checkpointer:
     def __init__(self,
                  freq: Union[int, None] = None,
                  save_final: Union[bool, None] = False,
-                 n_iterations: Optional[int] = None) -> None:
+                 n_iterations: Optional[int] = None,
+                 path: str = 'checkpoint.npz',
+                 keep: int = 1,
+                 background: bool = True) -> None:
 
         """Checkpointer Class.
 
+        Checkpoints hold only the state returned by the swarm's
+        state_dict(), stored as an uncompressed .npz file. Each checkpoint
+        is written to a temporary file which then atomically replaces the
+        previous checkpoint, so an interrupted write never corrupts it.
+
         Parameters
         ----------
         freq : Union[int, None]
@@ -18,15 +50,32 @@ class Checkpointer:
             If True, the final iteration will be checkpointed.
         n_iterations : Optional[int]
             Number of iterations.
+        path : str
+            Path to which checkpoints are written.
+        keep : int
+            Number of generations of checkpoint to keep, older generations
+            are stored at path.1, path.2, ...
+        background : bool
+            If True, checkpoints are written from a background thread.
         """
 
         self.freq = freq
         self.save_final = save_final
         self.n_iterations = n_iterations
 
+        self.path = path
+        self.keep = keep
+        self.background = background
+
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
         if self.save_final and n_iterations is None:
             raise ValueError('If save_final=True, n_iterations must be defined.')
 
+        if keep < 1:
+            raise ValueError('keep must be at least 1.')
+
     def __call__(self, iteration: int) -> bool:
 
         if self.freq is None:
@@ -38,3 +87,117 @@ class Checkpointer:
             return True
         else:
             return False
+
+    def save(self, swarm) -> None:
+
+        """Writes a checkpoint of the swarm.
+
+        The state is captured immediately, only writing it to disk happens
+        in the background. A checkpoint still being written is completed
+        before the next is started.
+
+        Parameters
+        ----------
+        swarm : BaseSwarm
+            Swarm to checkpoint.
+        """
+
+        state = swarm.state_dict()
+
+        self.wait()
+
+        if self.background:
+            self._thread = threading.Thread(target=self._write,
+                                            args=(state,),
+                                            name='Checkpointer',
+                                            daemon=True)
+            self._thread.start()
+        else:
+            self._write(state)
+            self._raise_error()
+
+    def wait(self) -> None:
+
+        """Blocks until any checkpoint being written is on disk."""
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self._raise_error()
+
+    def load(self, generation: int = 0) -> Dict[str, np.ndarray]:
+
+        """Reads a checkpoint written by the checkpointer.
+
+        Parameters
+        ----------
+        generation : int
+            Generation to read, 0 for the most recent checkpoint.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            State suitable for the swarm's load_state_dict().
+        """
+
+        return load_checkpoint(self._generation(generation))
+
+    def _write(self, state: Dict[str, np.ndarray]) -> None:
+
+        """Writes state to a temporary file and moves it into place.
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to write.
+        """
+
+        tmp_path = f'{self.path}.tmp'
+        prev_path = f'{self.path}.prev'
+
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **state)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # the previous checkpoint is linked aside before it is replaced,
+            # so that a checkpoint exists at path throughout the rotation
+            rotate = self.keep > 1 and os.path.exists(self.path)
+            if rotate:
+                if os.path.exists(prev_path):
+                    os.remove(prev_path)
+                try:
+                    os.link(self.path, prev_path)
+                except OSError:
+                    shutil.copy2(self.path, prev_path)
+
+            os.replace(tmp_path, self.path)
+
+            if rotate:
+                for generation in range(self.keep - 1, 1, -1):
+                    if os.path.exists(self._generation(generation - 1)):
+                        os.replace(self._generation(generation - 1),
+                                   self._generation(generation))
+
+                os.replace(prev_path, self._generation(1))
+        except Exception as e:
+            # raised from wait(), as the background thread cannot raise
+            self._error = e
+
+    def _generation(self, generation: int) -> str:
+        return self.path if generation == 0 else f'{self.path}.{generation}'
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise IOError(f'failed to write checkpoint to {self.path}') from error
+
+    def __getstate__(self) -> dict:
+        self.wait()
+        return {k: v for k, v in self.__dict__.items() if k != '_thread'}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._thread = None
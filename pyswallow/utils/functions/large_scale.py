@@ -0,0 +1,300 @@
+import abc
+import os
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+_STREAMS = {'shift': 0, 'rotation': 1, 'permutation': 2}
+
+
+def default_cache_dir() -> str:
+
+    """Directory in which transforms are cached.
+
+    Returns
+    -------
+    str
+        PYSWALLOW_CACHE_DIR if set, otherwise ~/.cache/pyswallow.
+    """
+
+    return os.environ.get(
+        'PYSWALLOW_CACHE_DIR',
+        os.path.join(os.path.expanduser('~'), '.cache', 'pyswallow')
+    )
+
+
+def cached_transform(name: str,
+                     seed: int,
+                     generate: Callable[[np.random.Generator], np.ndarray],
+                     cache_dir: Optional[str] = None) -> np.ndarray:
+
+    """Loads a transform from the cache, generating it on first use.
+
+    Transforms are generated from a random stream determined only by the
+    kind of transform and the seed, so the global random state is neither
+    used nor affected. They are saved as .npy files, written to a temporary
+    file and atomically moved into place, and are loaded memory-mapped.
+
+    Parameters
+    ----------
+    name : str
+        Name of the transform, of the form '<kind>_<shape>'.
+    seed : int
+        Seed from which the transform is generated.
+    generate : Callable[[np.random.Generator], np.ndarray]
+        Generates the transform from a random generator.
+    cache_dir : Optional[str]
+        Directory of the cache, default_cache_dir() if None.
+
+    Returns
+    -------
+    np.ndarray
+        Read-only, memory-mapped transform.
+    """
+
+    cache_dir = cache_dir or default_cache_dir()
+    path = os.path.join(cache_dir, f'{name}_seed{seed}.npy')
+
+    if not os.path.exists(path):
+        kind = name.split('_')[0]
+        rng = np.random.default_rng([seed, _STREAMS[kind]])
+        transform = generate(rng)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+
+        with open(tmp_path, 'wb') as f:
+            np.save(f, transform)
+
+        os.replace(tmp_path, path)
+
+    return np.load(path, mmap_mode='r')
+
+
+def random_rotation(rng: np.random.Generator, n: int, size: int = None) -> np.ndarray:
+
+    """Draws rotation matrices uniformly from the orthogonal group.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        Random generator to draw from.
+    n : int
+        Dimension of each rotation.
+    size : int
+        Number of rotations, a single matrix is returned if None.
+
+    Returns
+    -------
+    np.ndarray
+        Orthogonal matrices, shape (n, n) or (size, n, n).
+    """
+
+    gaussian = rng.standard_normal((size or 1, n, n))
+    q, r = np.linalg.qr(gaussian)
+
+    # correcting the signs makes the distribution uniform (Haar)
+    q *= np.sign(np.diagonal(r, axis1=-2, axis2=-1))[:, np.newaxis, :]
+
+    return q if size else q[0]
+
+
+class LargeScaleProblem(abc.ABC):
+
+    lower = -100.0
+    upper = 100.0
+
+    def __init__(self,
+                 n_dimensions: int = 1000,
+                 seed: int = 0,
+                 rotate: bool = True,
+                 n_groups: int = 0,
+                 group_size: int = 50,
+                 cache_dir: Optional[str] = None) -> None:
+
+        """Large Scale Problem Class.
+
+        Shifted, and optionally rotated, benchmark problem in the style of
+        the CEC large-scale global optimisation suites. The optimum, 0.0,
+        is moved to a random shift vector within the bounds.
+
+        When n_groups is zero the whole space is rotated. Otherwise the
+        problem is partially separable: the variables are randomly permuted,
+        and each of the first n_groups groups of group_size variables is
+        rotated independently, while the remaining variables are left
+        separable.
+
+        Parameters
+        ----------
+        n_dimensions : int
+            Number of dimensions.
+        seed : int
+            Seed from which the transforms are generated.
+        rotate : bool
+            If False, the problem is only shifted.
+        n_groups : int
+            Number of independently rotated groups of variables.
+        group_size : int
+            Number of variables in each group.
+        cache_dir : Optional[str]
+            Directory in which transforms are cached, default_cache_dir()
+            if None.
+        """
+
+        if n_groups * group_size > n_dimensions:
+            raise ValueError('n_groups * group_size must not exceed n_dimensions.')
+
+        self.n_dimensions = n_dimensions
+        self.seed = seed
+        self.rotate = rotate
+        self.n_groups = n_groups
+        self.group_size = group_size
+        self.cache_dir = cache_dir
+
+        d = n_dimensions
+        scale = 0.8 * min(abs(self.lower), abs(self.upper))
+
+        self.shift = scale * cached_transform(
+            f'shift_{d}', seed,
+            lambda rng: rng.uniform(-1.0, 1.0, size=d), cache_dir
+        )
+
+        self.rotation = None
+        self.permutation = None
+
+        if rotate and n_groups:
+            self.permutation = cached_transform(
+                f'permutation_{d}', seed, lambda rng: rng.permutation(d),
+                cache_dir
+            )
+            self.rotation = cached_transform(
+                f'rotation_{n_groups}x{group_size}', seed,
+                lambda rng: random_rotation(rng, group_size, n_groups),
+                cache_dir
+            )
+        elif rotate:
+            self.rotation = cached_transform(
+                f'rotation_{d}', seed, lambda rng: random_rotation(rng, d),
+                cache_dir
+            )
+
+    @property
+    def bounds(self) -> dict:
+
+        """Bounds of the search space, in the form expected by the swarms."""
+
+        return {f'x{i}': [self.lower, self.upper]
+                for i in range(self.n_dimensions)}
+
+    @staticmethod
+    @abc.abstractmethod
+    def base(z: np.ndarray) -> np.ndarray:
+
+        """Evaluates the untransformed function along the last axis."""
+
+        raise NotImplementedError('LargeScaleProblem::base()')
+
+    def __call__(self, position: np.ndarray) -> Union[float, np.ndarray]:
+
+        """Evaluates the problem.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position at which to evaluate the problem, shape (d,), or a
+            batch of positions, shape (n, d).
+
+        Returns
+        -------
+        Union[float, np.ndarray]
+            Function evaluation, of shape (n,) for a batch.
+        """
+
+        position = np.asarray(position, dtype=float)
+        val = self.evaluate(np.atleast_2d(position))
+
+        return val if position.ndim == 2 else float(val[0])
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+
+        """Evaluates a batch of positions.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions at which to evaluate the problem, shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Function evaluations, shape (n,).
+        """
+
+        z = positions - self.shift
+
+        if self.rotation is None:
+            return self.base(z)
+
+        if self.permutation is None:
+            return self.base(z @ self.rotation.T)
+
+        z = z[:, self.permutation]
+
+        n_grouped = self.n_groups * self.group_size
+        grouped = z[:, :n_grouped].reshape(len(z), self.n_groups,
+                                           self.group_size)
+        rotated = np.einsum('ngj,gij->ngi', grouped, self.rotation)
+
+        val = self.base(rotated).sum(axis=-1)
+
+        if n_grouped < self.n_dimensions:
+            val += self.base(z[:, n_grouped:])
+
+        return val
+
+
+class Elliptic(LargeScaleProblem):
+
+    """High-conditioned elliptic function, unimodal."""
+
+    @staticmethod
+    def base(z: np.ndarray) -> np.ndarray:
+        dims = z.shape[-1]
+        exponents = 6.0 * np.arange(dims) / max(dims - 1, 1)
+        return (10.0 ** exponents * np.square(z)).sum(axis=-1)
+
+
+class Rastrigin(LargeScaleProblem):
+
+    """Rastrigin function, multimodal."""
+
+    lower = -5.0
+    upper = 5.0
+
+    @staticmethod
+    def base(z: np.ndarray) -> np.ndarray:
+        return (np.square(z) - 10.0 * np.cos(2.0 * np.pi * z) + 10.0).sum(axis=-1)
+
+
+class Ackley(LargeScaleProblem):
+
+    """Ackley function, multimodal."""
+
+    lower = -32.0
+    upper = 32.0
+
+    @staticmethod
+    def base(z: np.ndarray) -> np.ndarray:
+        return (-20.0 * np.exp(-0.2 * np.sqrt(np.square(z).mean(axis=-1)))
+                - np.exp(np.cos(2.0 * np.pi * z).mean(axis=-1))
+                + 20.0
+                + np.e)
+
+
+class Schwefel12(LargeScaleProblem):
+
+    """Schwefel's problem 1.2, unimodal and non-separable."""
+
+    @staticmethod
+    def base(z: np.ndarray) -> np.ndarray:
+        return np.square(np.cumsum(z, axis=-1)).sum(axis=-1)
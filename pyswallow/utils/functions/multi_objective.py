@@ -1,4 +1,5 @@
-from typing import Callable, List, Tuple
+import abc
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -78,3 +79,423 @@ def schaffer_n1() -> List[Callable[[np.ndarray], np.ndarray]]:
         return np.square(position[0] - 2)
 
     return [func_one, func_two]
+
+
+_FRONTS: Dict[Tuple[str, int, int], np.ndarray] = {}
+
+
+def _comb(n: int, k: int) -> int:
+
+    """Binomial coefficient, n choose k, as math.comb() on Python 3.8+."""
+
+    if k < 0 or k > n:
+        return 0
+
+    k = min(k, n - k)
+    result = 1
+
+    for i in range(1, k + 1):
+        result = result * (n - k + i) // i
+
+    return result
+
+
+def das_dennis(n_objs: int, n_partitions: int) -> np.ndarray:
+
+    """Uniformly spaced points on the unit simplex.
+
+    Parameters
+    ----------
+    n_objs : int
+        Number of objectives, the dimension of the simplex plus one.
+    n_partitions : int
+        Number of divisions along each objective.
+
+    Returns
+    -------
+    np.ndarray
+        Points whose coordinates are non-negative multiples of
+        1 / n_partitions summing to one, shape
+        (_comb(n_partitions + n_objs - 1, n_objs - 1), n_objs).
+    """
+
+    def compositions(total: int, parts: int) -> List[List[int]]:
+        if parts == 1:
+            return [[total]]
+        return [[first] + rest
+                for first in range(total, -1, -1)
+                for rest in compositions(total - first, parts - 1)]
+
+    points = np.array(compositions(n_partitions, n_objs), dtype=float)
+    return points / max(n_partitions, 1)
+
+
+def _n_partitions(n_objs: int, n_points: int) -> int:
+    n_partitions = 1
+    while _comb(n_partitions + n_objs, n_objs - 1) <= n_points:
+        n_partitions += 1
+    return n_partitions
+
+
+class _Objective:
+
+    __slots__ = ('problem', 'idx')
+
+    def __init__(self, problem: 'MOProblem', idx: int) -> None:
+        self.problem = problem
+        self.idx = idx
+
+    def __call__(self, position: np.ndarray) -> float:
+        return float(self.problem.evaluate_cached(position)[self.idx])
+
+
+class MOProblem(abc.ABC):
+
+    def __init__(self, n_variables: int, n_objs: int) -> None:
+
+        """Multi-Objective Problem Class.
+
+        Vectorised test problem which evaluates every objective, for a whole
+        population, in one call, and provides a sample of its Pareto front.
+
+        Parameters
+        ----------
+        n_variables : int
+            Number of decision variables.
+        n_objs : int
+            Number of objectives.
+        """
+
+        self.n_variables = n_variables
+        self.n_objs = n_objs
+
+        self.lower = np.zeros(n_variables)
+        self.upper = np.ones(n_variables)
+
+        self._last_position: Optional[bytes] = None
+        self._last_fitness: Optional[np.ndarray] = None
+
+    @property
+    def bounds(self) -> dict:
+
+        """Bounds of the search space, in the form expected by the swarms."""
+
+        return {f'x{i}': [float(lb), float(ub)]
+                for i, (lb, ub) in enumerate(zip(self.lower, self.upper))}
+
+    @property
+    def objectives(self) -> List[Callable[[np.ndarray], float]]:
+
+        """Per-objective functions, as taken by MOSwarm.optimise().
+
+        The objectives share one evaluation of each position, so the problem
+        is only evaluated once per swallow.
+        """
+
+        return [_Objective(self, idx) for idx in range(self.n_objs)]
+
+    def __call__(self, position: np.ndarray) -> np.ndarray:
+
+        """Evaluates the problem.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position at which to evaluate the problem, shape (d,), or a
+            batch of positions, shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Objective values, shape (m,), or (n, m) for a batch.
+        """
+
+        position = np.asarray(position, dtype=float)
+        fitness = self.evaluate(np.atleast_2d(position))
+
+        return fitness if position.ndim == 2 else fitness[0]
+
+    def evaluate_cached(self, position: np.ndarray) -> np.ndarray:
+
+        """Evaluates a single position, reusing the previous evaluation.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position at which to evaluate the problem, shape (d,).
+
+        Returns
+        -------
+        np.ndarray
+            Objective values, shape (m,).
+        """
+
+        key = np.asarray(position, dtype=float).tobytes()
+
+        if key != self._last_position:
+            self._last_fitness = self(position)
+            self._last_position = key
+
+        return self._last_fitness
+
+    @abc.abstractmethod
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+
+        """Evaluates a batch of positions, shape (n, d), returning (n, m)."""
+
+        raise NotImplementedError('MOProblem::evaluate()')
+
+    @abc.abstractmethod
+    def _sample_front(self, n_points: int) -> np.ndarray:
+        raise NotImplementedError('MOProblem::_sample_front()')
+
+    def pareto_front(self, n_points: int = 1000) -> np.ndarray:
+
+        """Sample of the true Pareto front.
+
+        Samples are computed analytically on first use and cached, so that
+        repeated quality measurements do not regenerate them.
+
+        Parameters
+        ----------
+        n_points : int
+            Approximate number of points, the sample holds at most n_points.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only points on the front, shape (<= n_points, m).
+        """
+
+        key = (type(self).__name__, self.n_objs, n_points)
+
+        front = _FRONTS.get(key)
+        if front is None:
+            front = self._sample_front(n_points)
+            front.setflags(write=False)
+            _FRONTS[key] = front
+
+        return front
+
+
+class ZDT(MOProblem):
+
+    def __init__(self, n_variables: int = 30) -> None:
+
+        """ZDT Problem Class.
+
+        Bi-objective problems of Zitzler, Deb & Thiele, where the first
+        objective depends only on the first variable and the remaining
+        variables control the distance to the front.
+
+        Parameters
+        ----------
+        n_variables : int
+            Number of decision variables, at least two.
+        """
+
+        if n_variables < 2:
+            raise ValueError('ZDT problems require at least two variables.')
+
+        super().__init__(n_variables, 2)
+
+    def f1(self, x: np.ndarray) -> np.ndarray:
+        return x[:, 0]
+
+    def g(self, x: np.ndarray) -> np.ndarray:
+        return 1.0 + 9.0 * x[:, 1:].mean(axis=1)
+
+    @abc.abstractmethod
+    def h(self, f1: np.ndarray, g: np.ndarray) -> np.ndarray:
+        raise NotImplementedError('ZDT::h()')
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        f1 = self.f1(positions)
+        g = self.g(positions)
+        return np.stack([f1, g * self.h(f1, g)], axis=1)
+
+    def _sample_front(self, n_points: int) -> np.ndarray:
+        f1 = np.linspace(0.0, 1.0, n_points)
+        return np.stack([f1, self.h(f1, np.ones_like(f1))], axis=1)
+
+
+class ZDT1(ZDT):
+
+    """ZDT1, convex front."""
+
+    def h(self, f1: np.ndarray, g: np.ndarray) -> np.ndarray:
+        return 1.0 - np.sqrt(f1 / g)
+
+
+class ZDT2(ZDT):
+
+    """ZDT2, concave front."""
+
+    def h(self, f1: np.ndarray, g: np.ndarray) -> np.ndarray:
+        return 1.0 - np.square(f1 / g)
+
+
+class ZDT3(ZDT):
+
+    """ZDT3, disconnected front."""
+
+    def h(self, f1: np.ndarray, g: np.ndarray) -> np.ndarray:
+        return 1.0 - np.sqrt(f1 / g) - f1 / g * np.sin(10.0 * np.pi * f1)
+
+    def _sample_front(self, n_points: int) -> np.ndarray:
+
+        # only the non-dominated parts of the curve form the front
+        points = super()._sample_front(n_points)
+        best = np.minimum.accumulate(points[:, 1])
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:] = points[1:, 1] < best[:-1]
+
+        return points[keep]
+
+
+class ZDT4(ZDT1):
+
+    def __init__(self, n_variables: int = 10) -> None:
+
+        """ZDT4 Problem Class.
+
+        Convex front, with 21^(n-1) local fronts. The first variable lies in
+        [0, 1] and the others in [-5, 5].
+
+        Parameters
+        ----------
+        n_variables : int
+            Number of decision variables, at least two.
+        """
+
+        super().__init__(n_variables)
+
+        self.lower[1:] = -5.0
+        self.upper[1:] = 5.0
+
+    def g(self, x: np.ndarray) -> np.ndarray:
+        tail = x[:, 1:]
+        return (1.0 + 10.0 * tail.shape[1]
+                + (np.square(tail) - 10.0 * np.cos(4.0 * np.pi * tail)).sum(axis=1))
+
+
+class ZDT6(ZDT2):
+
+    """ZDT6, concave front with a non-uniform density of solutions."""
+
+    def __init__(self, n_variables: int = 10) -> None:
+        super().__init__(n_variables)
+
+    def f1(self, x: np.ndarray) -> np.ndarray:
+        x1 = x[:, 0]
+        return 1.0 - np.exp(-4.0 * x1) * np.sin(6.0 * np.pi * x1) ** 6
+
+    def g(self, x: np.ndarray) -> np.ndarray:
+        return 1.0 + 9.0 * x[:, 1:].mean(axis=1) ** 0.25
+
+    def _sample_front(self, n_points: int) -> np.ndarray:
+        f1 = np.linspace(0.2807753191, 1.0, n_points)
+        return np.stack([f1, 1.0 - np.square(f1)], axis=1)
+
+
+class DTLZ(MOProblem):
+
+    k = 10
+
+    def __init__(self, n_objs: int = 3, n_variables: Optional[int] = None) -> None:
+
+        """DTLZ Problem Class.
+
+        Problems of Deb, Thiele, Laumanns & Zitzler, scalable in the number
+        of objectives. The first n_objs - 1 variables position a solution
+        on the front, and the remaining k variables control its distance.
+
+        Parameters
+        ----------
+        n_objs : int
+            Number of objectives, at least two.
+        n_variables : Optional[int]
+            Number of decision variables, n_objs + k - 1 if None.
+        """
+
+        if n_objs < 2:
+            raise ValueError('DTLZ problems require at least two objectives.')
+
+        n_variables = n_variables or n_objs + self.k - 1
+
+        if n_variables < n_objs:
+            raise ValueError('DTLZ problems require n_variables >= n_objs.')
+
+        super().__init__(n_variables, n_objs)
+
+    def _split(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return x[:, :self.n_objs - 1], x[:, self.n_objs - 1:]
+
+    @staticmethod
+    def _rastrigin_g(xm: np.ndarray) -> np.ndarray:
+        z = xm - 0.5
+        return 100.0 * (xm.shape[1]
+                        + (np.square(z) - np.cos(20.0 * np.pi * z)).sum(axis=1))
+
+    @staticmethod
+    def _spherical(xs: np.ndarray, g: np.ndarray) -> np.ndarray:
+        theta = 0.5 * np.pi * xs
+        ones = np.ones((len(xs), 1))
+
+        cos_part = np.hstack([ones, np.cumprod(np.cos(theta), axis=1)])[:, ::-1]
+        sin_part = np.hstack([ones, np.sin(theta)[:, ::-1]])
+
+        return (1.0 + g)[:, np.newaxis] * cos_part * sin_part
+
+    def _sample_front(self, n_points: int) -> np.ndarray:
+        points = das_dennis(self.n_objs, _n_partitions(self.n_objs, n_points))
+        return points / np.linalg.norm(points, axis=1, keepdims=True)
+
+
+class DTLZ1(DTLZ):
+
+    """DTLZ1, linear front with many local fronts."""
+
+    k = 5
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        xs, xm = self._split(positions)
+        g = self._rastrigin_g(xm)
+        ones = np.ones((len(xs), 1))
+
+        head = np.hstack([ones, np.cumprod(xs, axis=1)])[:, ::-1]
+        tail = np.hstack([ones, 1.0 - xs[:, ::-1]])
+
+        return 0.5 * (1.0 + g)[:, np.newaxis] * head * tail
+
+    def _sample_front(self, n_points: int) -> np.ndarray:
+        return 0.5 * das_dennis(self.n_objs, _n_partitions(self.n_objs, n_points))
+
+
+class DTLZ2(DTLZ):
+
+    """DTLZ2, spherical front."""
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        xs, xm = self._split(positions)
+        return self._spherical(xs, np.square(xm - 0.5).sum(axis=1))
+
+
+class DTLZ3(DTLZ):
+
+    """DTLZ3, spherical front with many local fronts."""
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        xs, xm = self._split(positions)
+        return self._spherical(xs, self._rastrigin_g(xm))
+
+
+class DTLZ4(DTLZ):
+
+    """DTLZ4, spherical front with a biased density of solutions."""
+
+    alpha = 100.0
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        xs, xm = self._split(positions)
+        return self._spherical(xs ** self.alpha, np.square(xm - 0.5).sum(axis=1))
@@ -1,7 +1,22 @@
+from typing import Union
+
 import numpy as np
 
 
-def ackley(position: np.ndarray) -> float:
+def _within_bounds(position: np.ndarray, lower: float, upper: float) -> bool:
+
+    """Checks a position, or batch of positions, lies within the bounds.
+
+    An empty batch has no positions to check, and so lies within them.
+    """
+
+    if position.size == 0:
+        return True
+
+    return position.min() >= lower and position.max() <= upper
+
+
+def ackley(position: np.ndarray, validate: bool = True) -> Union[float, np.ndarray]:
 
     """Implementation of the Ackley Function.
 
@@ -11,29 +26,32 @@ def ackley(position: np.ndarray) -> float:
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, shape (d,), or a batch
+        of positions, shape (n, d).
+    validate : bool
+        If True, checks that the positions lie within the bounds.
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : Union[float, np.ndarray]
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    if not np.logical_and(position >= -32, position <= 32).all():
+    if validate and not _within_bounds(position, -32, 32):
         raise ValueError('Input for Ackley function must be within [-32, 32].')
 
-    dims = position.shape[0]
+    dims = position.shape[-1]
     val = (-20.0 * np.exp(-0.2 * np.sqrt((1 / dims)
-                                         * (position ** 2).sum(axis=0)))
+                                         * np.square(position).sum(axis=-1)))
            - np.exp((1 / float(dims))
-                    * np.cos(2 * np.pi * position).sum(axis=0))
+                    * np.cos(2 * np.pi * position).sum(axis=-1))
            + 20.0
            + np.exp(1))
 
     return val
 
 
-def beale(position: np.ndarray) -> float:
+def beale(position: np.ndarray, validate: bool = True) -> Union[float, np.ndarray]:
 
     """Implementation of the Beale Function.
 
@@ -43,21 +61,24 @@ def beale(position: np.ndarray) -> float:
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, shape (d,), or a batch
+        of positions, shape (n, d).
+    validate : bool
+        If True, checks that the positions lie within the bounds.
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : Union[float, np.ndarray]
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    if not position.shape[0] == 2:
+    if not position.shape[-1] == 2:
         raise IndexError('Beale function only takes two-dimensional input.')
-    if not np.logical_and(position >= -4.5, position <= 4.5).all():
+    if validate and not _within_bounds(position, -4.5, 4.5):
         raise ValueError('Input for Beale function must be within [-4.5, 4.5].')
 
-    x = position[0]
-    y = position[1]
+    x = position[..., 0]
+    y = position[..., 1]
     val = ((1.5 - x + x * y) ** 2.0
            + (2.25 - x + x * y ** 2.0) ** 2.0
            + (2.625 - x + x * y ** 3.0) ** 2.0)
@@ -65,7 +86,7 @@ def beale(position: np.ndarray) -> float:
     return val
 
 
-def booth(position: np.ndarray) -> float:
+def booth(position: np.ndarray, validate: bool = True) -> Union[float, np.ndarray]:
 
     """Implementation of the Booth Function.
 
@@ -75,27 +96,30 @@ def booth(position: np.ndarray) -> float:
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, shape (d,), or a batch
+        of positions, shape (n, d).
+    validate : bool
+        If True, checks that the positions lie within the bounds.
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : Union[float, np.ndarray]
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    if not position.shape[0] == 2:
+    if not position.shape[-1] == 2:
         raise IndexError('Booth function only takes two-dimensional input.')
-    if not np.logical_and(position >= -10, position <= 10).all():
+    if validate and not _within_bounds(position, -10, 10):
         raise ValueError('Input for Booth function must be within [-10, 10].')
 
-    x = position[0]
-    y = position[1]
+    x = position[..., 0]
+    y = position[..., 1]
     val = (x + 2 * y - 7) ** 2.0 + (2 * x + y - 5) ** 2.0
 
     return val
 
 
-def goldsteinprice(position: np.ndarray) -> float:
+def goldsteinprice(position: np.ndarray, validate: bool = True) -> Union[float, np.ndarray]:
 
     """Implementation of the Goldenstein-Price Function.
 
@@ -105,22 +129,25 @@ def goldsteinprice(position: np.ndarray) -> float:
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, shape (d,), or a batch
+        of positions, shape (n, d).
+    validate : bool
+        If True, checks that the positions lie within the bounds.
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : Union[float, np.ndarray]
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    if not position.shape[0] == 2:
+    if not position.shape[-1] == 2:
         raise IndexError('Goldstein function only takes two-dimensional input.')
-    if not np.logical_and(position >= -2, position <= 2).all():
+    if validate and not _within_bounds(position, -2, 2):
         raise ValueError('Input for Goldstein-Price '
                          'function must be within [-2, 2].')
 
-    x = position[0]
-    y = position[1]
+    x = position[..., 0]
+    y = position[..., 1]
     val = ((1
             + (x + y + 1) ** 2.0
             * (19
@@ -144,7 +171,7 @@ def goldsteinprice(position: np.ndarray) -> float:
     return val
 
 
-def rastrigin(position: np.ndarray) -> float:
+def rastrigin(position: np.ndarray, validate: bool = True) -> Union[float, np.ndarray]:
 
     """Implementation of the Rastrigin Function.
 
@@ -154,26 +181,29 @@ def rastrigin(position: np.ndarray) -> float:
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, shape (d,), or a batch
+        of positions, shape (n, d).
+    validate : bool
+        If True, checks that the positions lie within the bounds.
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : Union[float, np.ndarray]
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    if not np.logical_and(position >= -5.12, position <= 5.12).all():
+    if validate and not _within_bounds(position, -5.12, 5.12):
         raise ValueError('Input for Rastrigin function '
                          'must be within [-5.12, 5.12].')
 
-    dims = position.shape[0]
-    val = 10.0 * dims + (position ** 2.0
-                         - 10.0 * np.cos(2.0 * np.pi * position)).sum(axis=0)
+    dims = position.shape[-1]
+    val = 10.0 * dims + (np.square(position)
+                         - 10.0 * np.cos(2.0 * np.pi * position)).sum(axis=-1)
 
     return val
 
 
-def sphere(position: np.ndarray) -> float:
+def sphere(position: np.ndarray, validate: bool = True) -> Union[float, np.ndarray]:
 
     """Implementation of the Sphere Function.
 
@@ -183,13 +213,16 @@ def sphere(position: np.ndarray) -> float:
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, shape (d,), or a batch
+        of positions, shape (n, d).
+    validate : bool
+        Unused, as the Sphere function is unbounded.
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : Union[float, np.ndarray]
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    val = np.sum(np.square(position))
+    val = np.square(position).sum(axis=-1)
     return val
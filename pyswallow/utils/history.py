@@ -1,24 +1,94 @@
 import abc
-from typing import NoReturn
+import os
+from typing import Dict, NoReturn, Optional, Tuple
 
 import numpy as np
+from numpy.lib.format import open_memmap
 
+from .history_writer import HistoryWriter
+from .quality import QualityIndicator
 from ..opt.base_swarm import BaseSwarm
 
 
+def population_statistics(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+    """Computes the mean, standard deviation and minimum of each column.
+
+    NaN entries, such as the fitness of swallows which were not evaluated,
+    are ignored.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values for the population, shape (n_swallows,) or
+        (n_swallows, n_objectives).
+
+    Returns
+    -------
+    mean : np.ndarray
+        Mean of the valid values.
+    std : np.ndarray
+        Standard deviation of the valid values.
+    minimum : np.ndarray
+        Minimum of the valid values.
+    """
+
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(valid, values, 0.0).sum(axis=0) / count
+        sq_dev = np.where(valid, np.square(values - mean), 0.0)
+        std = np.sqrt(sq_dev.sum(axis=0) / count)
+
+    minimum = np.where(count > 0,
+                       np.where(valid, values, np.inf).min(axis=0),
+                       np.nan)
+
+    return mean, std, minimum
+
+
 class BaseHistory(abc.ABC):
 
-    def __init__(self, swarm: BaseSwarm) -> None:
+    def __init__(self,
+                 swarm: BaseSwarm,
+                 trajectory_path: Optional[str] = None,
+                 writer: Optional[HistoryWriter] = None,
+                 buffer_size: Optional[int] = None) -> None:
 
         """BaseHistory Class.
 
+        History is stored in preallocated NumPy columns, sized from the
+        number of iterations of the swarm and grown if exceeded. If a
+        buffer_size is given the columns instead hold only the most recent
+        records, which keeps memory constant for long or open-ended runs
+        when the full history is streamed to disk by a writer.
+
         Parameters
         ----------
         swarm : BaseSwarm
             Swarm for which to record the history.
+        trajectory_path : Optional[str]
+            If provided, the position of every swallow at the end of every
+            iteration is recorded to a memory-mapped .npy file at this path,
+            with shape (n_records, n_swallows, n_dimensions), n_swallows
+            being the largest population recorded. Iterations with a smaller
+            population, such as before a restart which grows it, are padded
+            with NaN.
+        writer : Optional[HistoryWriter]
+            If provided, every record is also streamed to the writer.
+        buffer_size : Optional[int]
+            If provided, the number of most recent records kept in memory.
         """
 
         self.swarm = swarm
+        self.trajectory_path = trajectory_path
+        self.writer = writer
+        self.buffer_size = buffer_size
+
+        self.n_records = 0
+        self.columns = {}
+        self.trajectory = None
 
     @abc.abstractmethod
     def write_history(self) -> NoReturn:
@@ -27,30 +97,357 @@ class BaseHistory(abc.ABC):
 
         raise NotImplementedError('BaseHistory::write_history()')
 
+    def column(self, name: str) -> np.ndarray:
+
+        """Returns the recorded values of a column.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+
+        Returns
+        -------
+        np.ndarray
+            Values recorded so far, or the most recent buffer_size values,
+            in the order in which they were recorded.
+        """
+
+        if name not in self.columns:
+            return np.empty(0)
+
+        column = self.columns[name]
+
+        if self.n_records <= column.shape[0]:
+            return column[:self.n_records]
+
+        start = self.n_records % column.shape[0]
+        return np.concatenate((column[start:], column[:start]))
+
+    def last(self, name: str) -> np.ndarray:
+
+        """Returns the most recent value of a column, without gathering
+        the rest of a ring buffer.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+
+        Returns
+        -------
+        np.ndarray
+            Value of the latest record.
+        """
+
+        if name not in self.columns or self.n_records == 0:
+            raise IndexError(f'no records in column {name}.')
+
+        column = self.columns[name]
+        return column[(self.n_records - 1) % column.shape[0]]
+
+    def close(self) -> None:
+
+        """Flushes any recorded trajectory and streamed history to disk."""
+
+        if self.trajectory is not None:
+            self.trajectory.flush()
+
+        if self.writer is not None:
+            self.writer.close()
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+
+        """Captures the recorded history for a checkpoint.
+
+        Any attached writer or trajectory file is first brought up to date
+        on disk, so that a run resumed from the checkpoint can continue it.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Number of records and a copy of the values held in memory for
+            each column, prefixed with 'history_'.
+        """
+
+        if self.writer is not None:
+            self.writer.sync()
+
+        if self.trajectory is not None:
+            self.trajectory.flush()
+
+        state = {'history_n_records': np.asarray(self.n_records)}
+
+        # column() may return views of the live buffers, which a checkpoint
+        # written in the background must not see change
+        for name in self.columns:
+            state[f'history_{name}'] = self.column(name).copy()
+
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]) -> None:
+
+        """Restores history captured by state_dict().
+
+        An attached writer or trajectory file is continued from the
+        restored number of records.
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        """
+
+        self.n_records = int(state['history_n_records'])
+        self.columns = {}
+
+        for key, values in state.items():
+            if not key.startswith('history_') or key == 'history_n_records':
+                continue
+
+            capacity = max(self._initial_capacity(), self.n_records)
+            if self.buffer_size is not None:
+                capacity = self.buffer_size
+
+            column = np.empty((capacity,) + values.shape[1:], dtype=values.dtype)
+            rows = np.arange(self.n_records - len(values), self.n_records)
+            column[rows % capacity] = values
+
+            self.columns[key[len('history_'):]] = column
+
+        if self.writer is not None:
+            self.writer.resume(self.n_records)
+
+        self.trajectory = None
+        if self.trajectory_path is not None and os.path.exists(self.trajectory_path):
+            self.trajectory = open_memmap(self.trajectory_path, mode='r+')
+
+    def _record(self, **values: np.ndarray) -> None:
+
+        """Appends a row of values to the columns.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Value for each named column.
+        """
+
+        if not self.columns:
+            capacity = self._initial_capacity()
+            for name, value in values.items():
+                value = np.asarray(value)
+                self.columns[name] = np.empty((capacity,) + value.shape,
+                                              dtype=value.dtype)
+
+        elif self.n_records == self._capacity() and self.buffer_size is None:
+            for name, column in self.columns.items():
+                grown = np.empty((2 * column.shape[0],) + column.shape[1:],
+                                 dtype=column.dtype)
+                grown[:self.n_records] = column
+                self.columns[name] = grown
+
+        row = self.n_records % self._capacity()
+        for name, value in values.items():
+            self.columns[name][row] = value
+
+        if self.writer is not None:
+            self.writer.write(iteration=self.swarm.iteration, **values)
+
+        if self.trajectory_path is not None:
+            self._record_trajectory()
+
+        self.n_records += 1
+
+    def _record_trajectory(self) -> None:
+
+        """Writes the current positions of the population to the memmap."""
+
+        population = self.swarm.population
+
+        if self.trajectory is None:
+            shape = (self._initial_capacity(),
+                     len(population),
+                     population[0].position.shape[0])
+            self.trajectory = open_memmap(self.trajectory_path, mode='w+',
+                                          dtype=np.float64, shape=shape)
+
+        else:
+            n_rows, n_swallows, _ = self.trajectory.shape
+
+            if self.n_records == n_rows:
+                n_rows *= 2
+            n_swallows = max(n_swallows, len(population))
+
+            if (n_rows, n_swallows) != self.trajectory.shape[:2]:
+                self._grow_trajectory(n_rows, n_swallows)
+
+        row = self.trajectory[self.n_records]
+        for idx, swallow in enumerate(population):
+            row[idx] = swallow.position
+        row[len(population):] = np.nan
+
+    def _grow_trajectory(self, n_rows: int, n_swallows: int) -> None:
+
+        """Enlarges the trajectory file, padding the new swallows with NaN.
+
+        Parameters
+        ----------
+        n_rows : int
+            Number of iterations the file can hold.
+        n_swallows : int
+            Number of swallows the file can hold in each iteration.
+        """
+
+        old = self.trajectory
+        tmp_path = f'{self.trajectory_path}.tmp'
+
+        grown = open_memmap(tmp_path, mode='w+', dtype=old.dtype,
+                            shape=(n_rows, n_swallows) + old.shape[2:])
+        grown[:, old.shape[1]:] = np.nan
+        grown[:old.shape[0], :old.shape[1]] = old
+        grown.flush()
+
+        del old
+        self.trajectory = None
+
+        os.replace(tmp_path, self.trajectory_path)
+        self.trajectory = open_memmap(self.trajectory_path, mode='r+')
+
+    def _capacity(self) -> int:
+        return next(iter(self.columns.values())).shape[0]
+
+    def _initial_capacity(self) -> int:
+        if self.buffer_size is not None:
+            return self.buffer_size
+
+        n_iterations = self.swarm.n_iterations
+        return n_iterations + 1 if n_iterations else 128
+
+    def __getstate__(self) -> dict:
+        return {k: v for k, v in self.__dict__.items() if k != 'trajectory'}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.trajectory = None
+
+        if self.trajectory_path is not None and self.n_records:
+            self.trajectory = open_memmap(self.trajectory_path, mode='r+')
+
 
 class SOHistory(BaseHistory):
 
-    def __init__(self, swarm: BaseSwarm) -> None:
-        super().__init__(swarm)
+    @property
+    def arr_best_fitness(self) -> np.ndarray:
+        return self.column('best_fitness')
+
+    @property
+    def arr_mean_fitness(self) -> np.ndarray:
+        return self.column('mean_fitness')
 
-        self.arr_best_fitness = []
-        self.arr_mean_fitness = []
+    @property
+    def arr_std_fitness(self) -> np.ndarray:
+        return self.column('std_fitness')
+
+    @property
+    def arr_restarts(self) -> np.ndarray:
+        return self.column('restarts')
 
     def write_history(self) -> None:
-        best_fitness = self.swarm.gbest_swallow.fitness
-        self.arr_best_fitness.append(best_fitness)
+        fitness = np.asarray([s.fitness for s in self.swarm.population],
+                             dtype=float)
+        mean, std, _ = population_statistics(fitness)
 
-        mean_fitness = np.mean([i.fitness for i in self.swarm.population])
-        self.arr_mean_fitness.append(mean_fitness)
+        self._record(
+            best_fitness=float(getattr(self.swarm.gbest_swallow, 'fitness', np.nan)),
+            mean_fitness=mean,
+            std_fitness=std,
+            restarts=self.swarm.n_restarts
+        )
 
 
 class MOHistory(BaseHistory):
 
-    def __init__(self, swarm: BaseSwarm) -> None:
-        super().__init__(swarm)
+    def __init__(self,
+                 swarm: BaseSwarm,
+                 trajectory_path: Optional[str] = None,
+                 writer: Optional[HistoryWriter] = None,
+                 buffer_size: Optional[int] = None,
+                 indicator: Optional[QualityIndicator] = None) -> None:
 
-        self.arr_mean_fitness = []
+        """Multi-Objective History Class.
+
+        Parameters
+        ----------
+        swarm : BaseSwarm
+            Swarm whose history to record.
+        trajectory_path : Optional[str]
+            Path of a .npy file to which positions are recorded.
+        writer : Optional[HistoryWriter]
+            Writer to which each record is streamed.
+        buffer_size : Optional[int]
+            Number of records kept in memory, all if None.
+        indicator : Optional[QualityIndicator]
+            If given, the gd, igd, igd_plus and spread of the archive are
+            recorded against its reference front.
+        """
+
+        super().__init__(swarm, trajectory_path, writer, buffer_size)
+        self.indicator = indicator
+
+    @property
+    def arr_mean_fitness(self) -> np.ndarray:
+        return self.column('mean_fitness')
+
+    @property
+    def arr_objective_mean(self) -> np.ndarray:
+        return self.column('objective_mean')
+
+    @property
+    def arr_objective_std(self) -> np.ndarray:
+        return self.column('objective_std')
+
+    @property
+    def arr_objective_min(self) -> np.ndarray:
+        return self.column('objective_min')
+
+    @property
+    def arr_archive_size(self) -> np.ndarray:
+        return self.column('archive_size')
+
+    @property
+    def arr_gd(self) -> np.ndarray:
+        return self.column('gd')
+
+    @property
+    def arr_igd(self) -> np.ndarray:
+        return self.column('igd')
+
+    @property
+    def arr_igd_plus(self) -> np.ndarray:
+        return self.column('igd_plus')
+
+    @property
+    def arr_spread(self) -> np.ndarray:
+        return self.column('spread')
 
     def write_history(self) -> None:
-        mean_fitness = np.mean([i.fitness for i in self.swarm.population])
-        self.arr_mean_fitness.append(mean_fitness)
+        fitness = np.asarray([s.fitness for s in self.swarm.population],
+                             dtype=float)
+        mean, std, minimum = population_statistics(fitness)
+        overall, _, _ = population_statistics(fitness.ravel())
+
+        archive = self.swarm.archive
+        archive_size = len(archive.population) if archive is not None else 0
+
+        quality = {}
+        if self.indicator is not None:
+            quality = self.indicator.evaluate(archive.population if archive else [])
+
+        self._record(
+            mean_fitness=overall,
+            objective_mean=mean,
+            objective_std=std,
+            objective_min=minimum,
+            archive_size=archive_size,
+            **quality
+        )
@@ -0,0 +1,290 @@
+import json
+import os
+import queue
+import threading
+from typing import Optional
+
+import numpy as np
+
+
+def _sidecar_path(path: str) -> str:
+    return f'{path}.json'
+
+
+def _read_dtype(path: str) -> np.dtype:
+
+    """Reads the record dtype from the sidecar of a history file."""
+
+    with open(_sidecar_path(path), 'r') as f:
+        header = json.load(f)
+
+    # JSON turns the tuples of the descr into lists
+    descr = [(name, fmt) + tuple(tuple(s) for s in shape)
+             for name, fmt, *shape in header['descr']]
+
+    return np.lib.format.descr_to_dtype(descr)
+
+
+def load_history(path: str, mode: str = 'r') -> np.ndarray:
+
+    """Memory-maps a history file written by a HistoryWriter.
+
+    Parameters
+    ----------
+    path : str
+        Path of the history file.
+    mode : str
+        Mode with which to open the file, as for np.memmap.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with one record per iteration and one field per
+        history column, memory-mapped where the file is not empty.
+    """
+
+    dtype = _read_dtype(path)
+    n_records = os.path.getsize(path) // dtype.itemsize
+
+    if n_records == 0:
+        return np.empty(0, dtype=dtype)
+
+    return np.memmap(path, dtype=dtype, mode=mode, shape=(n_records,))
+
+
+class HistoryWriter:
+
+    def __init__(self,
+                 path: str,
+                 batch_size: int = 256,
+                 max_pending: int = 4) -> None:
+
+        """History Writer Class.
+
+        Streams history records to an append-only binary file, one
+        fixed-size structured record per iteration. Records are gathered
+        into batches which are written by a background thread, so that the
+        optimisation is not held up by disk access. The dtype of the
+        records is stored in a JSON sidecar next to the file, which allows
+        the result to be memory-mapped with load_history().
+
+        Parameters
+        ----------
+        path : str
+            Path of the history file, which is overwritten.
+        batch_size : int
+            Number of records gathered before a batch is written.
+        max_pending : int
+            Number of batches which may be waiting to be written before
+            write() blocks, bounding the memory used.
+        """
+
+        self.path = path
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+
+        self.dtype: Optional[np.dtype] = None
+        self.n_records = 0
+        self.n_written = 0
+
+        self._batch: Optional[np.ndarray] = None
+        self._n_batch = 0
+        self._append = False
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def write(self, **values: np.ndarray) -> None:
+
+        """Adds a record, the fields are fixed by the first record written.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Value for each named field.
+        """
+
+        self._raise_error()
+
+        if self.dtype is None:
+            self.dtype = np.dtype([
+                (name, np.asarray(value).dtype, np.asarray(value).shape)
+                for name, value in values.items()
+            ])
+            self._write_sidecar()
+
+        if self._batch is None:
+            self._batch = np.empty(self.batch_size, dtype=self.dtype)
+
+        row = self._batch[self._n_batch]
+        for name, value in values.items():
+            row[name] = value
+
+        self._n_batch += 1
+        self.n_records += 1
+
+        if self._n_batch == self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+
+        """Hands the records gathered so far to the background thread."""
+
+        if not self._n_batch:
+            return
+
+        if self._thread is None:
+            self._start()
+
+        self._queue.put(self._batch[:self._n_batch])
+
+        self._batch = None
+        self._n_batch = 0
+
+    def resume(self, n_records: int) -> None:
+
+        """Continues an existing file after the first n_records records.
+
+        Records beyond n_records, such as those written after the
+        checkpoint from which an optimisation is resumed, are discarded.
+
+        Parameters
+        ----------
+        n_records : int
+            Number of records to keep.
+
+        Raises
+        ------
+        IOError
+            If the file holds fewer than n_records records.
+        """
+
+        self.close()
+
+        n_found = 0
+        if os.path.exists(self.path):
+            self.dtype = _read_dtype(self.path)
+            n_found = os.path.getsize(self.path) // self.dtype.itemsize
+
+        # the missing records cannot be recovered, and padding the file
+        # would silently corrupt it
+        if n_found < n_records:
+            raise IOError(f'{self.path} holds {n_found} records, '
+                          f'fewer than the {n_records} to resume from.')
+
+        if n_found:
+            os.truncate(self.path, n_records * self.dtype.itemsize)
+
+        self.n_records = self.n_written = n_records
+        self._append = True
+
+    def sync(self) -> None:
+
+        """Blocks until every record written so far is on disk."""
+
+        self.flush()
+
+        if self._thread is not None:
+            self._queue.join()
+
+        self._raise_error()
+
+    def close(self) -> None:
+
+        """Writes any outstanding records and stops the background thread."""
+
+        self.flush()
+
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+
+            self._queue = None
+            self._thread = None
+
+        self._raise_error()
+
+    def _start(self) -> None:
+
+        """Starts the background thread which writes batches to disk."""
+
+        self._queue = queue.Queue(maxsize=self.max_pending)
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._queue, 'ab' if self._append else 'wb'),
+            name='HistoryWriter',
+            daemon=True
+        )
+
+        self._append = True
+        self._thread.start()
+
+    def _run(self, batches: queue.Queue, mode: str) -> None:
+
+        """Appends batches to the file until the sentinel is received.
+
+        Parameters
+        ----------
+        batches : queue.Queue
+            Queue from which to take batches, None signals the end.
+        mode : str
+            Mode with which to open the file.
+        """
+
+        try:
+            f = open(self.path, mode)
+        except OSError as e:
+            self._error = e
+            f = None
+
+        # batches are still consumed after an error so write() never blocks
+        while True:
+            batch = batches.get()
+
+            try:
+                if batch is None:
+                    break
+
+                if self._error is None:
+                    f.write(batch.tobytes())
+                    f.flush()
+                    self.n_written += len(batch)
+            except OSError as e:
+                self._error = e
+            finally:
+                batches.task_done()
+
+        if f is not None:
+            f.close()
+
+    def _write_sidecar(self) -> None:
+
+        """Describes the record dtype in the JSON sidecar."""
+
+        header = {'descr': np.lib.format.dtype_to_descr(self.dtype)}
+
+        with open(_sidecar_path(self.path), 'w') as f:
+            json.dump(header, f)
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise IOError(f'failed to write history to {self.path}') from error
+
+    def __getstate__(self) -> dict:
+        self.sync()
+
+        excluded = ('_queue', '_thread', '_error', '_batch', '_n_batch')
+        return {k: v for k, v in self.__dict__.items() if k not in excluded}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+
+        self._batch = None
+        self._n_batch = 0
+        self._append = True
+
+        self._queue = None
+        self._thread = None
+        self._error = None
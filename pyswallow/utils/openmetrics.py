@@ -0,0 +1,263 @@
+import http.server
+import math
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..opt.base_swarm import BaseSwarm
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+
+def _escape(value: str) -> str:
+    return (str(value).replace('\\', '\\\\')
+                      .replace('"', '\\"')
+                      .replace('\n', '\\n'))
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value.is_integer() and abs(value) < 2 ** 53:
+        return str(int(value))
+
+    return repr(value)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+
+    pairs = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+    return f'{{{pairs}}}'
+
+
+class MetricsExporter:
+
+    def __init__(self,
+                 swarm: BaseSwarm,
+                 path: Optional[str] = None,
+                 port: Optional[int] = None,
+                 host: str = '127.0.0.1',
+                 prefix: str = 'pyswallow',
+                 labels: Optional[Dict[str, str]] = None,
+                 min_interval: float = 0.0) -> None:
+
+        """Metrics Exporter Class.
+
+        Exposes the progress of an optimisation in the OpenMetrics text
+        format, as scraped by Prometheus. Metrics are refreshed by update(),
+        which the swarm calls at the end of every iteration, and are either
+        written to a file, which is replaced atomically, or served over HTTP
+        at /metrics, or both.
+
+        Parameters
+        ----------
+        swarm : BaseSwarm
+            Swarm for which to export metrics.
+        path : Optional[str]
+            Path of the text file to write.
+        port : Optional[int]
+            Port on which to serve the metrics, 0 selects a free port.
+        host : str
+            Address on which to serve the metrics.
+        prefix : str
+            Prefix for the name of every metric.
+        labels : Optional[Dict[str, str]]
+            Labels added to every sample, such as the name of the run.
+        min_interval : float
+            Minimum number of seconds between writes of the file.
+        """
+
+        self.swarm = swarm
+        self.path = path
+        self.host = host
+        self.port = port
+        self.prefix = prefix
+        self.labels = labels or {}
+        self.min_interval = min_interval
+
+        self.text = '# EOF\n'
+
+        self._last: Optional[Tuple[float, int]] = None
+        self._written = float('-inf')
+        self._rate = 0.0
+        self._latency = 0.0
+
+        self._server: Optional[http.server.ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        if port is not None:
+            self.serve()
+
+    def update(self) -> None:
+
+        """Refreshes the metrics from the current state of the swarm."""
+
+        now = time.perf_counter()
+        n_evaluations = self.swarm.n_evaluations
+
+        if self._last is not None:
+            t_last, n_last = self._last
+            self._latency = now - t_last
+            self._rate = ((n_evaluations - n_last) / self._latency
+                          if self._latency > 0.0 else 0.0)
+
+        self._last = now, n_evaluations
+        self.text = self.render()
+
+        if self.path is not None and now - self._written >= self.min_interval:
+            self.write()
+            self._written = now
+
+    def collect(self) -> List[Tuple[str, str, str, List[Tuple[dict, float]]]]:
+
+        """Gathers the current value of each metric.
+
+        Returns
+        -------
+        List[Tuple[str, str, str, List[Tuple[dict, float]]]]
+            Name, type, help text and labelled samples of each metric family.
+        """
+
+        swarm = self.swarm
+
+        families = [
+            ('evaluations', 'counter', 'Objective function evaluations.',
+             [({}, swarm.n_evaluations)]),
+            ('screened', 'counter', 'Swallows screened out before evaluation.',
+             [({}, swarm.n_screened)]),
+            ('rejected', 'counter', 'Evaluated candidates rejected by the constraints.',
+             [({}, swarm.n_rejected)]),
+            ('cache_hits', 'counter', 'Evaluations answered from a cache.',
+             [({}, swarm.n_cache_hits)]),
+            ('evaluations_per_second', 'gauge',
+             'Evaluation throughput over the last iteration.',
+             [({}, self._rate)]),
+            ('iteration', 'gauge', 'Current iteration.',
+             [({}, swarm.iteration or 0)]),
+            ('iteration_seconds', 'gauge', 'Duration of the last iteration.',
+             [({}, self._latency)]),
+        ]
+
+        constraint_manager = getattr(swarm, 'constraint_manager', None)
+        if constraint_manager is not None and constraint_manager.statistics:
+            families.append((
+                'constraint_rejections', 'counter',
+                'Swallows rejected by each constraint.',
+                # constraints of the same class share a name, so the order
+                # of registration distinguishes their series
+                [({'constraint': stats.name, 'index': str(idx)}, stats.n_rejected)
+                 for idx, stats in enumerate(constraint_manager.statistics)]
+            ))
+
+        gbest_swallow = getattr(swarm, 'gbest_swallow', None)
+        if gbest_swallow is not None:
+            families.append(('best_fitness', 'gauge', 'Best fitness found.',
+                             [({}, gbest_swallow.fitness)]))
+
+        archive = getattr(swarm, 'archive', None)
+        if archive is not None:
+            families.append(('archive_size', 'gauge',
+                             'Number of members of the archive.',
+                             [({}, len(archive.population))]))
+
+        return families
+
+    def render(self) -> str:
+
+        """Formats the metrics as OpenMetrics text.
+
+        Returns
+        -------
+        str
+            Exposition text, terminated by # EOF.
+        """
+
+        lines = []
+
+        for name, kind, doc, samples in self.collect():
+            family = f'{self.prefix}_{name}'
+            suffix = '_total' if kind == 'counter' else ''
+
+            lines.append(f'# TYPE {family} {kind}')
+            lines.append(f'# HELP {family} {doc}')
+
+            for labels, value in samples:
+                labels = _format_labels({**self.labels, **labels})
+                lines.append(f'{family}{suffix}{labels} {_format_value(value)}')
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def write(self) -> None:
+
+        """Writes the metrics to a temporary file and moves it into place."""
+
+        tmp_path = f'{self.path}.tmp'
+
+        with open(tmp_path, 'w') as f:
+            f.write(self.text)
+
+        os.replace(tmp_path, self.path)
+
+    def serve(self) -> None:
+
+        """Serves the metrics over HTTP from a background thread."""
+
+        exporter = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+
+                body = exporter.text.encode('utf-8')
+
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(
+            (self.host, self.port or 0), Handler
+        )
+        self.port = self._server.server_address[1]
+
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='MetricsExporter',
+                                        daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+
+        """Stops serving the metrics."""
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+
+            self._server = None
+            self._thread = None
+
+    def __getstate__(self) -> dict:
+        excluded = ('_server', '_thread')
+        return {k: v for k, v in self.__dict__.items() if k not in excluded}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+
+        self._server = None
+        self._thread = None
@@ -0,0 +1,277 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+class BaseParameter:
+
+    def __init__(self, lower: float, upper: float) -> None:
+
+        """BaseParameter Class.
+
+        Parameters
+        ----------
+        lower : float
+            Lower bound of the continuous box the swarm searches.
+        upper : float
+            Upper bound of the continuous box the swarm searches.
+        """
+
+        if lower > upper:
+            raise ValueError('lower must not exceed upper.')
+
+        self.lower = lower
+        self.upper = upper
+
+    @property
+    def bounds(self) -> List[float]:
+
+        """Bounds of the continuous box searched by the swarm."""
+
+        return [self.lower, self.upper]
+
+    def snap(self, x: np.ndarray) -> np.ndarray:
+
+        """Maps continuous coordinates to their canonical numeric values.
+
+        Coordinates which decode to the same value snap to the same number.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Continuous coordinates.
+
+        Returns
+        -------
+        np.ndarray
+            Canonical values.
+        """
+
+        return x
+
+    def value(self, snapped: np.ndarray) -> np.ndarray:
+
+        """Maps canonical numeric values to the values of the parameter.
+
+        Parameters
+        ----------
+        snapped : np.ndarray
+            Values produced by snap().
+
+        Returns
+        -------
+        np.ndarray
+            Values of the parameter.
+        """
+
+        return snapped
+
+
+class Continuous(BaseParameter):
+
+    def __init__(self, lower: float, upper: float) -> None:
+
+        """Continuous Parameter.
+
+        Parameters
+        ----------
+        lower : float
+            Lower bound.
+        upper : float
+            Upper bound.
+        """
+
+        super().__init__(lower, upper)
+
+
+class Integer(BaseParameter):
+
+    def __init__(self, lower: int, upper: int) -> None:
+
+        """Integer Parameter.
+
+        The swarm searches [lower - 0.5, upper + 0.5], and coordinates are
+        rounded to the nearest integer, so that every integer is decoded
+        from an interval of the same width.
+
+        Parameters
+        ----------
+        lower : int
+            Smallest integer.
+        upper : int
+            Largest integer.
+        """
+
+        super().__init__(lower - 0.5, upper + 0.5)
+        self.low = int(lower)
+        self.high = int(upper)
+
+    def snap(self, x: np.ndarray) -> np.ndarray:
+        return np.clip(np.floor(x + 0.5), self.low, self.high)
+
+    def value(self, snapped: np.ndarray) -> np.ndarray:
+        return snapped.astype(int)
+
+
+class Categorical(Integer):
+
+    def __init__(self, choices: Sequence[Any]) -> None:
+
+        """Categorical Parameter.
+
+        Each choice is encoded by its index, searched as an Integer.
+
+        Parameters
+        ----------
+        choices : Sequence[Any]
+            Values the parameter may take.
+        """
+
+        if len(choices) == 0:
+            raise ValueError('choices must not be empty.')
+
+        super().__init__(0, len(choices) - 1)
+        self.choices = list(choices)
+
+    def value(self, snapped: np.ndarray) -> np.ndarray:
+        values = np.empty(len(snapped), dtype=object)
+        values[:] = [self.choices[int(idx)] for idx in snapped]
+        return values
+
+
+class ParameterSpace:
+
+    def __init__(self, bounds: dict) -> None:
+
+        """ParameterSpace Class.
+
+        Describes the search space from a bounds dict, in which each value
+        is either a [lower, upper] pair, for a continuous parameter, or a
+        parameter spec: Continuous, Integer or Categorical.
+
+        Parameters
+        ----------
+        bounds : dict
+            Bounds, or specs, of each parameter.
+        """
+
+        if not isinstance(bounds, dict):
+            raise TypeError('bounds must be dict.')
+
+        self.parameters = {
+            name: (spec if isinstance(spec, BaseParameter)
+                   else Continuous(*spec))
+            for name, spec in bounds.items()
+        }
+
+        self.is_continuous = all(
+            type(p) is Continuous for p in self.parameters.values()
+        )
+        self.is_numeric = not any(
+            isinstance(p, Categorical) for p in self.parameters.values()
+        )
+        self.is_integer = all(
+            type(p) is Integer for p in self.parameters.values()
+        )
+
+    @property
+    def bounds(self) -> Dict[str, List[float]]:
+
+        """Bounds of the continuous box searched by the swarm."""
+
+        return {name: p.bounds for name, p in self.parameters.items()}
+
+    def snap(self, positions: np.ndarray) -> np.ndarray:
+
+        """Maps positions to canonical numeric values, equal for positions
+        which decode to the same candidate.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Position, shape (d,), or positions, shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Canonical values, of the same shape.
+        """
+
+        positions = np.asarray(positions, dtype=float)
+        snapped = np.empty_like(positions)
+
+        for j, p in enumerate(self.parameters.values()):
+            snapped[..., j] = p.snap(positions[..., j])
+
+        return snapped
+
+    def decode(self, positions: np.ndarray, snapped: bool = False) -> np.ndarray:
+
+        """Decodes positions into the candidates they represent.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Position, shape (d,), or positions, shape (n, d).
+        snapped : bool
+            True if positions were already passed through snap().
+
+        Returns
+        -------
+        np.ndarray
+            Candidates, of the same shape. An int array if every parameter
+            is an Integer, a float array if every parameter is numeric, in
+            which integers are whole-valued floats, otherwise an object
+            array holding ints and the choices of the categorical
+            parameters.
+        """
+
+        if not snapped:
+            positions = self.snap(positions)
+
+        if self.is_integer:
+            return positions.astype(int)
+
+        if self.is_numeric:
+            return positions
+
+        rows = np.atleast_2d(positions)
+        decoded = np.empty(rows.shape, dtype=object)
+
+        for j, p in enumerate(self.parameters.values()):
+            decoded[:, j] = p.value(rows[:, j])
+
+        return decoded if positions.ndim == 2 else decoded[0]
+
+    def unique(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+        """Finds the distinct candidates among positions.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions, shape (n, d).
+
+        Returns
+        -------
+        candidates : np.ndarray
+            Decoded distinct candidates, in order of first occurrence.
+        first : np.ndarray
+            Index of the first position decoding to each candidate.
+        inverse : np.ndarray
+            Index into candidates of each position, shape (n,).
+        """
+
+        snapped = self.snap(positions)
+        _, first, inverse = np.unique(snapped, axis=0, return_index=True,
+                                      return_inverse=True)
+
+        # relabel the candidates by their first occurrence
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        first = first[order]
+        inverse = rank[inverse.reshape(-1)]
+
+        return self.decode(snapped[first], snapped=True), first, inverse
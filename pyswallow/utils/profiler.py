@@ -0,0 +1,213 @@
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class _NullPhase:
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _Phase:
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'Profiler', name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *args: Any) -> None:
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+
+
+class NullProfiler:
+
+    """Profiler which records nothing, used when profiling is disabled."""
+
+    enabled = False
+
+    _phase = _NullPhase()
+
+    def phase(self, name: str) -> _NullPhase:
+        return self._phase
+
+    def record(self, name: str, start: int, end: int, tid: int = 0) -> None:
+        pass
+
+
+class Profiler:
+
+    enabled = True
+
+    def __init__(self, max_events: int = 1_000_000) -> None:
+
+        """Profiler Class.
+
+        Times the phases of each iteration with perf_counter_ns. Totals are
+        kept for every phase, and individual events are kept for export as
+        a Chrome trace, which can be viewed in chrome://tracing or Perfetto.
+
+        Parameters
+        ----------
+        max_events : int
+            Maximum number of events kept for the trace, totals continue to
+            be updated once reached.
+        """
+
+        self.max_events = max_events
+
+        self.events: List[Tuple[str, int, int, int]] = []
+        self.totals: Dict[str, List[int]] = {}
+
+        self._pid = os.getpid()
+
+    def phase(self, name: str) -> _Phase:
+
+        """Context manager which times the enclosed block.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+
+        Returns
+        -------
+        _Phase
+            Context manager recording the phase on exit.
+        """
+
+        return _Phase(self, name)
+
+    def record(self, name: str, start: int, end: int, tid: int = 0) -> None:
+
+        """Records an event timed elsewhere, such as in a worker process.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+        start : int
+            Start time in nanoseconds, from perf_counter_ns.
+        end : int
+            End time in nanoseconds, from perf_counter_ns.
+        tid : int
+            Identifier of the thread or process which ran the event, 0 for
+            the main thread.
+        """
+
+        duration = end - start
+
+        total = self.totals.get(name)
+        if total is None:
+            self.totals[name] = [1, duration, duration]
+        else:
+            total[0] += 1
+            total[1] += duration
+            total[2] = max(total[2], duration)
+
+        if len(self.events) < self.max_events:
+            self.events.append((name, start, end, tid))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+
+        """Reports the time spent in each phase.
+
+        Returns
+        -------
+        Dict[str, Dict[str, float]]
+            Count, and total, mean and maximum duration in seconds, of each
+            phase.
+        """
+
+        return {
+            name: {
+                'count': count,
+                'total': total * 1e-9,
+                'mean': total * 1e-9 / count,
+                'max': maximum * 1e-9
+            }
+            for name, (count, total, maximum) in self.totals.items()
+        }
+
+    @property
+    def overhead_ratio(self) -> float:
+
+        """Fraction of the step time spent outside of evaluating fitness."""
+
+        step = self.totals.get('step', [0, 0, 0])[1]
+        evaluate = self.totals.get('evaluate', [0, 0, 0])[1]
+
+        return 1.0 - evaluate / step if step else 0.0
+
+    def export_chrome_trace(self, path: str) -> None:
+
+        """Writes the recorded events in the Chrome trace-event format.
+
+        Parameters
+        ----------
+        path : str
+            Path of the JSON file to write.
+        """
+
+        trace = {
+            'traceEvents': [
+                {
+                    'name': name,
+                    'ph': 'X',
+                    'ts': start / 1e3,
+                    'dur': (end - start) / 1e3,
+                    'pid': self._pid,
+                    'tid': tid
+                }
+                for name, start, end, tid in self.events
+            ],
+            'displayTimeUnit': 'ms'
+        }
+
+        with open(path, 'w') as f:
+            json.dump(trace, f)
+
+    def reset(self) -> None:
+
+        """Discards everything recorded so far."""
+
+        self.events = []
+        self.totals = {}
+
+
+class TimedCall:
+
+    def __init__(self, fn: Callable[[Any], Any]) -> None:
+
+        """Timed Call Class.
+
+        Picklable wrapper which times a function inside a worker process,
+        returning the result along with the start and end times and the
+        process id. On Linux perf_counter_ns reads the system-wide monotonic
+        clock, so worker times are comparable with the main process.
+
+        Parameters
+        ----------
+        fn : Callable[[Any], Any]
+            Function to time.
+        """
+
+        self.fn = fn
+
+    def __call__(self, *args: Any) -> Tuple[Any, int, int, int]:
+        start = time.perf_counter_ns()
+        result = self.fn(*args)
+        end = time.perf_counter_ns()
+
+        return result, start, end, os.getpid()
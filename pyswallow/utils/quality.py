@@ -0,0 +1,362 @@
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+def objective_values(front: Any, n_objs: Optional[int] = None) -> np.ndarray:
+
+    """Collects the objective values of a front.
+
+    Parameters
+    ----------
+    front : Any
+        Archive, list of swallows, or array of objective values.
+    n_objs : Optional[int]
+        Number of objectives, used to shape an empty front.
+
+    Returns
+    -------
+    np.ndarray
+        Objective values, shape (n, m).
+    """
+
+    if hasattr(front, 'population'):
+        front = front.population
+
+    if len(front) and hasattr(front[0], 'fitness'):
+        front = [swallow.fitness for swallow in front]
+
+    values = np.asarray(front, dtype=float)
+
+    if not values.size:
+        return np.empty((0, n_objs or 0))
+
+    return values.reshape(len(values), -1)
+
+
+class KDTree:
+
+    def __init__(self, points: np.ndarray, leaf_size: int = 32) -> None:
+
+        """KD-Tree Class.
+
+        Balanced KD-tree, split at the median of the widest dimension, which
+        answers nearest-neighbour queries for a batch of points at once.
+        Each node holds the bounding box of its points, so that subtrees
+        are pruned for every query in the batch together.
+
+        Besides the Euclidean distance, the tree supports the modified
+        distance of IGD+, sqrt(sum(max(a - z, 0)^2)), between a query z and
+        a point a.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Points to index, shape (n, k).
+        leaf_size : int
+            Maximum number of points held by a leaf.
+        """
+
+        points = np.asarray(points, dtype=float)
+
+        if points.ndim != 2 or not len(points):
+            raise ValueError('KDTree requires a non-empty array of shape (n, k).')
+
+        self.points = points
+        self.leaf_size = max(leaf_size, 1)
+
+        self._order = np.arange(len(points))
+
+        self._start = []
+        self._end = []
+        self._lower = []
+        self._upper = []
+        self._left = []
+        self._right = []
+        self._dim = []
+        self._split = []
+
+        self._build(0, len(points))
+
+        self._lower = np.array(self._lower)
+        self._upper = np.array(self._upper)
+        self._left = np.array(self._left)
+        self._right = np.array(self._right)
+        self._dim = np.array(self._dim)
+        self._split = np.array(self._split)
+        self._data = points[self._order]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _build(self, start: int, end: int) -> int:
+
+        """Builds the subtree holding order[start:end], returning its index."""
+
+        node = len(self._start)
+        pts = self.points[self._order[start:end]]
+        lower, upper = pts.min(axis=0), pts.max(axis=0)
+
+        self._start.append(start)
+        self._end.append(end)
+        self._lower.append(lower)
+        self._upper.append(upper)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._dim.append(0)
+        self._split.append(0.0)
+
+        if end - start <= self.leaf_size:
+            return node
+
+        dim = int(np.argmax(upper - lower))
+        mid = (start + end) // 2
+
+        part = np.argpartition(pts[:, dim], mid - start)
+        self._order[start:end] = self._order[start:end][part]
+
+        self._dim[node] = dim
+        self._split[node] = self.points[self._order[mid], dim]
+        self._left[node] = self._build(start, mid)
+        self._right[node] = self._build(mid, end)
+
+        return node
+
+    def query(self, x: np.ndarray, plus: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+
+        """Finds the nearest indexed point to each query.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Query points, shape (m, k).
+        plus : bool
+            If True, the IGD+ distance is used instead of the Euclidean.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Distance to, and index of, the nearest point for each query.
+        """
+
+        return self._query(np.atleast_2d(np.asarray(x, dtype=float)), plus)
+
+    def nearest_neighbour_distances(self) -> np.ndarray:
+
+        """Distance from each indexed point to its nearest other point.
+
+        Returns
+        -------
+        np.ndarray
+            Distances, inf if only one point is indexed.
+        """
+
+        exclude = np.empty(len(self.points), dtype=int)
+        exclude[self._order] = np.arange(len(self.points))
+
+        return self._query(self.points, False, exclude)[0]
+
+    def _query(self,
+               x: np.ndarray,
+               plus: bool,
+               exclude: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+
+        best = np.full(len(x), np.inf)
+        arg = np.zeros(len(x), dtype=int)
+
+        # the leaf each query falls in gives a tight initial bound, so that
+        # the search from the root prunes most of the tree
+        node = np.zeros(len(x), dtype=int)
+        q = np.arange(len(x)) if self._left[0] >= 0 else node[:0]
+
+        while len(q):
+            current = node[q]
+            go_left = x[q, self._dim[current]] <= self._split[current]
+            node[q] = np.where(go_left, self._left[current], self._right[current])
+            q = q[self._left[node[q]] >= 0]
+
+        for leaf in np.unique(node):
+            self._scan(leaf, np.flatnonzero(node == leaf), x, plus, exclude, best, arg)
+
+        self._search(0, np.arange(len(x)), x, plus, exclude, best, arg)
+
+        return np.sqrt(best), self._order[arg]
+
+    def _scan(self,
+              node: int,
+              q: np.ndarray,
+              x: np.ndarray,
+              plus: bool,
+              exclude: Optional[np.ndarray],
+              best: np.ndarray,
+              arg: np.ndarray) -> None:
+
+        """Compares the queries q with every point in a leaf."""
+
+        start, end = self._start[node], self._end[node]
+
+        diff = self._data[start:end][np.newaxis, :, :] - x[q][:, np.newaxis, :]
+        if plus:
+            diff = np.maximum(diff, 0.0)
+        dist = np.square(diff).sum(axis=2)
+
+        if exclude is not None:
+            dist[exclude[q, np.newaxis] == np.arange(start, end)] = np.inf
+
+        nearest = dist.argmin(axis=1)
+        nearest_dist = dist[np.arange(len(q)), nearest]
+
+        better = nearest_dist < best[q]
+        best[q[better]] = nearest_dist[better]
+        arg[q[better]] = start + nearest[better]
+
+    def _search(self,
+                node: int,
+                q: np.ndarray,
+                x: np.ndarray,
+                plus: bool,
+                exclude: Optional[np.ndarray],
+                best: np.ndarray,
+                arg: np.ndarray) -> None:
+
+        """Searches a subtree for the queries q, skipping those for which
+        the bounding box of the subtree is no closer than the best found."""
+
+        z = x[q]
+
+        below = np.maximum(self._lower[node] - z, 0.0)
+        if plus:
+            bound = np.square(below).sum(axis=1)
+        else:
+            above = np.maximum(z - self._upper[node], 0.0)
+            bound = np.square(below + above).sum(axis=1)
+
+        q = q[bound < best[q]]
+
+        if not len(q):
+            return
+
+        if self._left[node] < 0:
+            self._scan(node, q, x, plus, exclude, best, arg)
+        else:
+            self._search(self._left[node], q, x, plus, exclude, best, arg)
+            self._search(self._right[node], q, x, plus, exclude, best, arg)
+
+
+class QualityIndicator:
+
+    def __init__(self, reference: np.ndarray, leaf_size: int = 32) -> None:
+
+        """Quality Indicator Class.
+
+        Measures how well a front approximates a reference Pareto front.
+        The reference is indexed in a KD-tree once, for the generational
+        distance, while the inverted distances index the front, which is
+        usually far smaller, on each call.
+
+        Parameters
+        ----------
+        reference : np.ndarray
+            Points on the reference front, shape (n, m).
+        leaf_size : int
+            Maximum number of points held by a leaf of the KD-trees.
+        """
+
+        self.reference = objective_values(reference)
+        self.n_objs = self.reference.shape[1]
+        self.leaf_size = leaf_size
+
+        self.tree = KDTree(self.reference, leaf_size)
+        self.extremes = self.reference[np.argmax(self.reference, axis=0)]
+
+    def gd(self, front: Any) -> float:
+
+        """Generational distance, the mean distance from each member of the
+        front to the reference front."""
+
+        values = objective_values(front, self.n_objs)
+
+        if not len(values):
+            return float('inf')
+
+        return float(self.tree.query(values)[0].mean())
+
+    def igd(self, front: Any) -> float:
+
+        """Inverted generational distance, the mean distance from each
+        reference point to the front."""
+
+        values = objective_values(front, self.n_objs)
+
+        if not len(values):
+            return float('inf')
+
+        return self._igd(KDTree(values, self.leaf_size))
+
+    def igd_plus(self, front: Any) -> float:
+
+        """IGD+, which only counts the objectives in which the front is worse
+        than each reference point, making it weakly Pareto compliant."""
+
+        values = objective_values(front, self.n_objs)
+
+        if not len(values):
+            return float('inf')
+
+        return self._igd(KDTree(values, self.leaf_size), plus=True)
+
+    def spread(self, front: Any) -> float:
+
+        """Generalised spread, zero for a front spanning the extremes of the
+        reference with evenly spaced members."""
+
+        values = objective_values(front, self.n_objs)
+
+        if len(values) < 2:
+            return float('nan')
+
+        return self._spread(KDTree(values, self.leaf_size))
+
+    def evaluate(self, front: Any) -> Dict[str, float]:
+
+        """Computes every indicator, indexing the front only once.
+
+        Parameters
+        ----------
+        front : Any
+            Archive, list of swallows, or array of objective values.
+
+        Returns
+        -------
+        Dict[str, float]
+            Values of gd, igd, igd_plus and spread.
+        """
+
+        values = objective_values(front, self.n_objs)
+
+        if not len(values):
+            return {'gd': float('inf'), 'igd': float('inf'),
+                    'igd_plus': float('inf'), 'spread': float('nan')}
+
+        tree = KDTree(values, self.leaf_size)
+
+        return {
+            'gd': float(self.tree.query(values)[0].mean()),
+            'igd': self._igd(tree),
+            'igd_plus': self._igd(tree, plus=True),
+            'spread': self._spread(tree) if len(values) > 1 else float('nan')
+        }
+
+    def _igd(self, tree: KDTree, plus: bool = False) -> float:
+        return float(tree.query(self.reference, plus=plus)[0].mean())
+
+    def _spread(self, tree: KDTree) -> float:
+        extreme = tree.query(self.extremes)[0].sum()
+        distances = tree.nearest_neighbour_distances()
+        mean = distances.mean()
+
+        denominator = extreme + len(distances) * mean
+        if denominator == 0.0:
+            return 0.0
+
+        return float((extreme + np.abs(distances - mean).sum()) / denominator)
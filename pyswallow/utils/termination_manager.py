@@ -1,7 +1,11 @@
 import abc
+import collections
 import time
-from typing import NoReturn
+from typing import Dict, List, NoReturn
 
+import numpy as np
+
+from .quality import QualityIndicator
 from ..opt.base_swarm import BaseSwarm
 
 
@@ -14,6 +18,37 @@ class BaseTerminationManager(abc.ABC):
 
         raise NotImplementedError('BaseTerminationManager::termination_check()')
 
+    def state_dict(self, prefix: str = 'tm_') -> Dict[str, np.ndarray]:
+
+        """Captures the state of the manager for a checkpoint.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix of the keys, distinguishing nested managers.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays holding the state, empty if the manager has none.
+        """
+
+        return {}
+
+    def load_state_dict(self, state: Dict[str, np.ndarray], prefix: str = 'tm_') -> None:
+
+        """Restores state captured by state_dict().
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        prefix : str
+            Prefix of the keys, as passed to state_dict().
+        """
+
+        pass
+
 
 class IterationTerminationManager(BaseTerminationManager):
 
@@ -68,6 +103,44 @@ class TimeTerminationManager(BaseTerminationManager):
         else:
             return False
 
+    def state_dict(self, prefix: str = 'tm_') -> Dict[str, np.ndarray]:
+
+        """Captures the time elapsed so far, so that a resumed run spends
+        only the remainder of the budget.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix of the keys, distinguishing nested managers.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Elapsed time, empty before the first check.
+        """
+
+        if self.t_start is None:
+            return {}
+
+        return {f'{prefix}t_elapsed': np.asarray(time.time() - self.t_start)}
+
+    def load_state_dict(self, state: Dict[str, np.ndarray], prefix: str = 'tm_') -> None:
+
+        """Restores state captured by state_dict().
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        prefix : str
+            Prefix of the keys, as passed to state_dict().
+        """
+
+        self.t_start = None
+
+        if f'{prefix}t_elapsed' in state:
+            self.t_start = time.time() - float(state[f'{prefix}t_elapsed'])
+
 
 class EvaluationTerminationManager(BaseTerminationManager):
 
@@ -77,6 +150,13 @@ class EvaluationTerminationManager(BaseTerminationManager):
 
         """Evaluation Termination Manager Class.
 
+        Uses the swarm's exact count of evaluated swallows, so screened and
+        cached candidates do not consume the budget. A swallow of an
+        MOSwarm counts as a single evaluation, however many objectives it
+        is evaluated against. The check is made
+        between iterations, so the final iteration may overrun the budget
+        by at most one population.
+
         Parameters
         ----------
         swarm : BaseSwarm
@@ -86,11 +166,11 @@ class EvaluationTerminationManager(BaseTerminationManager):
         """
 
         self.swarm = swarm
-        self.n_iterations = n_evaluations // swarm.n_swallows
+        self.n_evaluations = n_evaluations
 
     def termination_check(self) -> bool:
 
-        if self.swarm.iteration > self.n_iterations:
+        if self.swarm.n_evaluations >= self.n_evaluations:
             return True
         else:
             return False
@@ -143,3 +223,232 @@ class ErrorTerminationManager(BaseTerminationManager):
         """
 
         return self.target - self.threshold < val < self.target + self.threshold
+
+
+class StagnationTerminationManager(BaseTerminationManager):
+
+    """Terminates optimisation process once gbest stops improving."""
+
+    def __init__(self,
+                 swarm: BaseSwarm,
+                 window: int,
+                 tolerance: float,
+                 relative: bool = False) -> None:
+
+        """Stagnation Termination Manager Class.
+
+        The gbest fitness is sampled once per iteration into a ring buffer
+        holding the last window + 1 values, so the improvement over the
+        window is found without scanning the history.
+
+        Parameters
+        ----------
+        swarm : BaseSwarm
+            Swarm to manage.
+        window : int
+            Number of iterations over which to measure improvement.
+        tolerance : float
+            Improvement at or below which the swarm has stagnated.
+        relative : bool
+            If True, improvement is measured relative to the gbest fitness
+            at the start of the window.
+        """
+
+        self.swarm = swarm
+        self.window = window
+        self.tolerance = tolerance
+        self.relative = relative
+
+        self.fitness = collections.deque(maxlen=window + 1)
+        self.last_iteration = None
+
+    def termination_check(self) -> bool:
+
+        gbest_swallow = self.swarm.gbest_swallow
+
+        if gbest_swallow is None or gbest_swallow.fitness is None:
+            return False
+
+        # a new optimisation has started
+        if self.last_iteration is not None and self.swarm.iteration < self.last_iteration:
+            self.fitness.clear()
+
+        if self.swarm.iteration != self.last_iteration:
+            self.fitness.append(float(gbest_swallow.fitness))
+            self.last_iteration = self.swarm.iteration
+
+        if len(self.fitness) < self.fitness.maxlen:
+            return False
+
+        improvement = self.fitness[0] - self.fitness[-1]
+
+        if self.relative:
+            improvement /= max(abs(self.fitness[0]), 1e-300)
+
+        return improvement <= self.tolerance
+
+    def state_dict(self, prefix: str = 'tm_') -> Dict[str, np.ndarray]:
+
+        """Captures the gbest fitness sampled over the window.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix of the keys, distinguishing nested managers.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Sampled fitness and the iteration of the last sample, -1 if
+            none has been taken.
+        """
+
+        last_iteration = -1 if self.last_iteration is None else self.last_iteration
+
+        return {
+            f'{prefix}fitness': np.asarray(self.fitness, dtype=float),
+            f'{prefix}last_iteration': np.asarray(last_iteration)
+        }
+
+    def load_state_dict(self, state: Dict[str, np.ndarray], prefix: str = 'tm_') -> None:
+
+        """Restores state captured by state_dict().
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        prefix : str
+            Prefix of the keys, as passed to state_dict().
+        """
+
+        self.fitness.clear()
+        self.last_iteration = None
+
+        if f'{prefix}fitness' in state:
+            self.fitness.extend(float(f) for f in state[f'{prefix}fitness'])
+
+            last_iteration = int(state[f'{prefix}last_iteration'])
+            self.last_iteration = None if last_iteration < 0 else last_iteration
+
+
+class IGDTerminationManager(BaseTerminationManager):
+
+    """Terminates optimisation process once the archive is close to a
+    reference front."""
+
+    def __init__(self,
+                 swarm: BaseSwarm,
+                 indicator: QualityIndicator,
+                 target: float,
+                 plus: bool = False) -> None:
+
+        """IGD Termination Manager Class.
+
+        Parameters
+        ----------
+        swarm : BaseSwarm
+            Swarm to manage, which must hold an archive.
+        indicator : QualityIndicator
+            Indicator holding the reference front.
+        target : float
+            Inverted generational distance at or below which to terminate.
+        plus : bool
+            If True, IGD+ is used instead of IGD.
+        """
+
+        self.swarm = swarm
+        self.indicator = indicator
+        self.target = target
+        self.plus = plus
+
+    def termination_check(self) -> bool:
+
+        archive = getattr(self.swarm, 'archive', None)
+
+        if archive is None or not archive.population:
+            return False
+
+        if self.plus:
+            distance = self.indicator.igd_plus(archive)
+        else:
+            distance = self.indicator.igd(archive)
+
+        return distance <= self.target
+
+
+class CompositeTerminationManager(BaseTerminationManager):
+
+    """Terminates optimisation process when any, or all, of several
+    criteria are met."""
+
+    def __init__(self,
+                 managers: List[BaseTerminationManager],
+                 mode: str = 'any') -> None:
+
+        """Composite Termination Manager Class.
+
+        Every manager is checked on each call, without short-circuiting, so
+        that managers which sample the swarm, such as
+        StagnationTerminationManager, see every iteration.
+
+        Parameters
+        ----------
+        managers : List[BaseTerminationManager]
+            Managers to combine.
+        mode : str
+            'any' to terminate when any manager would, 'all' to terminate
+            only when every manager would.
+        """
+
+        if mode not in ('any', 'all'):
+            raise ValueError("mode must be 'any' or 'all'.")
+
+        if not managers:
+            raise ValueError('managers must not be empty.')
+
+        self.managers = list(managers)
+        self.mode = mode
+
+    def termination_check(self) -> bool:
+
+        checks = [manager.termination_check() for manager in self.managers]
+
+        return any(checks) if self.mode == 'any' else all(checks)
+
+    def state_dict(self, prefix: str = 'tm_') -> Dict[str, np.ndarray]:
+
+        """Captures the state of every manager.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix of the keys, extended with the index of each manager.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Arrays holding the state of the managers.
+        """
+
+        state = {}
+
+        for idx, manager in enumerate(self.managers):
+            state.update(manager.state_dict(f'{prefix}{idx}_'))
+
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray], prefix: str = 'tm_') -> None:
+
+        """Restores state captured by state_dict().
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            State to restore.
+        prefix : str
+            Prefix of the keys, as passed to state_dict().
+        """
+
+        for idx, manager in enumerate(self.managers):
+            manager.load_state_dict(state, f'{prefix}{idx}_')
@@ -0,0 +1,53 @@
+import pytest
+
+from pyswallow.benchmarks.__main__ import main
+from pyswallow.benchmarks.runner import *
+
+
+def setup_workload(n):
+    def workload():
+        sum(range(n))
+        return n
+
+    return workload
+
+
+class TestRunner:
+
+    @pytest.fixture
+    def result(self):
+        return run_benchmark('sum', setup_workload, {'n': 1000}, repeat=2)
+
+    def test_run_benchmark(self, result):
+        assert result.key == 'sum[n=1000]'
+        assert result.seconds > 0.0
+        assert result.evaluations_per_second == pytest.approx(1000 / result.seconds)
+        assert result.peak_memory >= 0
+
+    def test_save_load(self, result, tmp_path):
+        path = str(tmp_path / 'results.json')
+        save_results([result], path)
+
+        assert load_results(path) == [result]
+
+    def test_compare(self, result):
+        slower = result._replace(seconds=result.seconds * 1.5)
+        larger = result._replace(peak_memory=result.peak_memory * 3 + 100)
+
+        assert compare([result], [result]) == []
+        assert compare([slower], [result], threshold=0.6) == []
+
+        regressions = compare([slower], [result], threshold=0.2)
+        assert [r.metric for r in regressions] == ['seconds']
+        assert regressions[0].ratio == pytest.approx(1.5)
+
+        assert compare([larger], [result]) == []
+        assert compare([larger], [result], memory_threshold=0.5)[0].metric == 'peak_memory'
+
+    def test_main(self, tmp_path):
+        output = str(tmp_path / 'results.json')
+        args = ['-q', '-r', '1', '-k', 'archive', '-o', output]
+
+        assert main(args) == 0
+        assert len(load_results(output)) == 1
+        assert main(args + ['-b', output, '-t', '1000']) == 0
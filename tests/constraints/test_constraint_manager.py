@@ -1,7 +1,12 @@
+import time
+
+import numpy as np
 import pytest
 
 from pyswallow.opt.sopso import Swarm
-from pyswallow.constraints.base_constraints import PositionConstraint
+from pyswallow.constraints.base_constraints import (
+    PositionConstraint, FitnessConstraint
+)
 from pyswallow.constraints.constraint_manager import ConstraintManager
 
 
@@ -28,6 +33,29 @@ class TestConstraintManager:
 
         return TestConstraint
 
+    @pytest.fixture
+    def batch_constraint(self):
+        class TestConstraint(PositionConstraint):
+
+            batched = True
+
+            def constrain(self, position):
+                return position['x1'] > 0.0
+
+            def constrain_batch(self, positions):
+                return positions[:, 1] > 0.0
+
+        return TestConstraint
+
+    @pytest.fixture
+    def fit_constraint(self):
+        class TestConstraint(FitnessConstraint):
+
+            def constrain(self, swallow):
+                return swallow.fitness < 5.0
+
+        return TestConstraint
+
     def test_violates_position(self, swarm, pos_constraint):
         swallow = swarm.population[0]
         swallow.position[0] = -10.0
@@ -41,3 +69,114 @@ class TestConstraintManager:
         constraints_manager.register_constraint(pos_constraint())
 
         assert len(constraints_manager.constraints) == 1
+
+    def test_partition(self, swarm, pos_constraint, fit_constraint):
+        constraints_manager = ConstraintManager(swarm)
+        constraints_manager.register_constraint(pos_constraint())
+        constraints_manager.register_constraint(fit_constraint())
+
+        assert len(constraints_manager.position_constraints) == 1
+        assert len(constraints_manager.fitness_constraints) == 1
+
+    def test_position_mask(self, swarm, pos_constraint, batch_constraint):
+        for idx, swallow in enumerate(swarm.population):
+            swallow.position[0] = -1.0 if idx % 2 else 1.0
+            swallow.position[1] = -1.0 if idx % 3 else 1.0
+
+        constraints_manager = ConstraintManager(swarm)
+        constraints_manager.register_constraint(batch_constraint())
+        constraints_manager.register_constraint(pos_constraint())
+        mask = constraints_manager.position_mask(swarm.population)
+
+        expected = [not constraints_manager.violates_position(s)
+                    for s in swarm.population]
+
+        assert mask.dtype == bool
+        assert np.array_equal(mask, expected)
+        assert np.array_equal(np.flatnonzero(mask), [0, 6])
+
+    def test_constrain_batch_fallback(self, swarm, fit_constraint):
+        class PartlyBatched(PositionConstraint):
+
+            batched = True
+
+            def constrain(self, swallow):
+                return swallow.position[0] > 0.0
+
+            def constrain_batch(self, positions, swallows=None):
+                return super().constrain_batch(positions, swallows)
+
+        positions = np.array([[1.0, 0.0], [-1.0, 0.0]])
+        assert np.array_equal(PartlyBatched().constrain_batch(positions),
+                              [True, False])
+
+        fitness = np.array([1.0, 10.0, 2.0])
+        assert np.array_equal(fit_constraint().constrain_batch(fitness),
+                              [True, False, True])
+
+        constraints_manager = ConstraintManager(swarm)
+        constraints_manager.register_constraint(PartlyBatched())
+        mask = constraints_manager.position_mask(swarm.population)
+
+        assert np.array_equal(mask, [s.position[0] > 0.0
+                                     for s in swarm.population])
+
+    def test_feasible_mask(self, swarm, pos_constraint, fit_constraint):
+        for idx, swallow in enumerate(swarm.population):
+            swallow.position[0] = 1.0
+            swallow.fitness = float(idx)
+
+        swarm.population[0].position[0] = -1.0
+
+        constraints_manager = ConstraintManager(swarm)
+        constraints_manager.register_constraint(pos_constraint())
+        constraints_manager.register_constraint(fit_constraint())
+        mask = constraints_manager.feasible_mask(swarm.population)
+
+        assert np.array_equal(np.flatnonzero(mask), [1, 2, 3, 4])
+
+    def test_adaptive_order(self, swarm):
+        class Expensive(PositionConstraint):
+
+            def constrain(self, swallow):
+                time.sleep(1e-3)
+                return True
+
+        class Cheap(PositionConstraint):
+
+            def constrain(self, swallow):
+                return swallow['x0'] > 0.0
+
+        for idx, swallow in enumerate(swarm.population):
+            swallow.position[0] = -1.0 if idx % 2 else 1.0
+
+        expensive, cheap = Expensive(), Cheap()
+
+        constraints_manager = ConstraintManager(swarm)
+        constraints_manager.register_constraint(expensive)
+        constraints_manager.register_constraint(cheap)
+
+        mask = constraints_manager.position_mask(swarm.population)
+        assert np.array_equal(np.flatnonzero(mask), [0, 2, 4, 6, 8])
+
+        constraints_manager.reorder()
+        assert constraints_manager.position_constraints == [cheap, expensive]
+
+        mask = constraints_manager.position_mask(swarm.population)
+        summary = constraints_manager.summary()
+
+        assert np.array_equal(np.flatnonzero(mask), [0, 2, 4, 6, 8])
+        assert summary[0]['n_checked'] == 15
+        assert summary[1]['n_checked'] == 20
+        assert summary[1]['n_rejected'] == 10
+
+    def test_cost_hint(self, swarm, pos_constraint, batch_constraint):
+        slow, fast = pos_constraint(), batch_constraint()
+
+        constraints_manager = ConstraintManager(swarm)
+        constraints_manager.register_constraint(slow, cost_hint=1.0)
+        constraints_manager.register_constraint(fast, cost_hint=1e-6)
+        constraints_manager.reorder()
+
+        assert constraints_manager.position_constraints == [fast, slow]
+        assert constraints_manager.statistics[0].mean_cost == 1.0
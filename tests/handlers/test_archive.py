@@ -1,7 +1,7 @@
 import pytest
 
 import pyswallow as ps
-from pyswallow.handlers.archive import Archive
+from pyswallow.handlers.archive import Archive, IndexedArchive
 
 
 class TestArchive:
@@ -47,6 +47,15 @@ class TestArchive:
             else:
                 assert swallow.sparsity == 4
 
+    def test_pareto_front(self, archive):
+        for fitness in ([1.0, 4.0], [4.0, 1.0], [2.0, 3.0], [0.5, 0.5], [3.0, 3.0]):
+            _swallow = ps.MOSwallow({'x0': [0.0, 1.0]}, 2)
+            _swallow.fitness = fitness
+            archive.add_swallow(_swallow)
+
+        archive.pareto_front()
+        assert [s.fitness for s in archive.population] == [[0.5, 0.5]]
+
     @pytest.mark.parametrize('n_limit', [15, 30, 45])
     def test_sparsity_limit(self, pop_archive, n_limit):
         pop_archive.assign_sparsity()
@@ -65,3 +74,57 @@ class TestArchive:
 
         if method == 1:
             assert leader.sparsity == 4
+
+
+class TestIndexedArchive:
+
+    @pytest.fixture
+    def bounds(self):
+        return {'x0': [0.0, 5.0], 'x1': [0.0, 5.0]}
+
+    @pytest.fixture
+    def archive(self, bounds):
+        archive = IndexedArchive(n_objectives=2, max_leaf=4)
+
+        for i in range(30):
+            swallow = ps.MOSwallow(bounds, 2)
+            swallow.fitness = [i, 29 - i]
+            archive.add_swallow(swallow)
+
+        return archive
+
+    def test_add_swallow(self, archive, bounds):
+        dominated = ps.MOSwallow(bounds, 2)
+        dominated.fitness = [10.0, 25.0]
+        archive.add_swallow(dominated)
+
+        assert len(archive.population) == 30
+
+        dominating = ps.MOSwallow(bounds, 2)
+        dominating.fitness = [5.0, 5.0]
+        archive.add_swallow(dominating)
+
+        assert len(archive.population) == 30 - 20 + 1
+        assert len(archive.index) == len(archive.population)
+
+    def test_pareto_front(self, archive):
+        archive.pareto_front()
+        assert len(archive.population) == 30
+
+    @pytest.mark.parametrize('n_limit', [15, 30, 45])
+    def test_sparsity_limit(self, archive, n_limit):
+        archive.assign_sparsity()
+        archive.sparsity_limit(n_limit)
+        _s = sorted([s.sparsity for s in archive.population], reverse=True)
+
+        assert len(archive.population) == min(n_limit, 30)
+        assert len(archive.index) == len(archive.population)
+        assert _s[:2] == [float('inf'), float('inf')]
+
+    @pytest.mark.parametrize('method', [0, 1])
+    def test_choose_leader(self, archive, method):
+        archive.assign_sparsity()
+        leader = archive.choose_leader(method)
+
+        assert isinstance(leader, ps.MOSwallow)
+        assert not any(leader is m for m in archive.population)
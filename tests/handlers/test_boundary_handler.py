@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 
 from pyswallow.handlers.boundary_handler import (
-    StandardBH, NearestBH, ReflectiveBH, RandomBH
+    StandardBH, NearestBH, ReflectiveBH, PeriodicBH, RandomBH
 )
 
 
@@ -59,6 +59,48 @@ class TestBoundaryHandler:
         elif pos == [15, 15]:
             assert np.array_equal(ret_pos, np.array([5, 5]))
 
+    @pytest.mark.parametrize('pos, expected', [
+        ([-25.0, 35.0], [5.0, 5.0]),
+        ([-1003.0, 1003.0], [3.0, 3.0]),
+        ([20.0, -20.0], [0.0, 0.0]),
+        ([0.0, 10.0], [0.0, 10.0]),
+    ])
+    def test_reflective_large_overshoot(self, bounds, pos, expected):
+        lb, ub = bounds
+        bh = ReflectiveBH(lb, ub)
+
+        assert np.allclose(bh(np.array(pos)), expected)
+
+    def test_reflective_matches_repeated_reflection(self, bounds):
+        lb, ub = bounds
+        bh = ReflectiveBH(lb, ub)
+        rng = np.random.default_rng(0)
+
+        for pos in rng.uniform(-100.0, 100.0, size=(100, 2)):
+            expected = pos.copy()
+            while np.any(expected < lb) or np.any(expected > ub):
+                expected = np.where(expected < lb, 2 * lb - expected, expected)
+                expected = np.where(expected > ub, 2 * ub - expected, expected)
+
+            assert np.allclose(bh(pos), expected)
+
+    def test_reflective_zero_width(self):
+        bh = ReflectiveBH(np.array([1.0]), np.array([1.0]))
+        assert np.array_equal(bh(np.array([3.0])), [1.0])
+
+    @pytest.mark.parametrize('pos, expected', [
+        ([-5.0, 5.0], [5.0, 5.0]),
+        ([15.0, -1003.0], [5.0, 7.0]),
+        ([10.0, 0.0], [10.0, 0.0]),
+    ])
+    def test_periodic(self, bounds, pos, expected):
+        lb, ub = bounds
+        bh = PeriodicBH(lb, ub)
+        ret_pos = bh(np.array(pos))
+
+        assert np.logical_and(ret_pos >= lb, ret_pos <= ub).all()
+        assert np.allclose(ret_pos, expected)
+
     @pytest.mark.parametrize('pos', [[-5, -5], [5, 5], [15, 15]])
     def test_random(self, bounds, pos):
         lb, ub = bounds
@@ -68,3 +110,47 @@ class TestBoundaryHandler:
 
         assert len(pos) == len(ret_pos)
         assert np.logical_and(ret_pos >= lb, ret_pos <= ub).all()
+
+
+class TestPopulationBoundaryHandler:
+
+    @pytest.fixture
+    def bounds(self):
+        return np.array([0.0, -1.0, 2.0]), np.array([10.0, 1.0, 4.0])
+
+    @pytest.fixture
+    def positions(self):
+        return np.random.default_rng(0).uniform(-30.0, 30.0, size=(50, 3))
+
+    @pytest.mark.parametrize('cls', [NearestBH, ReflectiveBH, PeriodicBH])
+    def test_matches_rows(self, cls, bounds, positions):
+        bh = cls(*bounds)
+        expected = np.array([bh(row.copy()) for row in positions])
+
+        assert np.array_equal(bh(positions.copy()), expected)
+
+    @pytest.mark.parametrize('cls', [StandardBH, NearestBH, ReflectiveBH,
+                                     PeriodicBH, RandomBH])
+    def test_out(self, cls, bounds, positions):
+        bh = cls() if cls is StandardBH else cls(*bounds)
+        original = positions.copy()
+
+        out = np.empty_like(positions)
+        ret = bh(positions, out=out)
+        assert ret is out
+        assert np.array_equal(positions, original)
+
+        ret = bh(positions, out=positions)
+        assert ret is positions
+
+        if cls is not StandardBH:
+            lb, ub = bounds
+            assert np.all((ret >= lb) & (ret <= ub))
+
+    def test_scratch_reused(self, bounds, positions):
+        bh = ReflectiveBH(*bounds)
+        bh(positions.copy(), out=positions.copy())
+        buffers = {k: id(v) for k, v in bh._buffers.items()}
+
+        bh(positions.copy(), out=positions.copy())
+        assert {k: id(v) for k, v in bh._buffers.items()} == buffers
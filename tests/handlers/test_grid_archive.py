@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+import pyswallow as ps
+from pyswallow.handlers.grid_archive import GridArchive
+from pyswallow.utils.functions.multi_objective import schaffer_n1
+
+
+class TestGridArchive:
+
+    @pytest.fixture
+    def bounds(self):
+        return {'x0': [0.0, 5.0], 'x1': [0.0, 5.0]}
+
+    @pytest.fixture
+    def archive(self):
+        return GridArchive(n_objectives=2, n_divisions=5)
+
+    @pytest.fixture
+    def pop_archive(self, archive, bounds):
+        for i in range(30):
+            swallow = ps.MOSwallow(bounds, 2)
+            swallow.fitness = [i, 29 - i]
+            archive.add_swallow(swallow)
+
+        return archive
+
+    def test_add_swallow(self, archive, bounds):
+        swallow = ps.MOSwallow(bounds, 2)
+        swallow.fitness = [1.0, 1.0]
+        archive.add_swallow(swallow)
+
+        assert len(archive.population) == 1
+        assert archive.population[0] is not swallow
+
+    def test_add_dominated(self, pop_archive, bounds):
+        swallow = ps.MOSwallow(bounds, 2)
+        swallow.fitness = [10.0, 25.0]
+        pop_archive.add_swallow(swallow)
+
+        assert len(pop_archive.population) == 30
+
+    def test_add_dominating(self, pop_archive, bounds):
+        swallow = ps.MOSwallow(bounds, 2)
+        swallow.fitness = [-1.0, -1.0]
+        pop_archive.add_swallow(swallow)
+
+        assert len(pop_archive.population) == 1
+        assert pop_archive.population[0].fitness == [-1.0, -1.0]
+
+    def test_rebuild(self, pop_archive, bounds):
+        swallow = ps.MOSwallow(bounds, 2)
+        swallow.fitness = [-100.0, 100.0]
+        pop_archive.add_swallow(swallow)
+
+        assert pop_archive.lower[0] < -100.0
+        assert pop_archive.upper[1] > 100.0
+        assert len(pop_archive.population) == 31
+
+    def test_cells(self, pop_archive):
+        n_members = sum(len(cell) for cell in pop_archive.grid.values())
+
+        assert n_members == len(pop_archive.population)
+        for key in pop_archive.grid:
+            assert all(0 <= k < pop_archive.n_divisions for k in key)
+
+    def test_assign_sparsity(self, pop_archive):
+        pop_archive.assign_sparsity()
+
+        for cell in pop_archive.grid.values():
+            for member in cell:
+                assert member.sparsity == 1.0 / len(cell)
+
+    @pytest.mark.parametrize('n_limit', [10, 30, 45])
+    def test_sparsity_limit(self, pop_archive, n_limit):
+        pop_archive.sparsity_limit(n_limit)
+        counts = [len(cell) for cell in pop_archive.grid.values()]
+
+        assert len(pop_archive.population) == min(n_limit, 30)
+        assert max(counts) - min(counts) <= 1 or n_limit >= 30
+
+    @pytest.mark.parametrize('method', [0, 1])
+    def test_choose_leader(self, pop_archive, method):
+        leader = pop_archive.choose_leader(method)
+
+        assert isinstance(leader, ps.MOSwallow)
+        assert not any(leader is m for m in pop_archive.population)
+        assert any(np.array_equal(leader.fitness, m.fitness)
+                   for m in pop_archive.population)
+
+    def test_population_cached(self, pop_archive):
+        population = pop_archive.population
+        assert pop_archive.population is population
+
+        pop_archive.sparsity_limit(n_limit=len(population) - 1)
+        assert pop_archive.population is not population
+        assert len(pop_archive.population) == len(population) - 1
+
+    def test_optimise(self):
+        optimiser = ps.MOSwarm(
+            bounds={'x0': [0.0, 2.0]}, n_swallows=20, n_iterations=20
+        )
+        optimiser.archive_cls = GridArchive
+        optimiser.optimise(schaffer_n1())
+
+        assert isinstance(optimiser.archive, GridArchive)
+        assert 0 < len(optimiser.archive.population) <= 20
+
+        fitness = np.asarray([m.fitness for m in optimiser.archive.population])
+        assert np.all(fitness >= 0.0)
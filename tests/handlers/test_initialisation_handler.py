@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+import pyswallow as ps
+from pyswallow.handlers.initialisation_handler import (
+    StandardIH, LatinHypercubeIH, HaltonIH, SobolIH, OppositionIH,
+    primes, sobol_directions
+)
+
+
+class TestInitialisationHandler:
+
+    @pytest.fixture
+    def bounds(self):
+        return {'x0': [-5.0, 5.0], 'x1': [0.0, 1.0], 'x2': [10.0, 20.0]}
+
+    @pytest.mark.parametrize('ih', [
+        StandardIH(), LatinHypercubeIH(), LatinHypercubeIH(centred=True),
+        HaltonIH(), HaltonIH(scramble=False), SobolIH(),
+        SobolIH(scramble=False), OppositionIH(), OppositionIH(SobolIH())
+    ])
+    def test_within_bounds(self, ih, bounds):
+        position, velocity = ih(bounds, 17)
+        lb, ub = np.array([-5.0, 0.0, 10.0]), np.array([5.0, 1.0, 20.0])
+
+        assert position.shape == velocity.shape == (17, 3)
+        assert np.all((position >= lb) & (position <= ub))
+        assert np.all((velocity >= lb) & (velocity <= ub))
+
+    def test_standard_ih_matches_swallows(self, bounds):
+        np.random.seed(0)
+        swallows = [ps.Swallow(bounds) for _ in range(5)]
+
+        np.random.seed(0)
+        position, velocity = StandardIH()(bounds, 5)
+
+        for idx, swallow in enumerate(swallows):
+            assert np.array_equal(position[idx], swallow.position)
+            assert np.array_equal(velocity[idx], swallow.velocity)
+
+    @pytest.mark.parametrize('centred', [False, True])
+    def test_latin_hypercube(self, centred):
+        points = LatinHypercubeIH(centred).sample(10, 4)
+        strata = np.sort(np.floor(points * 10), axis=0)
+
+        assert np.array_equal(strata, np.tile(np.arange(10.0)[:, None], (1, 4)))
+
+    def test_primes(self):
+        assert np.array_equal(primes(10), [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+        assert primes(1000)[-1] == 7919
+
+    def test_halton(self):
+        points = HaltonIH(scramble=False).sample(5, 2)
+        expected = [[0.0, 0.0], [0.5, 1 / 3], [0.25, 2 / 3],
+                    [0.75, 1 / 9], [0.125, 4 / 9]]
+
+        assert np.allclose(points, expected)
+
+    def test_sobol(self):
+        points = SobolIH(scramble=False).sample(8, 3)
+        expected = [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [0.75, 0.25, 0.25],
+                    [0.25, 0.75, 0.75], [0.375, 0.375, 0.625],
+                    [0.875, 0.875, 0.125], [0.625, 0.125, 0.875],
+                    [0.125, 0.625, 0.375]]
+
+        assert np.array_equal(points, expected)
+
+    @pytest.mark.parametrize('ih', [HaltonIH(), SobolIH()])
+    def test_scrambled_strata(self, ih):
+        np.random.seed(0)
+        points = ih.sample(16, 2)
+
+        # scrambling preserves the stratification of the sequences
+        if isinstance(ih, SobolIH):
+            cells = np.floor(points * 4).astype(int) @ [4, 1]
+            assert np.array_equal(np.bincount(cells, minlength=16), np.ones(16))
+        else:
+            cells = np.floor(points * [2, 3]).astype(int) @ [3, 1]
+            assert np.bincount(cells, minlength=6).min() >= 2
+
+    def test_sobol_dimensions(self):
+        assert sobol_directions(21).shape == (21, 30)
+
+        with pytest.raises(ValueError):
+            sobol_directions(22)
+
+    def test_sobol_fallback(self):
+        with pytest.warns(UserWarning):
+            points = SobolIH().sample(8, 30)
+
+        assert points.shape == (8, 30)
+        assert np.all((points >= 0.0) & (points < 1.0))
+
+    def test_opposition(self):
+        np.random.seed(0)
+        points = OppositionIH().sample(7, 3)
+
+        assert np.allclose(points[4:], 1.0 - points[:3])
+
+    def test_swarm(self, bounds):
+        optimiser = ps.Swarm(bounds, n_swallows=8, n_iterations=10)
+        optimiser.ih = LatinHypercubeIH()
+        optimiser.reset_environment()
+        optimiser.initialise_swarm()
+
+        position = np.array([s.position for s in optimiser.population])
+        strata = np.floor((position[:, 0] + 5.0) / 10.0 * 8)
+
+        assert np.array_equal(np.sort(strata), np.arange(8))
+
+    def test_mo_swarm(self, bounds):
+        optimiser = ps.MOSwarm(bounds, n_swallows=6, n_iterations=10)
+        optimiser.n_objs = 2
+        optimiser.ih = HaltonIH()
+        optimiser.reset_environment()
+        optimiser.initialise_swarm()
+
+        assert len(optimiser.population) == 6
+        assert all(isinstance(s, ps.MOSwallow) for s in optimiser.population)
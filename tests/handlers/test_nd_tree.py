@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from pyswallow.handlers.nd_tree import NDTree
+
+
+def brute_dominated(points, point, weak=False):
+    dominates = np.all(points <= point, axis=1)
+    if not weak:
+        dominates &= np.any(points < point, axis=1)
+    return bool(dominates.any())
+
+
+class Item:
+
+    def __init__(self, idx):
+        self.idx = idx
+
+
+class TestNDTree:
+
+    @pytest.fixture
+    def points(self):
+        rng = np.random.RandomState(0)
+        return rng.uniform(0.0, 1.0, size=(500, 3))
+
+    @pytest.fixture
+    def items(self, points):
+        return [Item(idx) for idx in range(points.shape[0])]
+
+    @pytest.fixture
+    def tree(self, points, items):
+        tree = NDTree(n_objectives=3, max_leaf=8)
+        for point, item in zip(points, items):
+            tree.insert(point, item)
+
+        return tree
+
+    def test_insert(self, tree, points):
+        assert len(tree) == points.shape[0]
+        assert sorted(i.idx for i in tree) == list(range(points.shape[0]))
+
+    @pytest.mark.parametrize('weak', [True, False])
+    def test_is_dominated(self, tree, points, weak):
+        rng = np.random.RandomState(1)
+
+        for query in rng.uniform(-0.2, 0.6, size=(200, 3)):
+            expected = brute_dominated(points, query, weak)
+            assert tree.is_dominated(query, weak=weak) == expected
+
+        assert tree.is_dominated(points[0], weak=True)
+
+    def test_dominated_by(self, tree, points):
+        rng = np.random.RandomState(2)
+
+        for query in rng.uniform(-0.2, 0.8, size=(100, 3)):
+            mask = (np.all(query <= points, axis=1)
+                    & np.any(query < points, axis=1))
+
+            assert sorted(i.idx for i in tree.dominated_by(query)) == \
+                list(np.flatnonzero(mask))
+
+    def test_remove(self, tree, points, items):
+        for item in items[::2]:
+            tree.remove(item)
+
+        remaining = points[1::2]
+
+        assert len(tree) == remaining.shape[0]
+        assert sorted(i.idx for i in tree) == list(range(1, points.shape[0], 2))
+
+        for query in points[::2]:
+            assert tree.is_dominated(query) == brute_dominated(remaining, query)
+
+    def test_remove_all(self, tree, items):
+        for item in items:
+            tree.remove(item)
+
+        assert len(tree) == 0
+        assert tree.root is None
+        assert not tree.is_dominated(np.zeros(3))
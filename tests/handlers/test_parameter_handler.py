@@ -0,0 +1,155 @@
+import numpy as np
+import pytest
+
+import pyswallow as ps
+from pyswallow.handlers.parameter_handler import (
+    StandardPH, SuccessPH, DistancePH
+)
+from pyswallow.utils.checkpoint import Checkpointer
+
+
+def sphere(position):
+    return float(np.sum(np.square(position)))
+
+
+class TestParameterHandler:
+
+    @pytest.fixture
+    def optimiser(self):
+        bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+        optimiser = ps.Swarm(bounds, n_swallows=5, n_iterations=20)
+        optimiser.reset_environment()
+        optimiser.initialise_swarm()
+
+        for idx, swallow in enumerate(optimiser.population):
+            swallow.pbest_fitness = float(idx)
+
+        optimiser.gbest_swallow = optimiser.population[0]
+
+        return optimiser
+
+    @staticmethod
+    def positions(optimiser):
+        return np.array([swallow.position for swallow in optimiser.population])
+
+    def test_standard_ph(self, optimiser):
+        optimiser.w, optimiser.c1, optimiser.c2 = 0.6, 1.2, 1.8
+        ph = StandardPH()
+
+        assert ph(optimiser, self.positions(optimiser)) == (0.6, 1.2, 1.8)
+
+    def test_success_ph(self, optimiser):
+        ph = SuccessPH(w_min=0.4, w_max=0.8, c_min=1.0, c_max=2.0,
+                       smoothing=0.5)
+
+        w, c1, c2 = ph(optimiser, self.positions(optimiser))
+        assert np.allclose(w, 0.6)
+        assert np.allclose(c1, 1.5)
+        assert np.allclose(c2, 1.5)
+
+        optimiser.population[1].pbest_fitness = -1.0
+        w, c1, c2 = ph(optimiser, self.positions(optimiser))
+
+        assert np.allclose(ph.success, [0.25, 0.75, 0.25, 0.25, 0.25])
+        assert w[1] == pytest.approx(0.5)
+        assert c1[1] == pytest.approx(1.75)
+        assert c2[1] == pytest.approx(1.25)
+        assert w.shape == c1.shape == c2.shape == (5,)
+
+    def test_success_ph_population_size(self, optimiser):
+        ph = SuccessPH()
+        ph(optimiser, self.positions(optimiser))
+        ph.success[:] = 1.0
+
+        optimiser.initialise_population(8)
+        ph(optimiser, self.positions(optimiser))
+
+        assert np.array_equal(ph.success, np.full(8, 0.5))
+
+    def test_success_ph_restart(self, optimiser):
+        ph = SuccessPH()
+        ph(optimiser, self.positions(optimiser))
+        ph.success[:] = 1.0
+
+        optimiser.n_restarts += 1
+        optimiser.initialise_population(5)
+        ph(optimiser, self.positions(optimiser))
+
+        assert np.array_equal(ph.success, np.full(5, 0.5))
+
+    def test_success_ph_state_dict(self, optimiser):
+        ph = SuccessPH()
+        assert ph.state_dict() == {}
+
+        ph(optimiser, self.positions(optimiser))
+        optimiser.population[2].pbest_fitness = -1.0
+        ph(optimiser, self.positions(optimiser))
+
+        restored = SuccessPH()
+        restored.load_state_dict(ph.state_dict())
+
+        assert np.array_equal(restored.success, ph.success)
+        assert np.array_equal(restored.pbest_fitness, ph.pbest_fitness)
+        assert restored.n_restarts == ph.n_restarts
+
+        restored.reset()
+        assert restored.success is None
+
+    def test_success_ph_smoothing(self):
+        with pytest.raises(ValueError):
+            SuccessPH(smoothing=0.0)
+
+    def test_distance_ph(self, optimiser):
+        ph = DistancePH(w_min=0.4, w_max=0.8, c_min=1.0, c_max=2.0)
+
+        for idx, swallow in enumerate(optimiser.population):
+            swallow.position = np.array([float(idx), 0.0])
+
+        w, c1, c2 = ph(optimiser, self.positions(optimiser))
+
+        assert np.allclose(w, [0.8, 0.7, 0.6, 0.5, 0.4])
+        assert np.allclose(c1, [1.0, 1.25, 1.5, 1.75, 2.0])
+        assert np.allclose(c2, [2.0, 1.75, 1.5, 1.25, 1.0])
+
+    def test_distance_ph_collapsed(self, optimiser):
+        for swallow in optimiser.population:
+            swallow.position = np.array([1.0, 1.0])
+
+        w, c1, c2 = DistancePH()(optimiser, self.positions(optimiser))
+
+        assert np.allclose(w, 0.9)
+        assert np.allclose(c1, 1.5)
+        assert np.allclose(c2, 2.5)
+
+    @pytest.mark.parametrize('ph', [SuccessPH, DistancePH])
+    def test_swarm(self, ph):
+        np.random.seed(0)
+        bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+        optimiser = ps.Swarm(bounds, n_swallows=10, n_iterations=50)
+        optimiser.ph = ph()
+        optimiser.optimise(sphere)
+
+        assert optimiser.gbest_swallow.fitness < 1e-2
+
+    def test_resume(self, tmp_path):
+        bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+        path = str(tmp_path / 'checkpoint.npz')
+
+        np.random.seed(0)
+        optimiser = ps.Swarm(bounds, n_swallows=10, n_iterations=20)
+        optimiser.ph = SuccessPH()
+        optimiser.optimise(sphere)
+
+        np.random.seed(0)
+        interrupted = ps.Swarm(bounds, n_swallows=10, n_iterations=10)
+        interrupted.ph = SuccessPH()
+        interrupted.checkpointer = Checkpointer(freq=10, path=path,
+                                                background=False)
+        interrupted.optimise(sphere)
+
+        resumed = ps.Swarm(bounds, n_swallows=10, n_iterations=20)
+        resumed.ph = SuccessPH()
+        resumed.resume(path, sphere)
+
+        assert np.array_equal(resumed.ph.success, optimiser.ph.success)
+        assert resumed.gbest_swallow.fitness == optimiser.gbest_swallow.fitness
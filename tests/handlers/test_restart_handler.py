@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+import pyswallow as ps
+from pyswallow.handlers.restart_handler import (
+    StandardRH, DiversityRH, swarm_diversity
+)
+from pyswallow.utils.checkpoint import Checkpointer
+
+
+def sphere(position):
+    return float(np.sum(np.square(position)))
+
+
+class TestRestartHandler:
+
+    @pytest.fixture
+    def optimiser(self):
+        bounds = {'x0': [-10.0, 10.0], 'x1': [0.0, 1.0]}
+        optimiser = ps.Swarm(bounds, n_swallows=10, n_iterations=20)
+        optimiser.reset_environment()
+        optimiser.initialise_swarm()
+
+        return optimiser
+
+    def collapse(self, optimiser):
+        for swallow in optimiser.population:
+            swallow.position = np.array([1.0, 0.5])
+
+    @pytest.mark.parametrize('measure', ['centroid', 'diameter'])
+    def test_swarm_diversity(self, optimiser, measure):
+        lb, ub = optimiser.lb, optimiser.ub
+        assert swarm_diversity(optimiser.population, lb, ub, measure) > 0.0
+
+        self.collapse(optimiser)
+        assert swarm_diversity(optimiser.population, lb, ub, measure) == pytest.approx(0.0)
+
+    def test_swarm_diversity_normalised(self, optimiser):
+        optimiser.population[0].position = optimiser.lb.copy()
+        optimiser.population[1].position = optimiser.ub.copy()
+
+        diversity = swarm_diversity(optimiser.population[:2],
+                                    optimiser.lb, optimiser.ub, 'diameter')
+        assert diversity == pytest.approx(1.0)
+
+    def test_standard_rh(self, optimiser):
+        self.collapse(optimiser)
+        assert StandardRH()(optimiser) is None
+
+    def test_diversity_rh(self, optimiser):
+        rh = DiversityRH(threshold=1e-3)
+        assert rh(optimiser) is None
+
+        self.collapse(optimiser)
+        assert rh(optimiser) == 10
+        assert rh.diversity == pytest.approx(0.0)
+
+    @pytest.mark.parametrize('growth, max_swallows, expected', [
+        (2.0, None, 20), (2.0, 15, 15), (1.5, None, 15)
+    ])
+    def test_growth(self, optimiser, growth, max_swallows, expected):
+        self.collapse(optimiser)
+        rh = DiversityRH(growth=growth, max_swallows=max_swallows)
+
+        assert rh(optimiser) == expected
+
+    def test_growth_compounds(self, optimiser):
+        rh = DiversityRH(growth=2.0, max_swallows=35)
+
+        self.collapse(optimiser)
+        optimiser.restart(rh(optimiser))
+        assert len(optimiser.population) == 20
+
+        self.collapse(optimiser)
+        optimiser.restart(rh(optimiser))
+        assert len(optimiser.population) == 35
+
+    def test_invalid_measure(self):
+        with pytest.raises(ValueError):
+            DiversityRH(measure='variance')
+
+
+class TestSwarmRestart:
+
+    @pytest.fixture
+    def optimiser(self):
+        bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+        optimiser = ps.Swarm(bounds, n_swallows=10, n_iterations=60)
+        optimiser.rh = DiversityRH(threshold=5e-2, growth=2.0, max_swallows=40)
+
+        return optimiser
+
+    def test_restart(self, optimiser):
+        np.random.seed(0)
+        optimiser.optimise(sphere)
+        restarts = optimiser.history.arr_restarts
+
+        assert optimiser.n_restarts > 0
+        assert restarts[-1] == optimiser.n_restarts
+        assert np.all(np.diff(restarts) >= 0)
+        assert optimiser.n_swallows == 10
+        assert len(optimiser.population) == min(10 * 2 ** optimiser.n_restarts, 40)
+
+    def test_gbest_kept(self, optimiser):
+        np.random.seed(0)
+        best = []
+        for _ in optimiser.iter_optimise(sphere):
+            best.append(optimiser.gbest_swallow.fitness)
+
+        assert optimiser.n_restarts > 0
+        assert np.all(np.diff(best) <= 0.0)
+
+    def test_resume(self, optimiser, tmp_path):
+        np.random.seed(0)
+        path = str(tmp_path / 'checkpoint.npz')
+        optimiser.checkpointer = Checkpointer(freq=30, path=path,
+                                              background=False)
+        optimiser.optimise(sphere)
+
+        bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+        resumed = ps.Swarm(bounds, n_swallows=10, n_iterations=60)
+        resumed.rh = DiversityRH(threshold=5e-2, growth=2.0, max_swallows=40)
+        resumed.resume(path, sphere)
+
+        assert resumed.n_restarts == optimiser.n_restarts
+        assert len(resumed.population) == len(optimiser.population)
+        assert resumed.gbest_swallow.fitness == optimiser.gbest_swallow.fitness
@@ -64,3 +64,31 @@ class TestVelocityHandler:
             assert np.array_equal(ret_vel, arr_vel)
         elif vel == [15, 15]:
             assert np.array_equal(ret_vel, np.zeros(2))
+
+
+class TestPopulationVelocityHandler:
+
+    @pytest.fixture
+    def bounds(self):
+        return np.array([-1.0, -2.0]), np.array([1.0, 2.0])
+
+    @pytest.fixture
+    def velocities(self):
+        return np.random.default_rng(0).uniform(-4.0, 4.0, size=(50, 2))
+
+    @pytest.mark.parametrize('cls', [ClampedVH, InvertVH, ZeroVH])
+    def test_matches_rows(self, cls, bounds, velocities):
+        vh = cls(*bounds)
+        expected = np.array([vh(row.copy()) for row in velocities])
+
+        assert np.array_equal(vh(velocities.copy()), expected)
+
+    @pytest.mark.parametrize('cls', [StandardVH, ClampedVH, InvertVH, ZeroVH])
+    def test_out(self, cls, bounds, velocities):
+        vh = cls() if cls is StandardVH else cls(*bounds)
+        original = velocities.copy()
+
+        out = np.empty_like(velocities)
+        assert vh(velocities, out=out) is out
+        assert np.array_equal(velocities, original)
+        assert vh(velocities, out=velocities) is velocities
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from pyswallow.mp.mp_swarm import MPSwarm
+from pyswallow.utils.parameters import Categorical, Integer
+
+
+def mp_objective(swallow):
+    x0, x1, x2 = swallow.position
+    swallow.fitness = float(np.square(x0 - 3) + np.square(x1)
+                            + {'a': 1.0, 'b': 0.0}[x2])
+    return swallow
+
+
+def mp_sphere(swallow):
+    swallow.fitness = float(np.sum(np.square(swallow.position)))
+    return swallow
+
+
+class TestMPSwarm:
+
+    @pytest.fixture
+    def optimiser(self):
+        bounds = {
+            'x0': Integer(0, 5),
+            'x1': [-1.0, 1.0],
+            'x2': Categorical(['a', 'b'])
+        }
+
+        opt = MPSwarm(bounds, n_swallows=10, n_iterations=10, cores=2)
+        yield opt
+        opt.pool.terminate()
+
+    def test_decoded(self, optimiser):
+        np.random.seed(0)
+        optimiser.optimise(mp_objective)
+
+        position = optimiser.gbest_swallow.position
+        assert position.dtype == float
+        assert optimiser.space.decode(position)[2] in ('a', 'b')
+
+        for swallow in optimiser.population:
+            assert swallow.position.dtype == float
+
+        assert optimiser.n_evaluations + optimiser.n_cache_hits == 10 * 11
+
+    def test_continuous(self):
+        bounds = {'x0': [-1.0, 1.0], 'x1': [-1.0, 1.0]}
+        optimiser = MPSwarm(bounds, n_swallows=10, n_iterations=10, cores=2)
+
+        try:
+            np.random.seed(0)
+            optimiser.optimise(mp_sphere)
+        finally:
+            optimiser.pool.terminate()
+
+        assert optimiser.n_evaluations == 10 * 11
+        assert optimiser.n_cache_hits == 0
+        assert optimiser.gbest_swallow.fitness == min(
+            swallow.pbest_fitness for swallow in optimiser.population
+        )
+
+    def test_evaluate_population(self, optimiser):
+        optimiser.reset_environment()
+        optimiser.initialise_swarm()
+        population = list(optimiser.population)
+
+        optimiser.evaluate_population(optimiser.population, mp_objective)
+
+        assert all(a is b for a, b in zip(optimiser.population, population))
+        assert all(swallow.fitness is not None for swallow in population)
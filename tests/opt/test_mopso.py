@@ -1,8 +1,16 @@
+import copy
+
+import numpy as np
 import pytest
 
 import pyswallow as ps
+from pyswallow.constraints.base_constraints import PositionConstraint
 from pyswallow.handlers.archive import Archive
+from pyswallow.handlers.boundary_handler import NearestBH
+from pyswallow.handlers.grid_archive import GridArchive
+from pyswallow.utils.checkpoint import Checkpointer
 from pyswallow.utils.functions.multi_objective import schaffer_n1
+from pyswallow.utils.termination_manager import IterationTerminationManager
 
 
 class TestMOSwarm:
@@ -66,3 +74,114 @@ class TestMOSwarm:
 
         optimiser.update_pbest(swallow)
         assert swallow.pbest_fitness == [5.0, 5.0]
+
+    @pytest.mark.parametrize('n_leaders', [0, 5])
+    def test_update_population(self, optimiser, n_leaders):
+        optimiser.n_objs = 2
+        optimiser.bh = NearestBH(optimiser.lb, optimiser.ub)
+        optimiser.initialise_archive()
+        optimiser.initialise_swarm()
+
+        for swallow in optimiser.population:
+            swallow.velocity = np.random.uniform(-50.0, 50.0, size=1)
+
+        for swallow in optimiser.population[:n_leaders]:
+            optimiser.archive.population.append(copy.deepcopy(swallow))
+
+        expected = copy.deepcopy(optimiser)
+
+        np.random.seed(0)
+        for swallow in expected.population:
+            expected.update_velocity(swallow)
+            swallow.move(expected.bh)
+
+        np.random.seed(0)
+        optimiser.update_population()
+
+        for swallow, reference in zip(optimiser.population, expected.population):
+            assert np.allclose(swallow.velocity, reference.velocity)
+            assert np.allclose(swallow.position, reference.position)
+
+    def test_screen_constraints(self, optimiser):
+        class Bounded(PositionConstraint):
+
+            def constrain(self, swallow):
+                return swallow['x0'] < 2.0
+
+        optimiser.n_iterations = 5
+        optimiser.screen_constraints = True
+        optimiser.constraint_manager.register_constraint(Bounded())
+        optimiser.optimise(schaffer_n1())
+
+        assert optimiser.n_evaluations + optimiser.n_screened == 30 * 6
+        assert optimiser.n_rejected == 0
+        assert len(optimiser.screened_fitness()) == 2
+
+        for swallow in optimiser.archive.population:
+            assert not np.isnan(swallow.fitness).any()
+
+    def test_termiation_manager_alias(self, optimiser):
+        with pytest.warns(DeprecationWarning):
+            assert optimiser.termiation_manager is optimiser.termination_manager
+
+        manager = IterationTerminationManager(optimiser)
+        with pytest.warns(DeprecationWarning):
+            optimiser.termiation_manager = manager
+
+        assert optimiser.termination_manager is manager
+
+    def test_state_dict(self, optimiser):
+        optimiser.n_iterations = 5
+        optimiser.optimise(schaffer_n1())
+
+        state = optimiser.state_dict()
+        restored = ps.MOSwarm(bounds=optimiser.bounds, n_swallows=30,
+                              n_iterations=5)
+        restored.load_state_dict(state)
+
+        assert restored.n_objs == 2
+        assert restored.iteration == optimiser.iteration
+        assert len(restored.archive.population) == len(optimiser.archive.population)
+
+        for a, b in zip(restored.archive.population, optimiser.archive.population):
+            assert a.fitness == list(b.fitness)
+            assert a.sparsity == b.sparsity
+
+        for a, b in zip(restored.population, optimiser.population):
+            assert np.array_equal(a.position, b.position)
+            assert a.pbest_fitness == list(b.pbest_fitness)
+
+    @pytest.mark.parametrize('archive_cls', [Archive, GridArchive])
+    def test_resume(self, tmp_path, archive_cls):
+        path = str(tmp_path / 'checkpoint.npz')
+        bounds = {'x0': [0.0, 50.0]}
+
+        np.random.seed(0)
+        uninterrupted = ps.MOSwarm(bounds=bounds, n_swallows=10, n_iterations=30)
+        uninterrupted.archive_cls = archive_cls
+        uninterrupted.checkpointer = Checkpointer(freq=7, path=path)
+        uninterrupted.optimise(schaffer_n1())
+
+        resumed = ps.MOSwarm(bounds=bounds, n_swallows=10, n_iterations=30)
+        resumed.archive_cls = archive_cls
+        resumed.resume(path, schaffer_n1())
+
+        assert resumed.iteration == uninterrupted.iteration
+        assert np.array_equal(resumed.history.arr_objective_mean,
+                              uninterrupted.history.arr_objective_mean)
+
+        resumed_front = [m.fitness for m in resumed.archive.population]
+        front = [list(m.fitness) for m in uninterrupted.archive.population]
+        assert resumed_front == front
+
+        for a, b in zip(resumed.population, uninterrupted.population):
+            assert np.array_equal(a.position, b.position)
+            assert np.array_equal(a.velocity, b.velocity)
+
+    def test_iter_optimise(self, optimiser):
+        optimiser.n_iterations = 5
+        snapshots = list(optimiser.iter_optimise(schaffer_n1()))
+
+        assert [s.iteration for s in snapshots] == list(range(6))
+        assert snapshots[-1].archive == optimiser.archive.population
+        assert snapshots[-1].n_evaluations == 30 * 6
@@ -2,6 +2,13 @@ import numpy as np
 import pytest
 
 import pyswallow as ps
+from pyswallow.constraints.base_constraints import PositionConstraint
+from pyswallow.constraints.constraint_manager import ConstraintManager
+from pyswallow.handlers.boundary_handler import NearestBH, ReflectiveBH
+from pyswallow.utils.checkpoint import Checkpointer
+from pyswallow.utils.history import SOHistory
+from pyswallow.utils.history_writer import HistoryWriter, load_history
+from pyswallow.utils.termination_manager import StagnationTerminationManager
 from pyswallow.utils.functions.single_objective import sphere
 
 
@@ -54,6 +61,16 @@ class TestSOSwarm:
 
         assert target_fit == swallow.fitness
 
+    def test_constraints_manager_alias(self, optimiser):
+        with pytest.warns(DeprecationWarning):
+            assert optimiser.constraints_manager is optimiser.constraint_manager
+
+        manager = ConstraintManager(optimiser)
+        with pytest.warns(DeprecationWarning):
+            optimiser.constraints_manager = manager
+
+        assert optimiser.constraint_manager is manager
+
     @pytest.mark.parametrize('f', [50, 0, -50])
     def test_pbest_update(self, optimiser, swallow, f):
         swallow.pbest_fitness = 100
@@ -65,6 +82,38 @@ class TestSOSwarm:
         assert np.array_equal(swallow.pbest_fitness, swallow.fitness)
         assert np.array_equal(swallow.pbest_position, swallow.position)
 
+    @pytest.mark.parametrize('bh', [None, 'nearest', 'reflective'])
+    def test_update_population(self, optimiser, bh):
+        if bh == 'nearest':
+            optimiser.bh = NearestBH(optimiser.lb, optimiser.ub)
+        elif bh == 'reflective':
+            optimiser.bh = ReflectiveBH(optimiser.lb, optimiser.ub)
+
+        optimiser.initialise_swarm()
+        optimiser.gbest_swallow = optimiser.population[0]
+        for swallow in optimiser.population:
+            swallow.velocity = np.random.uniform(-50.0, 50.0, size=2)
+
+        expected = [(s.position.copy(), s.velocity.copy())
+                    for s in optimiser.population]
+
+        np.random.seed(0)
+        for swallow, (position, velocity) in zip(optimiser.population, expected):
+            r1, r2 = np.random.uniform(), np.random.uniform()
+            velocity[:] = optimiser.vh(
+                optimiser.w * velocity
+                + optimiser.c1 * r1 * (swallow.pbest_position - position)
+                + optimiser.c2 * r2 * (optimiser.gbest_swallow.position - position)
+            )
+            position[:] = optimiser.bh(position + velocity)
+
+        np.random.seed(0)
+        optimiser.update_population()
+
+        for swallow, (position, velocity) in zip(optimiser.population, expected):
+            assert np.allclose(swallow.velocity, velocity)
+            assert np.allclose(swallow.position, position)
+
     @pytest.mark.parametrize('f', [50, 0, -50])
     def test_gbest_update(self, optimiser, swallow, f):
         optimiser.gbest_fitness = 100
@@ -88,3 +137,202 @@ class TestSOSwarm:
         assert np.allclose(optimiser.gbest_swallow.position,
                            target_pos,
                            rtol=1e-3)
+
+    def test_screen_constraints(self):
+        class Positive(PositionConstraint):
+
+            def constrain(self, swallow):
+                return swallow['x0'] > 0.0
+
+        evaluated = []
+
+        def fn(position):
+            evaluated.append(position[0])
+            return sphere(position)
+
+        optimiser = ps.Swarm(
+            bounds={'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]},
+            n_swallows=20,
+            n_iterations=5
+        )
+        optimiser.screen_constraints = True
+        optimiser.constraint_manager.register_constraint(Positive())
+        optimiser.optimise(fn)
+
+        assert len(evaluated) == optimiser.n_evaluations
+        assert all(x > 0.0 for x in evaluated)
+        assert optimiser.n_evaluations + optimiser.n_screened == 20 * 6
+        assert optimiser.n_rejected == 0
+
+        # counters start afresh with each optimisation
+        optimiser.optimise(fn)
+        assert optimiser.n_evaluations + optimiser.n_screened == 20 * 6
+
+        optimiser.screen_penalty = 1e6
+        optimiser.population[0]['x0'] = -1.0
+        optimiser.population[1]['x0'] = 1.0
+        screened = optimiser.screen_population()
+
+        assert not screened[0] and screened[1]
+        assert optimiser.population[0].fitness == 1e6
+
+    @pytest.mark.parametrize('screen', [False, True])
+    def test_infeasible(self, screen):
+        class Infeasible(PositionConstraint):
+
+            def constrain(self, swallow):
+                return False
+
+        optimiser = ps.Swarm(
+            bounds={'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]},
+            n_swallows=10,
+            n_iterations=5
+        )
+        optimiser.screen_constraints = screen
+        optimiser.constraint_manager.register_constraint(Infeasible())
+        optimiser.optimise(sphere)
+
+        assert optimiser.gbest_swallow is None
+        assert np.all(np.isnan(optimiser.history.arr_best_fitness))
+        assert optimiser.n_screened + optimiser.n_rejected == 10 * 6
+        assert optimiser.n_rejected == (0 if screen else 10 * 6)
+
+        snapshot = optimiser.snapshot()
+        assert np.isnan(snapshot.best_fitness)
+        assert snapshot.best_position is None
+
+    def test_state_dict(self, optimiser):
+        optimiser.n_iterations = 5
+        optimiser.optimise(sphere)
+
+        state = optimiser.state_dict()
+        restored = ps.Swarm(bounds=optimiser.bounds, n_swallows=30,
+                            n_iterations=5)
+        restored.load_state_dict(state)
+
+        assert restored.iteration == optimiser.iteration
+        assert restored.n_evaluations == optimiser.n_evaluations
+        assert restored.gbest_swallow.fitness == optimiser.gbest_swallow.fitness
+
+        for a, b in zip(restored.population, optimiser.population):
+            assert np.array_equal(a.position, b.position)
+            assert np.array_equal(a.velocity, b.velocity)
+            assert np.array_equal(a.pbest_position, b.pbest_position)
+            assert a.pbest_fitness == b.pbest_fitness
+
+        draw = np.random.uniform()
+        restored.load_state_dict(state)
+        assert np.random.uniform() == draw
+
+    def test_checkpoint(self, optimiser, tmp_path):
+        path = str(tmp_path / 'checkpoint.npz')
+
+        optimiser.n_iterations = 5
+        optimiser.checkpointer = Checkpointer(freq=2, path=path, keep=2)
+        optimiser.optimise(sphere)
+
+        assert int(optimiser.checkpointer.load()['iteration']) == 4
+        assert int(optimiser.checkpointer.load(1)['iteration']) == 2
+
+    def test_resume(self, tmp_path):
+        path = str(tmp_path / 'checkpoint.npz')
+        bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+
+        np.random.seed(0)
+        uninterrupted = ps.Swarm(bounds=bounds, n_swallows=10, n_iterations=10)
+        uninterrupted.checkpointer = Checkpointer(freq=4, path=path)
+        uninterrupted.optimise(sphere)
+
+        evaluated = []
+
+        def fn(position):
+            evaluated.append(position)
+            return sphere(position)
+
+        resumed = ps.Swarm(bounds=bounds, n_swallows=10, n_iterations=10)
+        resumed.resume(path, fn)
+
+        assert len(evaluated) == 10 * 2
+        assert resumed.iteration == uninterrupted.iteration
+        assert resumed.n_evaluations == uninterrupted.n_evaluations
+        assert resumed.gbest_swallow.fitness == uninterrupted.gbest_swallow.fitness
+        assert np.array_equal(resumed.history.arr_best_fitness,
+                              uninterrupted.history.arr_best_fitness)
+        assert np.array_equal(resumed.history.arr_mean_fitness,
+                              uninterrupted.history.arr_mean_fitness)
+
+        for a, b in zip(resumed.population, uninterrupted.population):
+            assert np.array_equal(a.position, b.position)
+            assert np.array_equal(a.velocity, b.velocity)
+
+    def test_resume_writer(self, tmp_path):
+        path = str(tmp_path / 'checkpoint.npz')
+        history_path = str(tmp_path / 'history.bin')
+        bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+
+        interrupted = ps.Swarm(bounds=bounds, n_swallows=10, n_iterations=10)
+        interrupted.history = SOHistory(
+            interrupted, writer=HistoryWriter(history_path, batch_size=4)
+        )
+        interrupted.checkpointer = Checkpointer(freq=5, path=path,
+                                                background=False)
+
+        for snapshot in interrupted.iter_optimise(sphere):
+            if snapshot.iteration == 6:
+                # records still batched in memory are lost, as in a crash
+                interrupted.history.writer = None
+                break
+
+        resumed = ps.Swarm(bounds=bounds, n_swallows=10, n_iterations=10)
+        resumed.history = SOHistory(
+            resumed, writer=HistoryWriter(history_path, batch_size=4)
+        )
+        resumed.resume(path, sphere)
+
+        records = load_history(history_path)
+        assert np.array_equal(records['iteration'], np.arange(11))
+        assert np.array_equal(records['best_fitness'],
+                              resumed.history.arr_best_fitness)
+
+    def test_resume_stagnation(self, tmp_path):
+        path = str(tmp_path / 'checkpoint.npz')
+        bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+
+        def build():
+            swarm = ps.Swarm(bounds=bounds, n_swallows=10, n_iterations=1000)
+            swarm.termination_manager = StagnationTerminationManager(
+                swarm, window=10, tolerance=1e-3
+            )
+            return swarm
+
+        np.random.seed(0)
+        uninterrupted = build()
+        uninterrupted.checkpointer = Checkpointer(freq=1, path=path, keep=3,
+                                                  background=False)
+        uninterrupted.optimise(sphere)
+
+        resumed = build()
+        resumed.resume(f'{path}.2', sphere)
+
+        assert resumed.iteration == uninterrupted.iteration
+
+    def test_iter_optimise(self, optimiser):
+        optimiser.n_iterations = 5
+        snapshots = list(optimiser.iter_optimise(sphere))
+
+        assert [s.iteration for s in snapshots] == list(range(6))
+        assert snapshots[-1].n_evaluations == 30 * 6
+        assert snapshots[-1].best_fitness == optimiser.gbest_swallow.fitness
+        assert snapshots[-1].best_position is optimiser.gbest_swallow.position
+
+        best = [s.best_fitness for s in snapshots]
+        assert all(a >= b for a, b in zip(best, best[1:]))
+
+    def test_iter_optimise_break(self, optimiser):
+        for snapshot in optimiser.iter_optimise(sphere):
+            if snapshot.iteration == 3:
+                break
+
+        assert optimiser.iteration == 3
+        assert optimiser.n_evaluations == 30 * 4
+        assert len(optimiser.history.arr_best_fitness) == 4
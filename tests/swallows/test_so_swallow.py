@@ -23,3 +23,13 @@ class TestSOSwallow:
         swallow.move(psbh.StandardBH())
 
         assert np.array_equal(swallow.position, np.array([5, 5]))
+
+    def test_initial_state(self):
+        bounds = {'x0': [-1.0, 1.0], 'x1': [0.0, 2.0]}
+        position = np.array([0.5, 1.5])
+        swallow = ps.Swallow(bounds, position, np.zeros(2))
+
+        assert np.array_equal(swallow.position, position)
+        assert np.array_equal(swallow.pbest_position, position)
+        assert np.array_equal(swallow.velocity, np.zeros(2))
+        assert swallow.position is not position
@@ -0,0 +1,77 @@
+import os
+
+import numpy as np
+import pytest
+
+import pyswallow.utils.functions.large_scale as ls
+
+
+class TestLargeScale:
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        return str(tmp_path)
+
+    @pytest.mark.parametrize('cls', [ls.Elliptic, ls.Rastrigin, ls.Ackley, ls.Schwefel12])
+    def test_optimum(self, cls, cache_dir):
+        problem = cls(20, cache_dir=cache_dir)
+        assert problem(np.asarray(problem.shift)) == pytest.approx(0.0, abs=1e-8)
+
+    def test_shift_within_bounds(self, cache_dir):
+        problem = ls.Rastrigin(50, cache_dir=cache_dir)
+        assert np.all(np.abs(problem.shift) <= 0.8 * problem.upper)
+
+    def test_cached(self, cache_dir):
+        problem = ls.Elliptic(10, seed=3, cache_dir=cache_dir)
+        assert isinstance(problem.rotation, np.memmap)
+        assert sorted(os.listdir(cache_dir)) == ['rotation_10_seed3.npy',
+                                                 'shift_10_seed3.npy']
+
+        np.random.seed(0)
+        other = ls.Elliptic(10, seed=3, cache_dir=cache_dir)
+        np.testing.assert_array_equal(problem.rotation, other.rotation)
+
+    def test_seed_independent_of_global_state(self, tmp_path):
+        np.random.seed(0)
+        a = ls.Elliptic(10, cache_dir=str(tmp_path / 'a'))
+        np.random.seed(1)
+        b = ls.Elliptic(10, cache_dir=str(tmp_path / 'b'))
+
+        np.testing.assert_array_equal(a.shift, b.shift)
+        np.testing.assert_array_equal(a.rotation, b.rotation)
+
+    def test_rotation_orthogonal(self, cache_dir):
+        problem = ls.Elliptic(30, cache_dir=cache_dir)
+        rotation = np.asarray(problem.rotation)
+        np.testing.assert_allclose(rotation @ rotation.T, np.eye(30), atol=1e-10)
+
+    def test_batch(self, cache_dir):
+        problem = ls.Ackley(20, n_groups=3, group_size=5, cache_dir=cache_dir)
+        batch = np.random.uniform(-32.0, 32.0, size=(8, 20))
+
+        expected = [problem(position) for position in batch]
+        np.testing.assert_allclose(problem(batch), expected)
+
+    def test_partially_separable(self, cache_dir):
+        problem = ls.Elliptic(20, n_groups=2, group_size=5, cache_dir=cache_dir)
+        assert problem.rotation.shape == (2, 5, 5)
+
+        # the separable remainder is evaluated without rotation
+        position = np.asarray(problem.shift).copy()
+        rest = problem.permutation[10:]
+        position[rest] += 1.0
+
+        assert problem(position) == pytest.approx(ls.Elliptic.base(np.ones(10)))
+
+    def test_unrotated(self, cache_dir):
+        problem = ls.Rastrigin(5, rotate=False, cache_dir=cache_dir)
+        assert problem.rotation is None
+        assert problem(problem.shift + 1.0) == pytest.approx(5.0)
+
+    def test_invalid_groups(self, cache_dir):
+        with pytest.raises(ValueError):
+            ls.Elliptic(10, n_groups=3, group_size=5, cache_dir=cache_dir)
+
+    def test_bounds(self, cache_dir):
+        problem = ls.Rastrigin(3, cache_dir=cache_dir)
+        assert problem.bounds == {f'x{i}': [-5.0, 5.0] for i in range(3)}
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+import pyswallow.utils.functions.multi_objective as mo
+from pyswallow.handlers.boundary_handler import NearestBH
+from pyswallow.opt.mopso import MOSwarm
+
+
+class TestDasDennis:
+
+    def test_points(self):
+        points = mo.das_dennis(3, 4)
+        assert points.shape == (15, 3)
+        np.testing.assert_allclose(points.sum(axis=1), 1.0)
+        assert len(np.unique(points, axis=0)) == 15
+
+    @pytest.mark.parametrize('n, k, expected', [
+        (6, 2, 15), (10, 0, 1), (10, 10, 1), (13, 3, 286), (3, 5, 0)
+    ])
+    def test_comb(self, n, k, expected):
+        assert mo._comb(n, k) == expected
+
+
+class TestZDT:
+
+    @pytest.mark.parametrize('cls', [mo.ZDT1, mo.ZDT2, mo.ZDT3, mo.ZDT4, mo.ZDT6])
+    def test_optimal_on_front(self, cls):
+        problem = cls()
+        x = np.zeros((50, problem.n_variables))
+        x[:, 0] = np.linspace(0.0, 1.0, 50)
+
+        fitness = problem(x)
+        front = problem.pareto_front(10_000)
+
+        # every optimal solution is weakly dominated by a point on the front
+        for f in fitness:
+            assert np.any(np.all(front <= f + 1e-3, axis=1))
+
+    def test_batch(self):
+        problem = mo.ZDT4()
+        x = np.random.uniform(problem.lower, problem.upper, size=(8, 10))
+        np.testing.assert_allclose(problem(x), [problem(p) for p in x])
+
+    def test_bounds(self):
+        bounds = mo.ZDT4(3).bounds
+        assert bounds == {'x0': [0.0, 1.0], 'x1': [-5.0, 5.0], 'x2': [-5.0, 5.0]}
+
+    def test_zdt3_front_non_dominated(self):
+        front = mo.ZDT3().pareto_front(500)
+        dominated = [np.any(np.all(front <= f, axis=1) & np.any(front < f, axis=1))
+                     for f in front]
+        assert not any(dominated)
+
+
+class TestDTLZ:
+
+    @pytest.mark.parametrize('n_objs', [2, 3, 5])
+    def test_dtlz1_optimal(self, n_objs):
+        problem = mo.DTLZ1(n_objs)
+        x = np.random.uniform(size=(10, problem.n_variables))
+        x[:, n_objs - 1:] = 0.5
+
+        np.testing.assert_allclose(problem(x).sum(axis=1), 0.5)
+
+    @pytest.mark.parametrize('cls', [mo.DTLZ2, mo.DTLZ3, mo.DTLZ4])
+    def test_spherical_optimal(self, cls):
+        problem = cls(4)
+        x = np.random.uniform(size=(10, problem.n_variables))
+        x[:, 3:] = 0.5
+
+        fitness = problem(x)
+        assert fitness.shape == (10, 4)
+        np.testing.assert_allclose(np.linalg.norm(fitness, axis=1), 1.0)
+
+    def test_front(self):
+        front = mo.DTLZ2(3).pareto_front(100)
+        assert front.shape == (91, 3)
+        np.testing.assert_allclose(np.linalg.norm(front, axis=1), 1.0)
+
+    def test_front_cached(self):
+        front = mo.DTLZ1(3).pareto_front(50)
+        assert mo.DTLZ1(3).pareto_front(50) is front
+        assert not front.flags.writeable
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            mo.DTLZ2(1)
+        with pytest.raises(ValueError):
+            mo.DTLZ2(4, n_variables=3)
+
+
+class TestObjectives:
+
+    def test_shared_evaluation(self, monkeypatch):
+        problem = mo.DTLZ2(3)
+        calls = []
+
+        evaluate = problem.evaluate
+        monkeypatch.setattr(problem, 'evaluate',
+                            lambda x: calls.append(x) or evaluate(x))
+
+        position = np.full(problem.n_variables, 0.5)
+        values = [fn(position) for fn in problem.objectives]
+
+        assert len(calls) == 1
+        np.testing.assert_allclose(values, problem(position))
+
+    def test_moswarm(self):
+        problem = mo.ZDT1(5)
+        swarm = MOSwarm(problem.bounds, n_swallows=10, n_iterations=5)
+        swarm.bh = NearestBH(swarm.lb, swarm.ub)
+        swarm.optimise(problem.objectives)
+
+        assert swarm.archive.population
@@ -29,3 +29,40 @@ class TestSingleObjective:
     def test_sphere(self):
         pos = np.array([0.0, 0.0, 0.0])
         assert fx.sphere(pos) == pytest.approx(0.0, 1e-6)
+
+
+class TestBatchedSingleObjective:
+
+    @pytest.fixture
+    def batch(self):
+        np.random.seed(0)
+        return np.random.uniform(-2.0, 2.0, size=(10, 2))
+
+    @pytest.mark.parametrize('fn', [fx.ackley, fx.beale, fx.booth,
+                                    fx.goldsteinprice, fx.rastrigin,
+                                    fx.sphere])
+    def test_batch(self, fn, batch):
+        val = fn(batch)
+
+        assert val.shape == (10,)
+        assert np.allclose(val, [fn(position) for position in batch])
+
+    @pytest.mark.parametrize('fn', [fx.ackley, fx.beale, fx.booth,
+                                    fx.goldsteinprice, fx.rastrigin,
+                                    fx.sphere])
+    def test_empty(self, fn):
+        val = fn(np.empty((0, 2)))
+
+        assert val.shape == (0,)
+
+    def test_validate(self):
+        batch = np.array([[0.0, 0.0], [40.0, 0.0]])
+
+        with pytest.raises(ValueError):
+            fx.ackley(batch)
+
+        assert np.isfinite(fx.ackley(batch, validate=False)).all()
+
+    def test_two_dimensional(self):
+        with pytest.raises(IndexError):
+            fx.booth(np.zeros((4, 3)))
@@ -0,0 +1,105 @@
+import os
+
+import numpy as np
+import pytest
+
+from pyswallow.utils.checkpoint import Checkpointer
+
+
+class State:
+
+    def __init__(self):
+        self.iteration = 0
+
+    def state_dict(self):
+        return {'iteration': np.asarray(self.iteration),
+                'position': np.full((4, 2), float(self.iteration))}
+
+
+class TestCheckpointer:
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / 'checkpoint.npz')
+
+    def test_call(self):
+        checkpointer = Checkpointer(freq=5, save_final=True, n_iterations=12)
+
+        assert checkpointer(0) and checkpointer(5) and checkpointer(12)
+        assert not checkpointer(3)
+        assert not Checkpointer()(0)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            Checkpointer(save_final=True)
+
+        with pytest.raises(ValueError):
+            Checkpointer(keep=0)
+
+    @pytest.mark.parametrize('background', [True, False])
+    def test_save(self, path, background):
+        swarm = State()
+        swarm.iteration = 3
+
+        checkpointer = Checkpointer(path=path, background=background)
+        checkpointer.save(swarm)
+        checkpointer.wait()
+
+        state = checkpointer.load()
+        assert int(state['iteration']) == 3
+        assert np.array_equal(state['position'], np.full((4, 2), 3.0))
+        assert not os.path.exists(f'{path}.tmp')
+
+    def test_rotate(self, path):
+        swarm = State()
+        checkpointer = Checkpointer(path=path, keep=3)
+
+        for iteration in range(5):
+            swarm.iteration = iteration
+            checkpointer.save(swarm)
+
+        checkpointer.wait()
+
+        assert [int(checkpointer.load(g)['iteration']) for g in range(3)] == [4, 3, 2]
+        assert not os.path.exists(f'{path}.3')
+
+    def test_rotate_interrupted(self, path, monkeypatch):
+        swarm = State()
+        checkpointer = Checkpointer(path=path, keep=2, background=False)
+        checkpointer.save(swarm)
+
+        replace = os.replace
+
+        def interrupted(src, dst):
+            if dst == f'{path}.1':
+                raise OSError('interrupted')
+            replace(src, dst)
+
+        monkeypatch.setattr(os, 'replace', interrupted)
+        swarm.iteration = 1
+
+        with pytest.raises(IOError):
+            checkpointer.save(swarm)
+
+        assert int(checkpointer.load()['iteration']) == 1
+
+    def test_error(self, tmp_path):
+        checkpointer = Checkpointer(path=str(tmp_path / 'missing' / 'c.npz'))
+        checkpointer.save(State())
+
+        with pytest.raises(IOError):
+            checkpointer.wait()
+
+    @pytest.mark.parametrize('background', [True, False])
+    def test_error_any(self, path, background, monkeypatch):
+        def savez(*args, **kwargs):
+            raise ValueError('cannot serialise')
+
+        monkeypatch.setattr(np, 'savez', savez)
+        checkpointer = Checkpointer(path=path, background=background)
+
+        with pytest.raises(IOError):
+            checkpointer.save(State())
+            checkpointer.wait()
+
+        checkpointer.wait()
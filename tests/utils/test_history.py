@@ -1,7 +1,12 @@
+import numpy as np
 import pytest
 
 import pyswallow as ps
+from pyswallow.handlers.boundary_handler import NearestBH
+from pyswallow.utils.functions.multi_objective import ZDT1, schaffer_n1
 from pyswallow.utils.history import *
+from pyswallow.utils.history_writer import HistoryWriter, load_history
+from pyswallow.utils.quality import QualityIndicator
 
 
 class TestGeneralHistory:
@@ -28,9 +33,171 @@ class TestGeneralHistory:
         hist = SOHistory(optimiser)
         hist.write_history()
 
-        assert isinstance(hist.arr_best_fitness, list)
-        assert isinstance(hist.arr_mean_fitness, list)
+        assert isinstance(hist.arr_best_fitness, np.ndarray)
+        assert isinstance(hist.arr_mean_fitness, np.ndarray)
 
         assert len(hist.arr_best_fitness) == len(hist.arr_mean_fitness) == 1
         assert hist.arr_best_fitness[0] == 0.5
         assert hist.arr_mean_fitness[0] == 5.0
+        assert hist.arr_std_fitness[0] == 0.0
+
+    def test_preallocated(self, optimiser):
+        hist = SOHistory(optimiser)
+        hist.write_history()
+
+        assert hist.columns['best_fitness'].shape == (101,)
+
+    def test_grow(self, optimiser):
+        optimiser.n_iterations = 2
+        hist = SOHistory(optimiser)
+
+        for i in range(10):
+            optimiser.gbest_swallow.fitness = float(i)
+            hist.write_history()
+
+        assert np.array_equal(hist.arr_best_fitness, np.arange(10.0))
+
+    def test_not_evaluated(self, optimiser):
+        optimiser.population[0].fitness = np.nan
+        optimiser.population[1].fitness = 2.0
+
+        hist = SOHistory(optimiser)
+        hist.write_history()
+
+        assert hist.arr_mean_fitness[0] == pytest.approx((2.0 + 28 * 5.0) / 29)
+
+    def test_trajectory(self, optimiser, tmp_path):
+        path = str(tmp_path / 'trajectory.npy')
+        optimiser.n_iterations = 2
+        hist = SOHistory(optimiser, trajectory_path=path)
+
+        for i in range(5):
+            for swallow in optimiser.population:
+                swallow.position = np.full(2, float(i))
+            hist.write_history()
+
+        hist.close()
+        trajectory = np.load(path, mmap_mode='r')
+
+        assert trajectory.shape[1:] == (30, 2)
+        assert trajectory.shape[0] >= 5
+        assert np.array_equal(trajectory[:5, 0, 0], np.arange(5.0))
+
+    def test_trajectory_population_size(self, optimiser, tmp_path):
+        path = str(tmp_path / 'trajectory.npy')
+        hist = SOHistory(optimiser, trajectory_path=path)
+        hist.write_history()
+
+        optimiser.initialise_population(40)
+        for swallow in optimiser.population:
+            swallow.fitness = 5.0
+        hist.write_history()
+
+        optimiser.initialise_population(20)
+        for swallow in optimiser.population:
+            swallow.fitness = 5.0
+        hist.write_history()
+
+        hist.close()
+        trajectory = np.load(path, mmap_mode='r')
+
+        assert trajectory.shape[1:] == (40, 2)
+        assert np.all(np.isnan(trajectory[0, 30:]))
+        assert not np.any(np.isnan(trajectory[1]))
+        assert np.all(np.isnan(trajectory[2, 20:]))
+        assert not np.any(np.isnan(trajectory[2, :20]))
+
+
+    def test_ring_buffer(self, optimiser):
+        hist = SOHistory(optimiser, buffer_size=4)
+
+        for i in range(10):
+            optimiser.gbest_swallow.fitness = float(i)
+            hist.write_history()
+
+        assert hist.n_records == 10
+        assert hist.columns['best_fitness'].shape == (4,)
+        assert np.array_equal(hist.arr_best_fitness, [6.0, 7.0, 8.0, 9.0])
+        assert hist.last('best_fitness') == 9.0
+
+    def test_writer(self, optimiser, tmp_path):
+        path = str(tmp_path / 'history.bin')
+        hist = SOHistory(optimiser, writer=HistoryWriter(path, batch_size=3),
+                         buffer_size=2)
+
+        for i in range(10):
+            optimiser.gbest_swallow.fitness = float(i)
+            hist.write_history()
+
+        hist.close()
+        records = load_history(path)
+
+        assert len(records) == 10
+        assert np.array_equal(records['best_fitness'], np.arange(10.0))
+        assert np.all(records['mean_fitness'] == 5.0)
+
+
+    def test_state_dict(self, optimiser):
+        hist = SOHistory(optimiser, buffer_size=4)
+
+        for i in range(6):
+            optimiser.gbest_swallow.fitness = float(i)
+            hist.write_history()
+
+        restored = SOHistory(optimiser, buffer_size=4)
+        restored.load_state_dict(hist.state_dict())
+
+        optimiser.gbest_swallow.fitness = 6.0
+        hist.write_history()
+        restored.write_history()
+
+        assert restored.n_records == 7
+        assert np.array_equal(restored.arr_best_fitness, hist.arr_best_fitness)
+
+    @pytest.mark.parametrize('buffer_size', [None, 4])
+    def test_state_dict_copy(self, optimiser, buffer_size):
+        hist = SOHistory(optimiser, buffer_size=buffer_size)
+
+        for i in range(3):
+            optimiser.gbest_swallow.fitness = float(i)
+            hist.write_history()
+
+        state = hist.state_dict()
+
+        optimiser.gbest_swallow.fitness = 3.0
+        hist.write_history()
+        hist.columns['best_fitness'][:] = -1.0
+
+        assert np.array_equal(state['history_best_fitness'], [0.0, 1.0, 2.0])
+
+
+class TestMOHistory:
+
+    def test_write_history(self):
+        optimiser = ps.MOSwarm(
+            bounds={'x0': [0.0, 2.0]}, n_swallows=10, n_iterations=5
+        )
+        optimiser.optimise(schaffer_n1())
+        hist = optimiser.history
+
+        assert hist.arr_objective_mean.shape == (6, 2)
+        assert hist.arr_objective_min.shape == (6, 2)
+        assert np.all(hist.arr_objective_min <= hist.arr_objective_mean)
+        assert np.allclose(hist.arr_mean_fitness,
+                           hist.arr_objective_mean.mean(axis=1))
+        assert np.all(hist.arr_archive_size > 0)
+
+    def test_quality(self):
+        problem = ZDT1(5)
+        optimiser = ps.MOSwarm(problem.bounds, n_swallows=10, n_iterations=5)
+        optimiser.bh = NearestBH(optimiser.lb, optimiser.ub)
+        optimiser.history = MOHistory(
+            optimiser, indicator=QualityIndicator(problem.pareto_front())
+        )
+        optimiser.optimise(problem.objectives)
+        hist = optimiser.history
+
+        assert hist.arr_igd.shape == (6,)
+        assert np.all(np.isfinite(hist.arr_gd))
+        assert np.all(hist.arr_igd_plus <= hist.arr_igd + 1e-12)
+        assert hist.arr_spread.shape == (6,)
@@ -0,0 +1,100 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from pyswallow.utils.history_writer import HistoryWriter, load_history
+
+
+class TestHistoryWriter:
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / 'history.bin')
+
+    def test_write(self, path):
+        writer = HistoryWriter(path, batch_size=4)
+
+        for i in range(10):
+            writer.write(iteration=i, fitness=np.array([i, -i], dtype=float))
+
+        writer.close()
+        records = load_history(path)
+
+        assert isinstance(records, np.memmap)
+        assert writer.n_records == writer.n_written == 10
+        assert np.array_equal(records['iteration'], np.arange(10))
+        assert records['fitness'].shape == (10, 2)
+        assert np.array_equal(records['fitness'][:, 1], -np.arange(10.0))
+
+    def test_sync(self, path):
+        writer = HistoryWriter(path, batch_size=4)
+
+        for i in range(6):
+            writer.write(fitness=float(i))
+
+        assert writer._n_batch == 2
+
+        writer.sync()
+        assert writer._n_batch == 0
+        assert len(load_history(path)) == 6
+
+        writer.close()
+        assert writer._thread is None
+
+    def test_empty(self, path):
+        writer = HistoryWriter(path)
+        writer.write(fitness=1.0)
+        writer.close()
+
+        open(path, 'wb').close()
+        assert len(load_history(path)) == 0
+
+    def test_pickle(self, path):
+        writer = HistoryWriter(path, batch_size=4)
+
+        for i in range(5):
+            writer.write(fitness=float(i))
+
+        writer = pickle.loads(pickle.dumps(writer))
+
+        for i in range(5, 8):
+            writer.write(fitness=float(i))
+
+        writer.close()
+        assert np.array_equal(load_history(path)['fitness'], np.arange(8.0))
+
+    def test_error(self, tmp_path):
+        writer = HistoryWriter(str(tmp_path / 'missing' / 'history.bin'))
+
+        with pytest.raises(IOError):
+            writer.write(fitness=1.0)
+
+    def test_resume(self, path):
+        writer = HistoryWriter(path, batch_size=4)
+
+        for i in range(6):
+            writer.write(fitness=float(i))
+
+        writer.close()
+
+        resumed = HistoryWriter(path, batch_size=4)
+        resumed.resume(4)
+        resumed.write(fitness=10.0)
+        resumed.close()
+
+        assert np.array_equal(load_history(path)['fitness'],
+                              [0.0, 1.0, 2.0, 3.0, 10.0])
+
+    def test_resume_short(self, path):
+        writer = HistoryWriter(path, batch_size=4)
+
+        for i in range(6):
+            writer.write(fitness=float(i))
+
+        writer.close()
+
+        with pytest.raises(IOError):
+            HistoryWriter(path).resume(8)
+
+        assert len(load_history(path)) == 6
@@ -0,0 +1,86 @@
+import urllib.request
+
+import pytest
+
+import pyswallow as ps
+from pyswallow.constraints.base_constraints import PositionConstraint
+from pyswallow.utils.functions.multi_objective import schaffer_n1
+from pyswallow.utils.functions.single_objective import sphere
+from pyswallow.utils.openmetrics import MetricsExporter
+
+
+class Positive(PositionConstraint):
+
+    def constrain(self, swallow):
+        return swallow['x0'] > 0.0
+
+
+class TestMetricsExporter:
+
+    @pytest.fixture
+    def optimiser(self):
+        optimiser = ps.Swarm(bounds={'x0': [-1.0, 1.0]}, n_swallows=10,
+                             n_iterations=4)
+        optimiser.constraint_manager.register_constraint(Positive())
+        return optimiser
+
+    def test_render(self, optimiser):
+        exporter = MetricsExporter(optimiser, labels={'run': 'a"b'})
+        optimiser.metrics = exporter
+        optimiser.optimise(sphere)
+
+        text = exporter.text
+
+        assert text.endswith('# EOF\n')
+        assert '# TYPE pyswallow_evaluations counter' in text
+        assert 'pyswallow_evaluations_total{run="a\\"b"} 50' in text
+        assert 'pyswallow_iteration{run="a\\"b"} 4' in text
+        assert 'pyswallow_constraint_rejections_total{run="a\\"b",constraint="Positive",index="0"}' in text
+        assert 'pyswallow_best_fitness' in text
+        assert 'pyswallow_archive_size' not in text
+
+    def test_duplicate_constraints(self, optimiser):
+        optimiser.constraint_manager.register_constraint(Positive())
+        exporter = MetricsExporter(optimiser)
+        optimiser.metrics = exporter
+        optimiser.optimise(sphere)
+
+        samples = [line.rsplit(' ', 1)[0] for line in exporter.text.splitlines()
+                   if line.startswith('pyswallow_constraint_rejections_total')]
+
+        assert samples == [
+            'pyswallow_constraint_rejections_total{constraint="Positive",index="0"}',
+            'pyswallow_constraint_rejections_total{constraint="Positive",index="1"}'
+        ]
+
+    def test_archive_size(self):
+        optimiser = ps.MOSwarm(bounds={'x0': [0.0, 5.0]}, n_swallows=10,
+                               n_iterations=2)
+        optimiser.metrics = MetricsExporter(optimiser)
+        optimiser.optimise(schaffer_n1())
+
+        assert 'pyswallow_archive_size ' in optimiser.metrics.text
+
+    def test_write(self, optimiser, tmp_path):
+        path = tmp_path / 'metrics.txt'
+        optimiser.metrics = MetricsExporter(optimiser, path=str(path))
+        optimiser.optimise(sphere)
+
+        assert path.read_text() == optimiser.metrics.text
+        assert not (tmp_path / 'metrics.txt.tmp').exists()
+
+    def test_serve(self, optimiser):
+        exporter = MetricsExporter(optimiser, port=0)
+
+        try:
+            exporter.update()
+            url = f'http://127.0.0.1:{exporter.port}/metrics'
+
+            with urllib.request.urlopen(url) as response:
+                body = response.read().decode('utf-8')
+                content_type = response.headers['Content-Type']
+
+            assert body == exporter.text
+            assert content_type.startswith('application/openmetrics-text')
+        finally:
+            exporter.close()
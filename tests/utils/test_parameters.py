@@ -0,0 +1,161 @@
+import numpy as np
+import pytest
+
+import pyswallow as ps
+from pyswallow.utils.parameters import (
+    Continuous, Integer, Categorical, ParameterSpace
+)
+
+
+class TestParameters:
+
+    @pytest.fixture
+    def space(self):
+        return ParameterSpace({
+            'x': [-1.0, 1.0],
+            'n': Integer(1, 5),
+            'opt': Categorical(['adam', 'sgd', None])
+        })
+
+    def test_bounds(self, space):
+        assert space.bounds == {'x': [-1.0, 1.0], 'n': [0.5, 5.5],
+                                'opt': [-0.5, 2.5]}
+        assert not space.is_continuous
+        assert not space.is_numeric
+
+    def test_continuous_space(self):
+        space = ParameterSpace({'x0': [0.0, 1.0], 'x1': Continuous(2.0, 3.0)})
+        position = np.array([0.25, 2.5])
+
+        assert space.is_continuous
+        assert np.array_equal(space.decode(position), position)
+
+    def test_integer_space(self):
+        space = ParameterSpace({'n0': Integer(0, 5), 'n1': Integer(-2, 2)})
+        decoded = space.decode(np.array([[1.2, -1.6], [4.7, 0.3]]))
+
+        assert space.is_integer
+        assert decoded.dtype.kind == 'i'
+        assert decoded.tolist() == [[1, -2], [5, 0]]
+
+    def test_numeric_space(self):
+        space = ParameterSpace({'x': [-1.0, 1.0], 'n': Integer(1, 5)})
+        decoded = space.decode(np.array([0.3, 2.4]))
+
+        assert space.is_numeric and not space.is_integer
+        assert decoded.dtype == float
+        assert decoded.tolist() == [0.3, 2.0]
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            ParameterSpace([[0.0, 1.0]])
+
+        with pytest.raises(ValueError):
+            Continuous(1.0, 0.0)
+
+        with pytest.raises(ValueError):
+            Categorical([])
+
+    @pytest.mark.parametrize('x, expected', [
+        (0.5, 1), (1.49, 1), (1.5, 2), (5.5, 5), (7.0, 5), (-3.0, 1)
+    ])
+    def test_integer(self, x, expected):
+        assert Integer(1, 5).snap(np.array([x]))[0] == expected
+
+    def test_decode(self, space):
+        positions = np.array([[0.3, 1.2, 0.4],
+                              [-0.7, 5.4, 2.49],
+                              [0.1, 2.6, 1.5]])
+
+        decoded = space.decode(positions)
+
+        assert decoded.shape == (3, 3)
+        assert decoded[0].tolist() == [0.3, 1, 'adam']
+        assert decoded[1].tolist() == [-0.7, 5, None]
+        assert decoded[2].tolist() == [0.1, 3, None]
+        assert isinstance(decoded[0, 1], int)
+        assert space.decode(positions[0]).tolist() == [0.3, 1, 'adam']
+
+    def test_unique(self):
+        space = ParameterSpace({'n': Integer(0, 3), 'm': Integer(0, 3)})
+        positions = np.array([[2.2, 1.1], [0.1, 0.2], [1.9, 0.8],
+                              [0.3, -0.4], [3.0, 3.0]])
+
+        candidates, first, inverse = space.unique(positions)
+
+        assert np.array_equal(candidates, [[2, 1], [0, 0], [3, 3]])
+        assert np.array_equal(first, [0, 1, 4])
+        assert np.array_equal(inverse, [0, 1, 0, 1, 2])
+
+
+class TestDiscreteSwarm:
+
+    @pytest.fixture
+    def bounds(self):
+        return {
+            'n0': Integer(0, 3),
+            'n1': Integer(-2, 2),
+            'opt': Categorical(['a', 'b', 'c'])
+        }
+
+    @staticmethod
+    def objective(calls):
+        penalty = {'a': 1.0, 'b': 0.0, 'c': 2.0}
+
+        def fn(candidate):
+            calls.append(tuple(candidate))
+            return float(candidate[0] ** 2 + (candidate[1] - 1) ** 2
+                         + penalty[candidate[2]])
+
+        return fn
+
+    def test_swarm(self, bounds):
+        np.random.seed(0)
+        calls = []
+
+        optimiser = ps.Swarm(bounds, n_swallows=20, n_iterations=20)
+        optimiser.optimise(self.objective(calls))
+
+        best = optimiser.space.decode(optimiser.gbest_swallow.position)
+
+        assert best.tolist() == [0, 1, 'b']
+        assert optimiser.gbest_swallow.fitness == 0.0
+        assert len(calls) == optimiser.n_evaluations
+        assert optimiser.n_cache_hits > 0
+        assert optimiser.n_evaluations + optimiser.n_cache_hits == 20 * 21
+
+    def test_duplicates_share_fitness(self, bounds):
+        calls = []
+
+        optimiser = ps.Swarm(bounds, n_swallows=4, n_iterations=1)
+        optimiser.reset_environment()
+        optimiser.initialise_swarm()
+
+        positions = [[0.1, 0.9, 1.2], [-0.2, 1.3, 0.8], [3.0, -2.0, 0.0],
+                     [0.4, 1.0, 1.4]]
+        for swallow, position in zip(optimiser.population, positions):
+            swallow.position = np.array(position)
+
+        optimiser.evaluate_population(optimiser.population,
+                                      self.objective(calls))
+
+        assert calls == [(0, 1, 'b'), (3, -2, 'a')]
+        assert [s.fitness for s in optimiser.population] == [0.0, 0.0, 19.0, 0.0]
+        assert optimiser.n_evaluations == 2
+        assert optimiser.n_cache_hits == 2
+
+    def test_mo_swarm(self, bounds):
+        np.random.seed(0)
+        calls = []
+
+        def second(candidate):
+            return float(3 - candidate[0])
+
+        optimiser = ps.MOSwarm(bounds, n_swallows=10, n_iterations=10)
+        optimiser.optimise([self.objective(calls), second])
+
+        assert len(calls) == optimiser.n_evaluations
+        assert optimiser.n_evaluations + optimiser.n_cache_hits == 10 * 11
+
+        fitness = [s.fitness for s in optimiser.population]
+        assert len({id(f) for f in fitness}) == len(fitness)
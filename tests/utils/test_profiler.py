@@ -0,0 +1,96 @@
+import json
+import time
+
+import pytest
+
+import pyswallow as ps
+from pyswallow.utils.functions.single_objective import sphere
+from pyswallow.utils.profiler import NullProfiler, Profiler, TimedCall
+
+
+class TestProfiler:
+
+    @pytest.fixture
+    def profiler(self):
+        return Profiler()
+
+    def test_phase(self, profiler):
+        with profiler.phase('step'):
+            with profiler.phase('evaluate'):
+                time.sleep(0.01)
+
+        summary = profiler.summary()
+
+        assert summary['evaluate']['count'] == 1
+        assert summary['evaluate']['total'] >= 0.01
+        assert summary['step']['total'] >= summary['evaluate']['total']
+        assert 0.0 <= profiler.overhead_ratio < 1.0
+
+    def test_record(self, profiler):
+        profiler.record('objective', 0, 10, tid=5)
+        profiler.record('objective', 10, 40, tid=5)
+
+        summary = profiler.summary()['objective']
+        assert summary['count'] == 2
+        assert summary['max'] == pytest.approx(30e-9)
+        assert summary['mean'] == pytest.approx(20e-9)
+
+    def test_max_events(self):
+        profiler = Profiler(max_events=2)
+
+        for i in range(5):
+            profiler.record('objective', i, i + 1)
+
+        assert len(profiler.events) == 2
+        assert profiler.totals['objective'][0] == 5
+
+    def test_export_chrome_trace(self, profiler, tmp_path):
+        path = str(tmp_path / 'trace.json')
+        profiler.record('objective', 1000, 3000, tid=7)
+        profiler.export_chrome_trace(path)
+
+        with open(path) as f:
+            event = json.load(f)['traceEvents'][0]
+
+        assert event['name'] == 'objective'
+        assert event['ph'] == 'X'
+        assert event['ts'] == 1.0 and event['dur'] == 2.0
+        assert event['tid'] == 7
+
+    def test_null_profiler(self):
+        profiler = NullProfiler()
+
+        with profiler.phase('step'):
+            profiler.record('objective', 0, 1)
+
+        assert not profiler.enabled
+
+    def test_timed_call(self):
+        result, start, end, pid = TimedCall(sum)([1, 2])
+
+        assert result == 3
+        assert end >= start
+
+    def test_swarm(self, profiler):
+        optimiser = ps.Swarm(bounds={'x0': [-1.0, 1.0]}, n_swallows=10,
+                             n_iterations=4)
+        optimiser.profiler = profiler
+        optimiser.optimise(sphere)
+
+        summary = profiler.summary()
+
+        assert summary['step']['count'] == 5
+        assert summary['objective']['count'] == 50
+        assert {'constraints', 'velocity', 'history'} <= summary.keys()
+
+    def test_swarm_restart(self, profiler):
+        optimiser = ps.Swarm(bounds={'x0': [-1.0, 1.0]}, n_swallows=10,
+                             n_iterations=4)
+        optimiser.rh = lambda swarm: 10 if swarm.iteration % 2 else None
+        optimiser.profiler = profiler
+        optimiser.optimise(sphere)
+
+        summary = profiler.summary()
+
+        assert optimiser.n_restarts == 2
+        assert summary['restart']['count'] == 2
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import pyswallow as ps
+from pyswallow.handlers.archive import Archive
+from pyswallow.utils.quality import KDTree, QualityIndicator
+
+
+def brute_force(x, points, plus=False):
+    diff = points[np.newaxis, :, :] - x[:, np.newaxis, :]
+    if plus:
+        diff = np.maximum(diff, 0.0)
+    return np.sqrt(np.square(diff).sum(axis=2))
+
+
+class TestKDTree:
+
+    @pytest.fixture
+    def points(self):
+        return np.random.default_rng(0).uniform(size=(500, 3))
+
+    @pytest.fixture
+    def queries(self):
+        return np.random.default_rng(1).uniform(-0.5, 1.5, size=(100, 3))
+
+    @pytest.mark.parametrize('leaf_size', [1, 8, 1000])
+    def test_query(self, points, queries, leaf_size):
+        distance, idx = KDTree(points, leaf_size).query(queries)
+        expected = brute_force(queries, points)
+
+        assert np.allclose(distance, expected.min(axis=1))
+        assert np.array_equal(idx, expected.argmin(axis=1))
+
+    def test_query_plus(self, points, queries):
+        distance, _ = KDTree(points).query(queries, plus=True)
+        assert np.allclose(distance, brute_force(queries, points, True).min(axis=1))
+
+    def test_nearest_neighbour_distances(self, points):
+        expected = brute_force(points, points)
+        np.fill_diagonal(expected, np.inf)
+
+        distances = KDTree(points, 8).nearest_neighbour_distances()
+        assert np.allclose(distances, expected.min(axis=1))
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            KDTree(np.empty((0, 2)))
+
+
+class TestQualityIndicator:
+
+    @pytest.fixture
+    def reference(self):
+        f1 = np.linspace(0.0, 1.0, 101)
+        return np.stack([f1, 1.0 - f1], axis=1)
+
+    @pytest.fixture
+    def indicator(self, reference):
+        return QualityIndicator(reference)
+
+    def test_on_front(self, indicator, reference):
+        assert indicator.gd(reference[::10]) == pytest.approx(0.0)
+        assert indicator.igd(reference) == pytest.approx(0.0)
+        assert indicator.spread(reference) == pytest.approx(0.0, abs=1e-9)
+
+    def test_shifted_front(self, indicator, reference):
+        front = reference + 0.1
+        assert indicator.gd(front) == pytest.approx(0.2 / np.sqrt(2.0), rel=1e-6)
+        assert indicator.igd(front) > indicator.igd(reference)
+        assert indicator.igd_plus(front) == pytest.approx(np.sqrt(0.02), rel=1e-6)
+
+    def test_igd_plus_ignores_better(self, indicator, reference):
+        # a front dominating the reference incurs no IGD+ penalty
+        assert indicator.igd_plus(reference - 0.1) == pytest.approx(0.0)
+        assert indicator.igd(reference - 0.1) > 0.0
+
+    def test_spread(self, indicator, reference):
+        clustered = reference[40:60]
+        assert indicator.spread(clustered) > indicator.spread(reference[::10])
+
+    def test_evaluate(self, indicator, reference):
+        front = reference[::7] + 0.05
+        values = indicator.evaluate(front)
+
+        assert values == pytest.approx({
+            'gd': indicator.gd(front),
+            'igd': indicator.igd(front),
+            'igd_plus': indicator.igd_plus(front),
+            'spread': indicator.spread(front)
+        })
+
+    def test_empty(self, indicator):
+        values = indicator.evaluate([])
+        assert values['igd'] == float('inf')
+        assert np.isnan(values['spread'])
+
+    def test_archive(self, indicator):
+        archive = Archive(2)
+        for fitness in ([0.0, 1.0], [1.0, 0.0]):
+            swallow = ps.MOSwallow({'x0': [0.0, 1.0]}, 2)
+            swallow.fitness = fitness
+            archive.add_swallow(swallow)
+
+        assert indicator.gd(archive) == pytest.approx(0.0)
+        assert indicator.gd(archive.population) == pytest.approx(0.0)
@@ -1,14 +1,20 @@
 import time
 
+import numpy as np
 import pytest
 
 import pyswallow as ps
+from pyswallow.constraints.base_constraints import PositionConstraint
 from pyswallow.utils.termination_manager import (
     IterationTerminationManager,
     TimeTerminationManager,
     EvaluationTerminationManager,
-    ErrorTerminationManager
+    ErrorTerminationManager,
+    IGDTerminationManager,
+    StagnationTerminationManager,
+    CompositeTerminationManager
 )
+from pyswallow.utils.quality import QualityIndicator
 
 
 @pytest.fixture
@@ -42,15 +48,60 @@ class TestTimeTerminationManager:
 
         assert ret_bool
 
+    def test_state_dict(self):
+        tm = TimeTerminationManager(t_budget=60)
+        assert tm.state_dict() == {}
+
+        tm.t_start = time.time() - 30.0
+
+        resumed = TimeTerminationManager(t_budget=60)
+        resumed.load_state_dict(tm.state_dict())
+
+        assert time.time() - resumed.t_start == pytest.approx(30.0, abs=1.0)
+
 
 class TestEvaluationTerminationManager:
 
     def test_termination_check(self, optimiser):
-        optimiser.iteration = 11
         tm = EvaluationTerminationManager(optimiser, n_evaluations=100)
-        ret_bool = tm.termination_check()
 
-        assert ret_bool
+        optimiser.n_evaluations = 99
+        assert not tm.termination_check()
+
+        optimiser.n_evaluations = 100
+        assert tm.termination_check()
+
+    def test_swarm(self):
+        bounds = {'x0': [-1.0, 1.0], 'x1': [-1.0, 1.0]}
+        optimiser = ps.Swarm(bounds, n_swallows=10, n_iterations=10_000)
+        optimiser.termination_manager = EvaluationTerminationManager(
+            optimiser, n_evaluations=100
+        )
+        optimiser.optimise(lambda x: float(np.sum(np.square(x))))
+
+        assert optimiser.n_evaluations == 100
+        assert optimiser.iteration == 10
+
+    def test_screened(self):
+        class Positive(PositionConstraint):
+
+            def constrain(self, swallow):
+                return swallow['x0'] > 0.0
+
+        np.random.seed(0)
+        bounds = {'x0': [-1.0, 1.0], 'x1': [-1.0, 1.0]}
+        optimiser = ps.Swarm(bounds, n_swallows=10, n_iterations=10_000)
+        optimiser.screen_constraints = True
+        optimiser.constraint_manager.register_constraint(Positive())
+        optimiser.termination_manager = EvaluationTerminationManager(
+            optimiser, n_evaluations=100
+        )
+        optimiser.optimise(lambda x: float(np.sum(np.square(x))))
+
+        # screened swallows do not consume the budget
+        assert 100 <= optimiser.n_evaluations < 110
+        assert optimiser.n_screened > 0
+        assert optimiser.iteration > 10
 
 
 class TestErrorTerminationManager:
@@ -69,3 +120,179 @@ class TestErrorTerminationManager:
         ret_bool = tm.termination_check()
 
         assert ret_bool
+
+
+class TestStagnationTerminationManager:
+
+    @pytest.fixture
+    def best(self, optimiser):
+        best = ps.Swallow({'x0': [0.0, 10.0], 'x1': [0.0, 10.0]})
+        optimiser.gbest_swallow = best
+        return best
+
+    def run(self, tm, optimiser, best, values):
+        checks = []
+        for iteration, value in enumerate(values):
+            optimiser.iteration = iteration
+            best.fitness = value
+            checks.append(tm.termination_check())
+        return checks
+
+    def test_not_evaluated(self, optimiser):
+        tm = StagnationTerminationManager(optimiser, window=2, tolerance=0.1)
+        assert not tm.termination_check()
+
+    def test_absolute(self, optimiser, best):
+        tm = StagnationTerminationManager(optimiser, window=2, tolerance=0.1)
+        checks = self.run(tm, optimiser, best, [10.0, 5.0, 1.0, 0.95, 0.9])
+
+        assert checks == [False, False, False, False, True]
+        assert len(tm.fitness) == 3
+
+    def test_relative(self, optimiser, best):
+        tm = StagnationTerminationManager(optimiser, window=1, tolerance=0.01,
+                                          relative=True)
+        checks = self.run(tm, optimiser, best, [1000.0, 995.0, 1.0, 0.999])
+
+        assert checks == [False, True, False, True]
+
+    def test_state_dict(self, optimiser, best):
+        values = [10.0, 5.0, 1.0, 0.95, 0.9]
+
+        tm = StagnationTerminationManager(optimiser, window=2, tolerance=0.1)
+        self.run(tm, optimiser, best, values[:4])
+
+        resumed = StagnationTerminationManager(optimiser, window=2, tolerance=0.1)
+        resumed.load_state_dict(tm.state_dict())
+
+        assert list(resumed.fitness) == list(tm.fitness)
+        assert resumed.last_iteration == tm.last_iteration
+
+        optimiser.iteration = 4
+        best.fitness = values[4]
+        assert resumed.termination_check()
+
+    def test_state_dict_empty(self, optimiser):
+        tm = StagnationTerminationManager(optimiser, window=2, tolerance=0.1)
+
+        resumed = StagnationTerminationManager(optimiser, window=2, tolerance=0.1)
+        resumed.fitness.append(1.0)
+        resumed.last_iteration = 3
+        resumed.load_state_dict(tm.state_dict())
+
+        assert len(resumed.fitness) == 0
+        assert resumed.last_iteration is None
+
+    def test_single_sample_per_iteration(self, optimiser, best):
+        tm = StagnationTerminationManager(optimiser, window=2, tolerance=0.0)
+        best.fitness = 1.0
+
+        for _ in range(5):
+            assert not tm.termination_check()
+
+    def test_optimise(self):
+        bounds = {'x0': [-1.0, 1.0], 'x1': [-1.0, 1.0]}
+        optimiser = ps.Swarm(bounds, n_swallows=10, n_iterations=10_000)
+        optimiser.termination_manager = StagnationTerminationManager(
+            optimiser, window=20, tolerance=1e-12
+        )
+        optimiser.optimise(lambda x: float(np.sum(np.square(x))))
+
+        assert optimiser.iteration < 10_000
+
+
+class TestIGDTerminationManager:
+
+    @pytest.fixture
+    def mo_optimiser(self):
+        bounds = {'x0': [0.0, 1.0]}
+        optimiser = ps.MOSwarm(n_swallows=10, n_iterations=100, bounds=bounds)
+        optimiser.n_objs = 2
+        optimiser.reset_environment()
+
+        return optimiser
+
+    @pytest.fixture
+    def indicator(self):
+        f1 = np.linspace(0.0, 1.0, 11)
+        return QualityIndicator(np.stack([f1, 1.0 - f1], axis=1))
+
+    def test_empty_archive(self, mo_optimiser, indicator):
+        tm = IGDTerminationManager(mo_optimiser, indicator, target=1.0)
+        assert not tm.termination_check()
+
+    @pytest.mark.parametrize('plus', [False, True])
+    def test_termination_check(self, mo_optimiser, indicator, plus):
+        for f1 in np.linspace(0.0, 1.0, 11):
+            swallow = ps.MOSwallow({'x0': [0.0, 1.0]}, 2)
+            swallow.fitness = [f1 + 0.1, 1.0 - f1 + 0.1]
+            mo_optimiser.archive.add_swallow(swallow)
+
+        assert IGDTerminationManager(mo_optimiser, indicator, 0.2, plus).termination_check()
+        assert not IGDTerminationManager(mo_optimiser, indicator, 0.1, plus).termination_check()
+
+
+class TestCompositeTerminationManager:
+
+    class Fixed:
+
+        def __init__(self, value):
+            self.value = value
+            self.n_checks = 0
+
+        def termination_check(self):
+            self.n_checks += 1
+            return self.value
+
+    @pytest.mark.parametrize('mode, values, expected', [
+        ('any', [False, False], False),
+        ('any', [True, False], True),
+        ('all', [True, False], False),
+        ('all', [True, True], True),
+    ])
+    def test_termination_check(self, mode, values, expected):
+        tm = CompositeTerminationManager([self.Fixed(v) for v in values], mode)
+        assert tm.termination_check() == expected
+
+    def test_checks_every_manager(self):
+        managers = [self.Fixed(True), self.Fixed(False)]
+        CompositeTerminationManager(managers, 'any').termination_check()
+
+        assert [m.n_checks for m in managers] == [1, 1]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            CompositeTerminationManager([self.Fixed(True)], 'either')
+        with pytest.raises(ValueError):
+            CompositeTerminationManager([])
+
+    def test_budget(self, optimiser):
+        optimiser.termination_manager = CompositeTerminationManager([
+            EvaluationTerminationManager(optimiser, n_evaluations=50),
+            TimeTerminationManager(t_budget=3600),
+            StagnationTerminationManager(optimiser, window=100, tolerance=0.0)
+        ])
+        optimiser.optimise(lambda x: float(np.sum(np.square(x))))
+
+        assert optimiser.n_evaluations == 50
+
+    def test_state_dict(self, optimiser):
+        managers = [
+            StagnationTerminationManager(optimiser, window=2, tolerance=0.0),
+            StagnationTerminationManager(optimiser, window=3, tolerance=0.0)
+        ]
+        managers[0].fitness.extend([2.0, 1.0])
+        managers[1].fitness.extend([4.0])
+
+        state = CompositeTerminationManager(managers).state_dict()
+        assert sorted(state) == ['tm_0_fitness', 'tm_0_last_iteration',
+                                 'tm_1_fitness', 'tm_1_last_iteration']
+
+        resumed = [
+            StagnationTerminationManager(optimiser, window=2, tolerance=0.0),
+            StagnationTerminationManager(optimiser, window=3, tolerance=0.0)
+        ]
+        CompositeTerminationManager(resumed).load_state_dict(state)
+
+        assert list(resumed[0].fitness) == [2.0, 1.0]
+        assert list(resumed[1].fitness) == [4.0]